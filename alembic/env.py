@@ -1,22 +1,20 @@
 # Imports do sistema
 from logging.config import fileConfig
-from os import path
 
 # Imports de terceiros
 from alembic import context
-from dotenv import load_dotenv
 from sqlalchemy import engine_from_config, pool
 
 # Imports locais
 from core.config import settings
 from core.database import Base
-from src.auth.models import UserModel
+from src.auth.models import RevokedTokenModel, UserModel
 from src.clients.models import ClientModel
+from src.idempotency.models import IdempotencyKeyModel
+from src.jobs.models import JobModel
 from src.orders.models import OrderItemModel, OrderModel
 from src.products.models import ProductModel
 
-load_dotenv(path.join(path.dirname(__file__), '../env/.env'))
-
 config = context.config
 
 if config.config_file_name is not None:
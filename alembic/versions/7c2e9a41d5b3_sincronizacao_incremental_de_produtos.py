@@ -0,0 +1,99 @@
+"""Adiciona updated_at e marcadores de exclusão a produtos e imagens
+
+Revision ID: 7c2e9a41d5b3
+Revises: f19c48ca8c13
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9a41d5b3'
+down_revision: Union[str, None] = 'f19c48ca8c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabelas da sincronização incremental e o índice de cada uma
+TABLES = (
+    ("products", "ix_products_updated_at_id"),
+    ("product_images", "ix_product_images_updated_at_id"),
+)
+
+
+def _columns(table: str) -> set:
+    # Em um banco novo as tabelas ainda não existem: elas são criadas pela
+    # migração gerada com --autogenerate, já no formato atual
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return set()
+    return {column["name"] for column in inspector.get_columns(table)}
+
+
+def _barcode_constraint():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("products"):
+        return None
+    for constraint in inspector.get_unique_constraints("products"):
+        if constraint["column_names"] == ["barcode"]:
+            return constraint["name"]
+    return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, index in TABLES:
+        # Bancos criados a partir dos modelos atuais já possuem as colunas
+        columns = _columns(table)
+        if not columns or "updated_at" in columns:
+            continue
+
+        op.add_column(
+            table,
+            sa.Column(
+                "updated_at", sa.DateTime(), nullable=False,
+                server_default=sa.func.now()
+            )
+        )
+        op.alter_column(table, "updated_at", server_default=None)
+        op.add_column(
+            table, sa.Column("deleted_at", sa.DateTime(), nullable=True)
+        )
+        op.create_index(index, table, ["updated_at", "id"])
+
+    # O código de barras passa a ser único apenas entre os não excluídos
+    constraint = _barcode_constraint()
+    if constraint:
+        op.drop_constraint(constraint, "products", type_="unique")
+        op.create_index(
+            "ix_products_barcode_active", "products", ["barcode"],
+            unique=True,
+            postgresql_where=sa.text("deleted_at IS NULL")
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if "deleted_at" not in _columns("products"):
+        return
+
+    # Os marcadores de exclusão voltam a ser exclusões definitivas
+    op.execute(
+        "DELETE FROM product_images WHERE deleted_at IS NOT NULL "
+        "OR product_id IN "
+        "(SELECT id FROM products WHERE deleted_at IS NOT NULL)"
+    )
+    op.execute("DELETE FROM products WHERE deleted_at IS NOT NULL")
+
+    op.drop_index("ix_products_barcode_active", table_name="products")
+    op.create_unique_constraint(
+        "products_barcode_key", "products", ["barcode"]
+    )
+
+    for table, index in TABLES:
+        op.drop_index(index, table_name=table)
+        op.drop_column(table, "deleted_at")
+        op.drop_column(table, "updated_at")
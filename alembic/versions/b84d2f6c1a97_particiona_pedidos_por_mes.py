@@ -0,0 +1,226 @@
+"""Particiona pedidos e itens por mês de created_at
+
+Revision ID: b84d2f6c1a97
+Revises: 7c2e9a41d5b3
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b84d2f6c1a97'
+down_revision: Union[str, None] = '7c2e9a41d5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabelas convertidas, na ordem de criação (os itens referenciam os pedidos)
+TABLES = ("orders", "order_items")
+
+
+def _partitioned(table: str):
+    # None se a tabela não existe (banco novo, criado depois pela migração
+    # gerada com --autogenerate)
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = relation) "
+            "FROM (SELECT to_regclass(:table) AS relation) AS target "
+            "WHERE relation IS NOT NULL"
+        ),
+        {"table": table}
+    ).scalar()
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partitions(start: date, end: date):
+    # Partições mensais de start até end (inclusive) e a DEFAULT; as
+    # seguintes são criadas pela tarefa "maintain_order_partitions"
+    for table in TABLES:
+        op.execute(
+            f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"
+        )
+        month = start
+        while month <= end:
+            following = _add_months(month, 1)
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month}') TO ('{following}')"
+            )
+            month = following
+
+
+def _rename(table: str, new_name: str):
+    # Renomeia a tabela e os seus índices (os nomes de índices e chaves
+    # primárias são únicos no schema e seriam recriados pela nova tabela)
+    indexes = op.get_bind().execute(
+        sa.text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = :table"
+        ),
+        {"table": table}
+    ).scalars().all()
+
+    op.rename_table(table, new_name)
+    for index in indexes:
+        op.execute(
+            f'ALTER INDEX "{index}" '
+            f'RENAME TO "{index.replace(table, new_name, 1)}"'
+        )
+
+
+def _sequence(table: str) -> str:
+    return op.get_bind().execute(
+        sa.text("SELECT pg_get_serial_sequence(:table, 'id')"),
+        {"table": table}
+    ).scalar()
+
+
+def _id_column(sequence: str) -> sa.Column:
+    # A nova tabela continua a numeração da sequência existente
+    return sa.Column(
+        "id", sa.Integer(), nullable=False,
+        server_default=sa.text(f"nextval('{sequence}'::regclass)")
+    )
+
+
+def _create_orders(sequence: str, partitioned: bool):
+    options = {"postgresql_partition_by": "RANGE (created_at)"} \
+        if partitioned else {}
+    primary_key = ("id", "created_at") if partitioned else ("id",)
+
+    op.create_table(
+        "orders",
+        _id_column(sequence),
+        sa.Column("client_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["client_id"], ["clients.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint(*primary_key),
+        **options
+    )
+    op.create_index("ix_orders_id", "orders", ["id"])
+
+
+def _create_order_items(sequence: str, partitioned: bool):
+    if partitioned:
+        columns = (
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["order_id", "created_at"],
+                ["orders.id", "orders.created_at"],
+                ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id", "created_at"),
+        )
+        options = {"postgresql_partition_by": "RANGE (created_at)"}
+    else:
+        columns = (
+            sa.ForeignKeyConstraint(
+                ["order_id"], ["orders.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        options = {}
+
+    op.create_table(
+        "order_items",
+        _id_column(sequence),
+        sa.Column("order_id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("unit_price_cents", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["product_id"], ["products.id"], ondelete="CASCADE"
+        ),
+        *columns,
+        **options
+    )
+    op.create_index("ix_order_items_id", "order_items", ["id"])
+
+
+def _convert(suffix: str, partitioned: bool, copy_items: str):
+    sequences = {table: _sequence(table) for table in TABLES}
+
+    for table in reversed(TABLES):
+        _rename(table, f"{table}_{suffix}")
+
+    _create_orders(sequences["orders"], partitioned)
+    _create_order_items(sequences["order_items"], partitioned)
+
+    if partitioned:
+        # As partições mensais precisam existir antes da cópia; caso
+        # contrário, as linhas iriam para a partição DEFAULT e impediriam
+        # a criação dos meses correspondentes
+        first = op.get_bind().execute(
+            sa.text(f"SELECT min(created_at) FROM orders_{suffix}")
+        ).scalar()
+        current = date.today().replace(day=1)
+        start = first.date().replace(day=1) if first else current
+        _create_partitions(start, _add_months(current, 1))
+
+    op.execute(
+        f"INSERT INTO orders (id, client_id, status, created_at) "
+        f"SELECT id, client_id, status, created_at FROM orders_{suffix}"
+    )
+    op.execute(copy_items)
+
+    # As sequências passam a pertencer às novas tabelas, para não serem
+    # removidas junto com as antigas
+    for table in TABLES:
+        op.execute(f"ALTER SEQUENCE {sequences[table]} OWNED BY {table}.id")
+
+    for table in reversed(TABLES):
+        op.drop_table(f"{table}_{suffix}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tabelas particionadas existem apenas no PostgreSQL; bancos criados a
+    # partir dos modelos atuais já estão particionados
+    if op.get_bind().dialect.name != "postgresql" \
+            or _partitioned("orders") in (None, True):
+        return
+
+    # Os itens recebem o created_at do pedido, para ficarem na partição
+    # do mesmo mês
+    _convert(
+        "unpartitioned",
+        True,
+        "INSERT INTO order_items "
+        "(id, order_id, product_id, quantity, unit_price_cents, "
+        "created_at) "
+        "SELECT item.id, item.order_id, item.product_id, item.quantity, "
+        "item.unit_price_cents, orders_unpartitioned.created_at "
+        "FROM order_items_unpartitioned item "
+        "JOIN orders_unpartitioned "
+        "ON orders_unpartitioned.id = item.order_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql" \
+            or not _partitioned("orders"):
+        return
+
+    # Apenas as partições anexadas voltam para as tabelas comuns; as
+    # partições arquivadas (desanexadas) permanecem como estão
+    _convert(
+        "partitioned",
+        False,
+        "INSERT INTO order_items "
+        "(id, order_id, product_id, quantity, unit_price_cents) "
+        "SELECT id, order_id, product_id, quantity, unit_price_cents "
+        "FROM order_items_partitioned"
+    )
@@ -0,0 +1,61 @@
+"""Armazena preços em centavos inteiros
+
+Revision ID: f19c48ca8c13
+Revises:
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f19c48ca8c13'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabela, coluna em reais (float) e coluna em centavos (inteiro)
+PRICE_COLUMNS = (
+    ("products", "price", "price_cents"),
+    ("order_items", "unit_price", "unit_price_cents"),
+)
+
+
+def _columns(table: str) -> set:
+    # Em um banco novo as tabelas ainda não existem: elas são criadas pela
+    # migração gerada com --autogenerate, já no formato atual
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return set()
+    return {column["name"] for column in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, old, new in PRICE_COLUMNS:
+        # Bancos criados a partir dos modelos atuais já estão convertidos
+        if old not in _columns(table):
+            continue
+
+        op.add_column(table, sa.Column(new, sa.BigInteger(), nullable=True))
+        op.execute(
+            f"UPDATE {table} "
+            f"SET {new} = round(CAST({old} AS numeric) * 100)"
+        )
+        op.alter_column(table, new, nullable=False)
+        op.drop_column(table, old)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, old, new in PRICE_COLUMNS:
+        if new not in _columns(table):
+            continue
+
+        op.add_column(table, sa.Column(old, sa.Float(), nullable=True))
+        op.execute(f"UPDATE {table} SET {old} = {new} / 100.0")
+        op.alter_column(table, old, nullable=False)
+        op.drop_column(table, new)
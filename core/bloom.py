@@ -0,0 +1,51 @@
+# Imports do sistema
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom: conjunto probabilístico com consulta em tempo constante.
+
+    Um resultado negativo é definitivo (o item nunca foi adicionado); um
+    positivo pode ser falso com probabilidade aproximada de error_rate
+    enquanto o filtro tiver até capacity itens. Itens não podem ser
+    removidos; para descartá-los, um novo filtro deve ser construído.
+    """
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(
+            int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8
+        )
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # Double hashing (Kirsch-Mitzenmacher): k posições a partir de um
+        # único digest de 128 bits
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def add(self, item: str):
+        """
+        Adiciona um item ao filtro.
+
+        Args:
+            item (str): Item a ser adicionado.
+        """
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        return self.count
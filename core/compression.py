@@ -0,0 +1,336 @@
+# Imports do sistema
+import gzip
+import mimetypes
+import os
+import stat
+import zlib
+from pathlib import Path
+
+# Imports de terceiros
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders
+
+# Imports locais
+from core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependência opcional
+    brotli = None
+
+# Tipos de conteúdo que se beneficiam de compressão
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Extensões de arquivos estáticos pré-comprimidos no upload
+COMPRESSIBLE_SUFFIXES = {
+    ".css", ".csv", ".html", ".js", ".json", ".svg", ".txt", ".xml",
+}
+
+# Extensão do arquivo pré-comprimido de cada codificação
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def _supported_encodings() -> tuple:
+    return ("br", "gzip") if brotli else ("gzip",)
+
+
+def accepted_encodings(accept_encoding: str) -> list:
+    """
+    Lista as codificações suportadas aceitas pelo cliente.
+
+    Args:
+        accept_encoding (str): Valor do cabeçalho Accept-Encoding.
+    Returns:
+        list[str]: Codificações em ordem de preferência.
+    """
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+
+    def quality(encoding: str) -> float:
+        return accepted.get(encoding, accepted.get("*", 0.0))
+
+    # A ordenação é estável: em caso de empate, br tem preferência sobre gzip
+    return sorted(
+        (
+            encoding for encoding in _supported_encodings()
+            if quality(encoding) > 0
+        ),
+        key=quality,
+        reverse=True
+    )
+
+
+def negotiate_encoding(accept_encoding: str):
+    """
+    Escolhe a codificação de resposta a partir do cabeçalho Accept-Encoding.
+
+    Args:
+        accept_encoding (str): Valor do cabeçalho Accept-Encoding.
+    Returns:
+        Optional[str]: "br", "gzip" ou None se nenhuma for aceita.
+    """
+    encodings = accepted_encodings(accept_encoding)
+    return encodings[0] if encodings else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Comprime o corpo inteiro de uma resposta.
+
+    Args:
+        body (bytes): Conteúdo a ser comprimido.
+        encoding (str): "br" ou "gzip".
+    Returns:
+        bytes: Conteúdo comprimido.
+    """
+    if encoding == "br":
+        return brotli.compress(
+            body, quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+    return gzip.compress(
+        body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0
+    )
+
+
+class _StreamCompressor:
+    """
+    Compressor incremental para respostas enviadas em partes.
+    """
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self.compressor = brotli.Compressor(
+                quality=settings.COMPRESSION_BROTLI_QUALITY
+            )
+        else:
+            self.compressor = zlib.compressobj(
+                settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + 15
+            )
+        self.brotli = encoding == "br"
+
+    def chunk(self, data: bytes) -> bytes:
+        # Cada parte é descarregada para não atrasar o envio ao cliente
+        if self.brotli:
+            return self.compressor.process(data) + self.compressor.flush()
+        return self.compressor.compress(data) + \
+            self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        if self.brotli:
+            return self.compressor.process(data) + self.compressor.finish()
+        return self.compressor.compress(data) + self.compressor.flush()
+
+
+def _is_compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "")
+    return (
+        "content-encoding" not in headers
+        and content_type.startswith(COMPRESSIBLE_TYPES)
+    )
+
+
+def _mark_compressed(headers: MutableHeaders, encoding: str):
+    headers["Content-Encoding"] = encoding
+    headers.add_vary_header("Accept-Encoding")
+
+    # O ETag passa a ser fraco: os bytes enviados diferem dos da
+    # representação original, e validadores fortes exigem bytes idênticos
+    # (o If-None-Match continua funcionando, com comparação fraca)
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+    # Intervalos seriam calculados sobre o conteúdo original
+    if "accept-ranges" in headers:
+        del headers["Accept-Ranges"]
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI de compressão de respostas (brotli e gzip).
+
+    Respostas menores que COMPRESSION_MINIMUM_SIZE, com tipo de conteúdo
+    não compressível ou parciais (206, Content-Range) são enviadas sem
+    alteração. Corpos a partir de COMPRESSION_THREADPOOL_SIZE são
+    comprimidos em uma thread, sem bloquear o event loop. Respostas
+    enviadas em partes (streaming) são comprimidas de forma incremental.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        state = {"start": None, "compressor": None, "passthrough": False}
+
+        async def send_compressed(message):
+            if message["type"] == "http.response.start":
+                state["start"] = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            start = state["start"]
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if state["passthrough"]:
+                await send(message)
+                return
+
+            if state["compressor"] is not None:
+                compressor = state["compressor"]
+                data = compressor.chunk(body) if more_body \
+                    else compressor.finish(body)
+                await send({
+                    "type": "http.response.body",
+                    "body": data,
+                    "more_body": more_body,
+                })
+                return
+
+            # Primeira parte do corpo: decide se a resposta será comprimida
+            headers = MutableHeaders(raw=start["headers"])
+            skip = (
+                start["status"] in (204, 206, 304)
+                or "content-range" in headers
+                or not _is_compressible(headers)
+                or (not more_body
+                    and len(body) < settings.COMPRESSION_MINIMUM_SIZE)
+            )
+
+            if skip:
+                state["passthrough"] = True
+                await send(start)
+                await send(message)
+                return
+
+            _mark_compressed(headers, encoding)
+
+            if more_body:
+                del headers["Content-Length"]
+                state["compressor"] = _StreamCompressor(encoding)
+                await send(start)
+                await send({
+                    "type": "http.response.body",
+                    "body": state["compressor"].chunk(body),
+                    "more_body": True,
+                })
+                return
+
+            if len(body) >= settings.COMPRESSION_THREADPOOL_SIZE:
+                data = await anyio.to_thread.run_sync(
+                    compress, body, encoding
+                )
+            else:
+                data = compress(body, encoding)
+
+            headers["Content-Length"] = str(len(data))
+            await send(start)
+            await send({"type": "http.response.body", "body": data})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def precompress_file(path: Path):
+    """
+    Gera as versões pré-comprimidas (.br e .gz) de um arquivo estático.
+
+    Apenas arquivos de tipos compressíveis são processados; as versões são
+    mantidas somente quando menores que o original.
+
+    Args:
+        path (Path): Caminho do arquivo original.
+    """
+    path = Path(path)
+    if path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+        return
+
+    content = path.read_bytes()
+    for encoding in _supported_encodings():
+        sibling = path.with_name(path.name + PRECOMPRESSED_SUFFIXES[encoding])
+        data = compress(content, encoding)
+
+        if len(data) < len(content):
+            sibling.write_bytes(data)
+        elif sibling.exists():
+            sibling.unlink()
+
+
+def remove_file(path: Path):
+    """
+    Remove um arquivo estático e suas versões pré-comprimidas, se existirem.
+
+    Args:
+        path (Path): Caminho do arquivo original.
+    """
+    path = Path(path)
+    for suffix in ("", *PRECOMPRESSED_SUFFIXES.values()):
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            candidate.unlink()
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles que entrega as versões .br/.gz geradas no upload.
+
+    Quando o cliente aceita a codificação e o arquivo pré-comprimido existe,
+    ele é enviado diretamente, sem custo de CPU na requisição. Com
+    check_dir=False, a pasta pode ser criada depois da inicialização; até
+    lá, as requisições recebem 404.
+    """
+    async def check_config(self):
+        # Sem a pasta (ainda sem uploads), as requisições recebem 404
+        if self.directory is not None and not os.path.isdir(self.directory):
+            return
+        await super().check_config()
+
+    async def get_response(self, path: str, scope):
+        suffix = Path(path).suffix.lower()
+        if suffix not in COMPRESSIBLE_SUFFIXES:
+            return await super().get_response(path, scope)
+
+        encodings = accepted_encodings(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        for encoding in encodings:
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + PRECOMPRESSED_SUFFIXES[encoding]
+            )
+            if not stat_result or not stat.S_ISREG(stat_result.st_mode):
+                continue
+
+            response = self.file_response(full_path, stat_result, scope)
+            response.headers["Content-Type"] = \
+                mimetypes.guess_type(path)[0] or "text/plain"
+            response.headers["Content-Encoding"] = encoding
+            response.headers.add_vary_header("Accept-Encoding")
+            return response
+
+        return await super().get_response(path, scope)
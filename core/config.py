@@ -1,36 +1,161 @@
 # Imports do sistema
 import os
+from functools import lru_cache
+from typing import Optional
 
 # Imports de terceiros
-from dotenv import load_dotenv
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
-# Carregando as variáveis de ambiente do .env
-load_dotenv(os.path.join(os.path.dirname(__file__), '../env/.env'))
-
 
 class Settings(BaseSettings):
     """
     Configurações do projeto.
+
+    Os valores são lidos das variáveis de ambiente e do arquivo env/.env
+    (uma única leitura, feita pelo próprio pydantic-settings).
     """
     # Development
     DEBUG: bool = False
 
     # Database
-    POSTGRES_USER: str = os.getenv("POSTGRES_USER")
-    POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD")
-    POSTGRES_DB: str = os.getenv("POSTGRES_DB")
+    POSTGRES_USER: Optional[str] = None
+    POSTGRES_PASSWORD: Optional[str] = None
+    POSTGRES_DB: Optional[str] = None
+
+    DATABASE_HOST: Optional[str] = None
+    DATABASE_PORT: Optional[int] = None
+    # Montada a partir das variáveis acima quando não informada
+    DATABASE_URL: Optional[str] = None
+
+    # Pool de conexões
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 10.0  # segundos aguardando uma conexão
+    DATABASE_POOL_RECYCLE: int = 1800  # 30 minutos
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_CONNECT_TIMEOUT: int = 5  # segundos
+    DATABASE_STATEMENT_TIMEOUT: int = 0  # milissegundos (0 = sem limite)
+    # Limite total de conexões compartilhado entre os workers, incluindo a
+    # conexão de escuta de cada um e as threads da fila executadas na API
+    # (0 = usa DATABASE_POOL_SIZE e DATABASE_MAX_OVERFLOW por worker)
+    DATABASE_CONNECTION_BUDGET: int = 0
+    WEB_CONCURRENCY: int = 1
+    # Compatibilidade com PgBouncer em modo transaction pooling
+    DATABASE_PGBOUNCER: bool = False
+
+    # Réplicas de leitura (URLs separadas por vírgula)
+    DATABASE_REPLICA_URLS: str = ""
+    # Tempo (segundos) que uma réplica com falha fica fora do rodízio
+    DATABASE_REPLICA_RETRY_INTERVAL: float = 5.0
+    # Tempo (segundos) em que as leituras de um usuário vão para o primário
+    # após uma escrita (0 = desabilitado); o cliente recebe o instante da
+    # escrita no cookie last_write / cabeçalho X-Last-Write e deve reenviá-lo
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # Compressão de respostas
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes
+    # Corpos a partir deste tamanho são comprimidos fora do event loop
+    COMPRESSION_THREADPOOL_SIZE: int = 256 * 1024  # bytes
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Limites de requisições (formato do pacote limits, ex.: "10/minute")
+    RATE_LIMIT_ENABLED: bool = True
+    # "async+memory://" mantém o estado no worker; para compartilhar entre
+    # workers use, por exemplo, "async+redis://host:6379"
+    RATE_LIMIT_STORAGE_URI: str = "async+memory://"
+    # Considera o primeiro IP de X-Forwarded-For (atrás de proxy confiável)
+    RATE_LIMIT_TRUST_FORWARDED: bool = False
+    RATE_LIMIT_PER_IP: str = "300/minute"
+    RATE_LIMIT_PER_USER: str = "600/minute"
+    RATE_LIMIT_LOGIN_PER_IP: str = "10/minute"
+    # Tentativas por conta a partir de um mesmo IP: um atacante não bloqueia
+    # o login do titular da conta feito de outro endereço
+    RATE_LIMIT_LOGIN_PER_ACCOUNT: str = "5/minute"
+    RATE_LIMIT_REGISTER_PER_IP: str = "5/hour"
+
+    # Chaves de idempotência (cabeçalho Idempotency-Key)
+    IDEMPOTENCY_TTL_SECONDS: int = 60 * 60 * 24  # 24 horas
+    # Tempo após o qual uma requisição em andamento é considerada abandonada
+    IDEMPOTENCY_LOCK_TIMEOUT: int = 60  # segundos
+    # Intervalo da remoção das chaves expiradas
+    IDEMPOTENCY_PURGE_INTERVAL: int = 60 * 60  # 1 hora
+
+    # Fila de tarefas em segundo plano
+    # Executa os workers da fila dentro do processo da API
+    JOBS_RUN_IN_APP: bool = True
+    JOBS_WORKERS: int = 1
+    JOBS_POLL_INTERVAL: float = 1.0  # segundos
+    JOBS_BATCH_SIZE: int = 10
+    JOBS_MAX_ATTEMPTS: int = 5
+    JOBS_BACKOFF_BASE: float = 2.0  # segundos
+    JOBS_BACKOFF_MAX: float = 300.0  # segundos
+    # Tarefas em execução há mais tempo que isso voltam para a fila
+    JOBS_VISIBILITY_TIMEOUT: int = 300  # segundos
+
+    # Partições mensais de pedidos
+    # Meses futuros com partição criada antecipadamente
+    ORDERS_PARTITIONS_AHEAD: int = 3
+    # Meses mantidos na tabela; partições mais antigas são desanexadas
+    # (0 desativa o arquivamento)
+    ORDERS_RETENTION_MONTHS: int = 24
+    # Tablespace para onde as partições arquivadas são movidas (opcional)
+    ORDERS_ARCHIVE_TABLESPACE: str = ""
+    ORDERS_PARTITION_MAINTENANCE_INTERVAL: int = 6 * 60 * 60  # 6 horas
+
+    # Aquecimento dos workers na inicialização (readiness)
+    WARMUP_ENABLED: bool = True
+    WARMUP_RETRY_INTERVAL: float = 5.0  # segundos
+
+    # Quantidade máxima de IDs nas buscas em lote (ex.: /products?ids=)
+    BATCH_MAX_IDS: int = 200
+
+    # Tokens revogados (logout): filtro de Bloom por worker
+    TOKEN_DENYLIST_CAPACITY: int = 100_000
+    TOKEN_DENYLIST_ERROR_RATE: float = 0.001
+    # Reconstrução do filtro e remoção dos tokens expirados da tabela
+    TOKEN_DENYLIST_REBUILD_INTERVAL: int = 60 * 60  # 1 hora
+    # Tempo em que um usuário autenticado é considerado existente sem nova
+    # consulta ao banco (rotas de alto volume, ex.: leitura no PDV)
+    AUTH_USER_CACHE_SECONDS: int = 60  # segundos (0 = desabilitado)
+
+    # Conexão de escuta (LISTEN/NOTIFY) de cada worker
+    NOTIFICATIONS_RETRY_INTERVAL: float = 5.0  # segundos
+
+    # Mapa em memória de código de barras -> produto (leitura no PDV)
+    BARCODE_CACHE_ENABLED: bool = True
 
-    DATABASE_HOST: str = os.getenv("DATABASE_HOST")
-    DATABASE_PORT: int = os.getenv("DATABASE_PORT")
-    DATABASE_URL: str = os.getenv("DATABASE_URL",
-                                  f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@"
-                                  f"{DATABASE_HOST}:{DATABASE_PORT}/{POSTGRES_DB}"
-                                  )
+    # Cópia colunar (NumPy) do catálogo para a listagem de produtos
+    PRODUCTS_SNAPSHOT_ENABLED: bool = False
+
+    # Limites das faixas de preço das facetas da listagem (em reais)
+    PRODUCTS_PRICE_BUCKETS: str = "10,50,100,500"
+
+    # Sincronização incremental do catálogo (/products/changes)
+    PRODUCTS_CHANGES_MAX_LIMIT: int = 1000
+    # Fora do PostgreSQL, alterações mais recentes que este intervalo
+    # aguardam a próxima sincronização (transações ainda não confirmadas);
+    # no PostgreSQL, o limite é o início da transação aberta mais antiga
+    PRODUCTS_CHANGES_SETTLE_SECONDS: float = 5.0
+    # Marcadores de produtos excluídos são removidos após este prazo;
+    # cursores mais antigos exigem uma sincronização completa
+    PRODUCTS_TOMBSTONE_RETENTION_DAYS: int = 30
+    PRODUCTS_TOMBSTONE_PURGE_INTERVAL: int = 24 * 60 * 60  # 1 dia
+
+    # Eventos de pedidos em SSE (/orders/events), por worker
+    ORDER_EVENTS_MAX_SUBSCRIBERS: int = 10000
+    ORDER_EVENTS_QUEUE_SIZE: int = 100  # eventos pendentes por conexão
+    ORDER_EVENTS_HEARTBEAT_INTERVAL: float = 15.0  # segundos
+
+    # Listagens com limit acima do limiar são enviadas em streaming, lidas
+    # do banco em lotes (cursor do lado do servidor no PostgreSQL)
+    STREAMING_LIMIT_THRESHOLD: int = 1000
+    STREAMING_BATCH_SIZE: int = 1000
 
     # JWT
-    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY")
-    JWT_REFRESH_SECRET_KEY: str = os.getenv("JWT_REFRESH_SECRET_KEY")
+    JWT_SECRET_KEY: Optional[str] = None
+    JWT_REFRESH_SECRET_KEY: Optional[str] = None
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30  # 30 minutos
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 dias
@@ -38,6 +163,38 @@ class Settings(BaseSettings):
     class Config:
         env_file = os.path.join(os.path.dirname(__file__), '../env/.env')
         env_file_encoding = 'utf-8'
+        extra = 'ignore'
+
+    @model_validator(mode="after")
+    def _build_database_url(self):
+        if not self.DATABASE_URL:
+            self.DATABASE_URL = (
+                f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
+                f"{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.POSTGRES_DB}"
+            )
+        return self
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Obtém as configurações, carregadas no primeiro acesso.
+
+    Returns:
+        Settings: Configurações do projeto.
+    """
+    return Settings()
+
+
+class _LazySettings:
+    """
+    Acesso às configurações adiado até o primeiro atributo lido.
+
+    Importar este módulo não lê o ambiente nem o arquivo .env; os módulos
+    continuam usando "settings.NOME" normalmente.
+    """
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
 
 
-settings = Settings()
+settings = _LazySettings()
@@ -1,24 +1,609 @@
+# Imports do sistema
+import itertools
+import math
+import os
+import threading
+import time
+
 # Imports de terceiros
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from fastapi import Request
+from sqlalchemy import any_, bindparam, create_engine, event
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 # Imports locais
 from core.config import settings
+from core.rate_limit import token_subject
+
+
+def _pool_options(url: str) -> dict:
+    """
+    Monta as opções do pool de conexões a partir das configurações.
+
+    Quando DATABASE_CONNECTION_BUDGET é definido, o orçamento total de
+    conexões é dividido igualmente entre os WEB_CONCURRENCY workers e o
+    overflow é desabilitado, garantindo que o Postgres nunca receba mais
+    conexões do que o previsto. Da parte de cada worker é descontada a
+    conexão de escuta (LISTEN/NOTIFY), que fica fora do pool do primário;
+    as threads da fila de tarefas (JOBS_RUN_IN_APP) usam o próprio pool e
+    já estão contidas nele.
+
+    Args:
+        url (str): URL de conexão com o banco de dados.
+    Returns:
+        dict: Argumentos de pool para o create_engine.
+    """
+    pool_size = settings.DATABASE_POOL_SIZE
+    max_overflow = settings.DATABASE_MAX_OVERFLOW
+
+    if settings.DATABASE_CONNECTION_BUDGET > 0:
+        workers = max(settings.WEB_CONCURRENCY, 1)
+        share = settings.DATABASE_CONNECTION_BUDGET // workers
+        minimum = 1
+
+        if url == settings.DATABASE_URL:
+            if _listens(url):
+                share -= 1
+            # As threads da fila não podem ocupar todas as conexões do
+            # worker
+            if settings.JOBS_RUN_IN_APP:
+                minimum += settings.JOBS_WORKERS
+        if share < minimum:
+            raise ValueError(
+                f"DATABASE_CONNECTION_BUDGET "
+                f"({settings.DATABASE_CONNECTION_BUDGET}) insuficiente para "
+                f"{workers} worker(s): cada um precisa de {minimum} "
+                f"conexão(ões) no pool, além da conexão de escuta"
+            )
+
+        pool_size = share
+        max_overflow = 0
+
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+
+def _listens(url: str) -> bool:
+    # Mesma condição de NotificationListener.enabled, sem criar o engine
+    return make_url(url).get_backend_name() == "postgresql" \
+        and not settings.DATABASE_PGBOUNCER
+
+
+def _connect_args(url: str) -> dict:
+    """
+    Monta os argumentos de conexão repassados ao driver do Postgres.
+
+    Em modo PgBouncer (transaction pooling) não são enviados parâmetros de
+    inicialização de sessão, pois o PgBouncer os rejeita e a sessão não é
+    preservada entre transações; pelo mesmo motivo, os prepared statements
+    do lado do servidor são desabilitados nos drivers que os utilizam.
+
+    Args:
+        url (str): URL de conexão com o banco de dados.
+    Returns:
+        dict: Argumentos de conexão para o create_engine.
+    """
+    driver = make_url(url).get_driver_name()
+    connect_args = {"connect_timeout": settings.DATABASE_CONNECT_TIMEOUT}
+
+    if settings.DATABASE_PGBOUNCER:
+        if driver == "psycopg":
+            connect_args["prepare_threshold"] = None
+    elif settings.DATABASE_STATEMENT_TIMEOUT:
+        connect_args["options"] = (
+            f"-c statement_timeout={settings.DATABASE_STATEMENT_TIMEOUT}"
+        )
+
+    return connect_args
+
+
+class PoolMetrics:
+    """
+    Contadores dos eventos do pool de conexões de um engine.
+    """
+    def __init__(self, engine):
+        self.engine = engine
+        self.lock = threading.Lock()
+        self.counters = {
+            "connects": 0,
+            "checkouts": 0,
+            "checkins": 0,
+            "invalidations": 0,
+            "timeouts": 0,
+        }
+
+        event.listen(engine, "connect", self._count("connects"))
+        event.listen(engine, "checkout", self._count("checkouts"))
+        event.listen(engine, "checkin", self._count("checkins"))
+        event.listen(engine, "invalidate", self._count("invalidations"))
+
+    def _count(self, name: str):
+        def listener(*args):
+            with self.lock:
+                self.counters[name] += 1
+
+        return listener
+
+    def record_timeout(self):
+        """
+        Registra uma requisição que esgotou o tempo de espera por conexão.
+        """
+        with self.lock:
+            self.counters["timeouts"] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Retorna o estado atual do pool e os contadores acumulados.
+
+        Returns:
+            dict: Métricas do pool de conexões.
+        """
+        pool = self.engine.pool
+        with self.lock:
+            counters = dict(self.counters)
+
+        return {
+            "pid": os.getpid(),
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "timeout": pool.timeout(),
+            **counters,
+        }
+
+
+def _create_engine(url: str):
+    """
+    Cria um engine com as opções de pool e conexão configuradas.
+
+    Args:
+        url (str): URL de conexão com o banco de dados.
+    Returns:
+        Engine: Engine do SQLAlchemy.
+    """
+    return create_engine(
+        url,
+        connect_args=_connect_args(url),
+        **_pool_options(url)
+    )
+
+
+class Replica:
+    """
+    Réplica de leitura com seu próprio engine e estado de saúde.
+    """
+    def __init__(self, url: str):
+        self.url = make_url(url)
+        self.engine = _create_engine(url)
+        self.session_factory = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine
+        )
+        self.down_until = 0.0
+        self.failures = 0
+
+    def is_available(self, now: float) -> bool:
+        return self.down_until <= now
+
+    def mark_down(self):
+        """
+        Retira a réplica do rodízio por DATABASE_REPLICA_RETRY_INTERVAL.
+        """
+        self.failures += 1
+        self.down_until = (
+            time.monotonic() + settings.DATABASE_REPLICA_RETRY_INTERVAL
+        )
+
+    def status(self) -> dict:
+        return {
+            "host": self.url.host,
+            "port": self.url.port,
+            "database": self.url.database,
+            "available": self.is_available(time.monotonic()),
+            "failures": self.failures,
+        }
+
+
+class ReplicaSet:
+    """
+    Conjunto de réplicas de leitura selecionadas em rodízio (round-robin).
+    """
+    def __init__(self, urls: str):
+        self.replicas = [
+            Replica(url.strip()) for url in urls.split(",") if url.strip()
+        ]
+        self._counter = itertools.count()
+
+    def candidates(self):
+        """
+        Retorna as réplicas disponíveis, começando pela próxima do rodízio.
+
+        Returns:
+            Iterator[Replica]: Réplicas disponíveis em ordem de tentativa.
+        """
+        total = len(self.replicas)
+        if not total:
+            return
+
+        now = time.monotonic()
+        start = next(self._counter)
+        for offset in range(total):
+            replica = self.replicas[(start + offset) % total]
+            if replica.is_available(now):
+                yield replica
+
+
+class RecentWrites:
+    """
+    Registro, em memória do worker, das escritas recentes de cada usuário.
+
+    Permite garantir read-your-writes: durante
+    DATABASE_READ_YOUR_WRITES_SECONDS após um commit, as leituras do mesmo
+    usuário (pelo ID do token, que não muda ao renovar o token) são
+    direcionadas ao primário, evitando o atraso de replicação. O registro
+    é local ao processo; entre workers, a garantia vem do marcador
+    LAST_WRITE_COOKIE/LAST_WRITE_HEADER enviado de volta pelo cliente
+    (ReadYourWritesMiddleware).
+    """
+    MAX_ENTRIES = 100_000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.expires = {}
+
+    def mark(self, key: str):
+        window = settings.DATABASE_READ_YOUR_WRITES_SECONDS
+        if not key or window <= 0:
+            return
+
+        now = time.monotonic()
+        with self.lock:
+            if len(self.expires) >= self.MAX_ENTRIES:
+                self.expires = {
+                    item: expires for item, expires in self.expires.items()
+                    if expires > now
+                }
+            self.expires[key] = now + window
+
+    def is_recent(self, key: str) -> bool:
+        if not key:
+            return False
+        return self.expires.get(key, 0.0) > time.monotonic()
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware ASGI que informa ao cliente o instante do último commit da
+    requisição.
+
+    A resposta recebe o cookie LAST_WRITE_COOKIE e o cabeçalho
+    LAST_WRITE_HEADER com o instante (epoch, em segundos); enquanto o
+    cliente os reenviar dentro de DATABASE_READ_YOUR_WRITES_SECONDS, as
+    leituras vão para o primário, qualquer que seja o worker que as
+    atenda.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" \
+                or settings.DATABASE_READ_YOUR_WRITES_SECONDS <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_marker(message):
+            last_write = scope.get("state", {}).get("last_write")
+            if message["type"] == "http.response.start" and last_write:
+                value = f"{last_write:.3f}".encode()
+                window = int(
+                    math.ceil(settings.DATABASE_READ_YOUR_WRITES_SECONDS)
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (LAST_WRITE_HEADER.encode(), value),
+                    (
+                        b"set-cookie",
+                        b"%s=%s; Max-Age=%d; Path=/; HttpOnly; SameSite=Lax"
+                        % (LAST_WRITE_COOKIE.encode(), value, window)
+                    ),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_marker)
+
+
+# Engine, métricas e réplicas são criados no primeiro uso, e não na
+# importação do módulo
+_resources = {}
+_resources_lock = threading.RLock()
+
+# Registro de escritas recentes (read-your-writes)
+recent_writes = RecentWrites()
+
+# Marcador do último commit do usuário, devolvido pelo cliente
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "x-last-write"
+
+
+def _resource(name: str, factory):
+    resource = _resources.get(name)
+    if resource is None:
+        with _resources_lock:
+            resource = _resources.get(name)
+            if resource is None:
+                resource = _resources[name] = factory()
+    return resource
+
+
+def get_engine():
+    """
+    Obtém o engine do banco de dados primário, criando-o no primeiro uso.
+
+    Returns:
+        Engine: Engine do SQLAlchemy.
+    """
+    return _resource(
+        "engine", lambda: _create_engine(settings.DATABASE_URL)
+    )
+
+
+def get_pool_metrics() -> PoolMetrics:
+    """
+    Obtém as métricas do pool de conexões do engine primário.
+
+    Returns:
+        PoolMetrics: Contadores do pool.
+    """
+    return _resource("pool_metrics", lambda: PoolMetrics(get_engine()))
+
+
+def get_replica_set() -> ReplicaSet:
+    """
+    Obtém o conjunto de réplicas de leitura configuradas.
+
+    Returns:
+        ReplicaSet: Réplicas de leitura (possivelmente vazio).
+    """
+    return _resource(
+        "replica_set",
+        lambda: ReplicaSet(settings.DATABASE_REPLICA_URLS)
+    )
+
+
+def dispose_engines(close: bool = True):
+    """
+    Descarta as conexões do pool do primário e das réplicas já criados.
+
+    Args:
+        close (bool): Se False, apenas abandona as conexões sem fechá-las
+        (usado no processo filho após um fork).
+    """
+    engine = _resources.get("engine")
+    if engine is not None:
+        engine.dispose(close=close)
+
+    replicas = _resources.get("replica_set")
+    for replica in replicas.replicas if replicas else ():
+        replica.engine.dispose(close=close)
+
+
+def _dispose_after_fork():
+    """
+    Descarta as conexões herdadas do processo pai após um fork.
+
+    Servidores pré-fork (gunicorn com preload) criam o engine antes de
+    gerar os workers; sem isso, pai e filhos compartilhariam os mesmos
+    sockets. O close=False evita encerrar as conexões que ainda pertencem
+    ao processo pai.
+    """
+    dispose_engines(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_after_fork)
+
+
+class _LazySessionMaker(sessionmaker):
+    """
+    Fábrica de sessões que se associa ao engine primário na primeira sessão.
+    """
+    def __call__(self, **local_kw) -> Session:
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+def __getattr__(name: str):
+    # Compatibilidade com "from core.database import engine"
+    if name == "engine":
+        return get_engine()
+    if name == "pool_metrics":
+        return get_pool_metrics()
+    if name == "replica_set":
+        return get_replica_set()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Criar o engine de conexão
-engine = create_engine(settings.DATABASE_URL)
 
 # Criar uma fábrica de sessões
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = _LazySessionMaker(autocommit=False, autoflush=False)
 
 # Base para os modelos
 Base = declarative_base()
 
 
+@event.listens_for(SessionLocal, "after_commit")
+def _mark_recent_write(session: Session):
+    """
+    Registra a escrita do usuário da requisição após cada commit no primário.
+    """
+    recent_writes.mark(session.info.get("user_key"))
+
+    request = session.info.get("request")
+    if request is not None:
+        request.state.last_write = time.time()
+
+
+def _user_key(request: Request):
+    if request is None:
+        return None
+    return token_subject(request.headers.get("authorization"))
+
+
+def _recent_write(request: Request) -> bool:
+    """
+    Verifica se o usuário da requisição escreveu no primário há menos de
+    DATABASE_READ_YOUR_WRITES_SECONDS, pelo registro do worker ou pelo
+    marcador enviado pelo cliente.
+
+    Args:
+        request (Request): Requisição atual.
+    Returns:
+        bool: True se as leituras devem ir para o primário.
+    """
+    window = settings.DATABASE_READ_YOUR_WRITES_SECONDS
+    if request is None or window <= 0:
+        return False
+
+    if recent_writes.is_recent(_user_key(request)):
+        return True
+
+    marker = request.headers.get(LAST_WRITE_HEADER) \
+        or request.cookies.get(LAST_WRITE_COOKIE)
+    try:
+        last_write = float(marker or 0)
+    except ValueError:
+        return False
+
+    # Marcadores no futuro são aceitos apenas dentro da janela (relógios
+    # de hosts diferentes)
+    now = time.time()
+    return now - window < last_write <= now + window
+
+
 # Função para obter uma sessão de banco de dados
-def get_db():
+def get_db(request: Request = None):
     db = SessionLocal()
+    db.info["user_key"] = _user_key(request)
+    db.info["request"] = request
     try:
         yield db
     finally:
         db.close()
+
+
+def open_read_session(request: Request = None) -> Session:
+    """
+    Abre uma sessão de leitura em uma réplica saudável.
+
+    A conexão é obtida antecipadamente para que uma réplica indisponível
+    seja retirada do rodízio e a próxima seja tentada; sem réplicas
+    disponíveis, ou logo após uma escrita do usuário, usa o primário. A
+    sessão deve ser fechada por quem a abriu.
+
+    Args:
+        request (Request): Requisição atual (identifica o usuário e o
+        marcador da última escrita).
+    Returns:
+        Session: Sessão do banco de dados.
+    """
+    if _recent_write(request):
+        return SessionLocal()
+
+    for replica in get_replica_set().candidates():
+        db = replica.session_factory()
+        try:
+            db.connection()
+            return db
+        except OperationalError:
+            db.close()
+            replica.mark_down()
+
+    return SessionLocal()
+
+
+# Função para obter uma sessão de leitura (réplica ou primário)
+def get_read_db(request: Request = None):
+    db = open_read_session(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def stream_with_read_db(request: Request, producer, *args):
+    """
+    Executa um gerador de lotes com uma sessão de leitura própria.
+
+    O corpo de respostas em streaming é gerado depois que as dependências
+    da rota (incluindo a sessão de get_read_db) já foram encerradas; a
+    sessão é aberta na primeira leitura e fechada ao fim do gerador (ou
+    quando o cliente desconecta).
+
+    Args:
+        request (Request): Requisição (identifica o usuário para a escolha
+        entre réplica e primário).
+        producer (Callable): Gerador de lotes que recebe a sessão como
+        primeiro argumento.
+        *args: Demais argumentos do gerador.
+    Yields:
+        list: Lotes produzidos pelo gerador.
+    """
+    db = open_read_session(request)
+    try:
+        yield from producer(db, *args)
+    finally:
+        db.close()
+
+
+def match_any(column, values: list, db: Session):
+    """
+    Monta a condição "coluna = ANY(:valores)".
+
+    No PostgreSQL, a lista é enviada como um único parâmetro (array), e o
+    texto da consulta é o mesmo para qualquer quantidade de valores; nos
+    demais bancos, é usado IN.
+
+    Args:
+        column (Column): Coluna comparada.
+        values (list): Valores aceitos.
+        db (Session): Sessão do banco de dados.
+    Returns:
+        ColumnElement: Condição para o where.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return column == any_(
+            bindparam(None, list(values), type_=ARRAY(column.type))
+        )
+    return column.in_(values)
+
+
+def estimate_count(query, db: Session):
+    """
+    Estima a quantidade de linhas de uma consulta pelas estatísticas do
+    planejador (EXPLAIN), sem executá-la.
+
+    A estimativa vem das estatísticas mantidas pelo ANALYZE/autovacuum e
+    pode divergir da contagem real, mas não depende do tamanho da tabela.
+
+    Args:
+        query (Select): Consulta cujas linhas serão estimadas.
+        db (Session): Sessão do banco de dados.
+    Returns:
+        Optional[int]: Linhas estimadas, ou None em bancos sem suporte.
+    """
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    compiled = query.compile(dialect=bind.dialect)
+    plan = db.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", dict(compiled.params)
+    ).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -3,7 +3,6 @@ from typing import Generic, List, Optional, TypeVar, Union
 
 # Imports de terceiros
 from pydantic import BaseModel
-from pydantic.generics import GenericModel
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -14,16 +13,18 @@ class APIException(Exception):
     """
     def __init__(
             self, status: str = "error", message: str = "",
-            code: int = 500, description: str = ""
+            code: int = 500, description: str = "",
+            headers: Optional[dict] = None
     ):
         self.status: str = status
         self.message: str = message
         self.code: int = code
         self.description: str = description
+        self.headers: Optional[dict] = headers
         self.data: Optional[Union[T, List[T], List[str], None, dict]] = {}
 
 
-class SuccessResponse(GenericModel, Generic[T]):
+class SuccessResponse(BaseModel, Generic[T]):
     """
         Modelo de resposta de sucesso da API
     """
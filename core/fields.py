@@ -0,0 +1,192 @@
+# Imports do sistema
+from dataclasses import fields as dataclass_fields
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+# Imports locais
+from core.exceptions import APIException
+
+
+@lru_cache(maxsize=None)
+def field_names(row_type: Any) -> tuple:
+    """
+    Obtém os nomes dos campos de uma dataclass, na ordem de declaração.
+
+    Args:
+        row_type (Any): Dataclass das linhas da listagem.
+    Returns:
+        tuple[str]: Nomes dos campos.
+    """
+    return tuple(field.name for field in dataclass_fields(row_type))
+
+
+def parse_fields(value: Optional[str], row_type: Any) -> Optional[frozenset]:
+    """
+    Valida o parâmetro "fields" (campos separados por vírgula) de uma
+    listagem.
+
+    Args:
+        value (Optional[str]): Valor do parâmetro, ex.: "id,description".
+        row_type (Any): Dataclass das linhas da listagem (ex.: ProductRow).
+    Returns:
+        Optional[frozenset]: Campos selecionados, ou None para todos.
+    Raises:
+        APIException: Se algum campo não existir na listagem.
+    """
+    if not value:
+        return None
+
+    selected = frozenset(
+        name.strip() for name in value.split(",") if name.strip()
+    )
+    available = field_names(row_type)
+
+    unknown = selected.difference(available)
+    if unknown:
+        raise APIException(
+            code=400,
+            message="Campos inválidos",
+            description=f"Campos desconhecidos: {', '.join(sorted(unknown))}. "
+                        f"Campos disponíveis: {', '.join(available)}"
+        )
+
+    return selected or None
+
+
+def parse_expand(value: Optional[str], available: tuple) -> frozenset:
+    """
+    Valida o parâmetro "expand" (relações separadas por vírgula) de uma
+    rota.
+
+    Args:
+        value (Optional[str]): Valor do parâmetro, ex.: "items.product".
+        available (tuple[str]): Relações que podem ser expandidas.
+    Returns:
+        frozenset: Relações a expandir (vazio quando não informado).
+    Raises:
+        APIException: Se alguma relação não puder ser expandida.
+    """
+    selected = frozenset(
+        name.strip() for name in (value or "").split(",") if name.strip()
+    )
+
+    unknown = selected.difference(available)
+    if unknown:
+        raise APIException(
+            code=400,
+            message="Expansão inválida",
+            description=f"Relações desconhecidas: "
+                        f"{', '.join(sorted(unknown))}. "
+                        f"Relações disponíveis: {', '.join(available)}"
+        )
+
+    return selected
+
+
+def parse_ids(value: str, limit: int) -> list:
+    """
+    Valida o parâmetro "ids" (IDs separados por vírgula) de uma busca em
+    lote.
+
+    Args:
+        value (str): Valor do parâmetro, ex.: "3,1,2".
+        limit (int): Quantidade máxima de IDs.
+    Returns:
+        list[int]: IDs na ordem informada, sem repetições.
+    Raises:
+        APIException: Se algum ID for inválido ou o limite for excedido.
+    """
+    try:
+        ids = list(dict.fromkeys(
+            int(item) for item in value.split(",") if item.strip()
+        ))
+    except ValueError:
+        raise APIException(
+            code=400,
+            message="IDs inválidos",
+            description="Os IDs devem ser números inteiros separados por "
+                        "vírgula"
+        )
+
+    if not ids:
+        raise APIException(
+            code=400,
+            message="IDs não informados",
+            description="Informe ao menos um ID"
+        )
+
+    if len(ids) > limit:
+        raise APIException(
+            code=400,
+            message="Limite de IDs excedido",
+            description=f"No máximo {limit} IDs podem ser consultados por "
+                        f"requisição"
+        )
+
+    return ids
+
+
+def wants(fields: Optional[frozenset], *names: str) -> bool:
+    """
+    Verifica se algum dos campos foi selecionado.
+
+    Args:
+        fields (Optional[frozenset]): Campos selecionados (None para todos).
+        names (str): Nomes dos campos.
+    Returns:
+        bool: True se algum dos campos deve ser carregado.
+    """
+    return fields is None or not fields.isdisjoint(names)
+
+
+def build_row(row_type: Any, values: dict) -> Any:
+    """
+    Cria uma linha da listagem com os valores carregados.
+
+    Os campos não selecionados ficam como None e não são serializados
+    (ver success_response).
+
+    Args:
+        row_type (Any): Dataclass das linhas da listagem.
+        values (dict): Valores dos campos carregados.
+    Returns:
+        Any: Instância de row_type.
+    """
+    return row_type(*(values.get(name) for name in field_names(row_type)))
+
+
+def format_cursor(updated_at: datetime, row_id: int) -> str:
+    """
+    Monta o cursor de uma sincronização incremental a partir da última
+    linha enviada.
+
+    Args:
+        updated_at (datetime): Data da última alteração da linha.
+        row_id (int): ID da linha.
+    Returns:
+        str: Cursor, ex.: "2026-10-19T10:00:00.123456_42".
+    """
+    return f"{updated_at.isoformat()}_{row_id}"
+
+
+def parse_cursor(value: str) -> tuple:
+    """
+    Valida o cursor ("since") de uma sincronização incremental.
+
+    Args:
+        value (str): Cursor retornado pela sincronização anterior.
+    Returns:
+        tuple[datetime, int]: Data da alteração e ID da última linha.
+    Raises:
+        APIException: Se o cursor for inválido.
+    """
+    try:
+        updated_at, row_id = value.rsplit("_", 1)
+        return datetime.fromisoformat(updated_at), int(row_id)
+    except ValueError:
+        raise APIException(
+            code=400,
+            message="Cursor inválido",
+            description="Use o cursor retornado pela sincronização anterior"
+        )
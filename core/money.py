@@ -0,0 +1,46 @@
+# Imports do sistema
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+# Imports locais
+from core.exceptions import APIException
+
+
+def to_cents(value) -> int:
+    """
+    Converte um valor em reais para centavos inteiros.
+
+    O valor passa por Decimal (a partir do texto), evitando que a
+    representação binária de floats como 19.9 gere 1989 centavos.
+
+    Args:
+        value (float | str | Decimal): Valor em reais.
+    Returns:
+        int: Valor em centavos, arredondado para o centavo mais próximo.
+    Raises:
+        APIException: Se o valor não for um número finito (ex.: "nan").
+    """
+    try:
+        amount = Decimal(str(value).strip())
+    except InvalidOperation:
+        amount = None
+
+    if amount is None or not amount.is_finite():
+        raise APIException(
+            code=400,
+            message="Valor inválido",
+            description=f"O valor {value!r} não é um preço válido"
+        )
+
+    return int((amount * 100).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> float:
+    """
+    Converte centavos inteiros para reais, no formato numérico da API.
+
+    Args:
+        cents (int): Valor em centavos.
+    Returns:
+        float: Valor em reais (ex.: 1990 -> 19.9).
+    """
+    return int(cents) / 100
@@ -0,0 +1,166 @@
+# Imports do sistema
+import logging
+import select
+import threading
+
+# Imports de terceiros
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.config import settings
+from core.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+
+class Subscriber:
+    """
+    Assinante de um ou mais canais do NotificationListener.
+
+    Os métodos são chamados na thread do listener e devem ser rápidos;
+    on_connect é chamado após cada (re)conexão, já com os canais escutados,
+    para que o assinante recarregue o seu estado sem perder notificações.
+    """
+    def on_connect(self):
+        pass
+
+    def on_notify(self, channel: str, payload: str):
+        pass
+
+    def on_disconnect(self):
+        pass
+
+    def on_tick(self):
+        pass
+
+
+class NotificationListener:
+    """
+    Conexão única, por worker, que escuta os canais de LISTEN/NOTIFY do
+    PostgreSQL e repassa as notificações aos assinantes.
+
+    Não é iniciado em outros bancos nem com PgBouncer em modo transaction
+    pooling (onde LISTEN não é suportado); nesses casos os assinantes nunca
+    recebem on_connect e devem recorrer ao banco de dados.
+    """
+    def __init__(self):
+        self.subscribers = {}
+        self.connected = False
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def subscribe(self, channel: str, subscriber: Subscriber):
+        """
+        Registra um assinante em um canal (antes de start).
+
+        Args:
+            channel (str): Nome do canal.
+            subscriber (Subscriber): Assinante notificado.
+        """
+        subscribers = self.subscribers.setdefault(channel, [])
+        if subscriber not in subscribers:
+            subscribers.append(subscriber)
+
+    def _all_subscribers(self) -> list:
+        unique = []
+        for subscribers in self.subscribers.values():
+            unique.extend(item for item in subscribers if item not in unique)
+        return unique
+
+    def _connect(self):
+        # Conexão dedicada, retirada do pool, em modo autocommit (exigido
+        # para receber as notificações fora de uma transação)
+        connection = get_engine().raw_connection()
+        connection.detach()
+        dbapi_connection = connection.dbapi_connection
+        dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        for channel in self.subscribers:
+            cursor.execute(f"LISTEN {channel}")
+        cursor.close()
+        return dbapi_connection
+
+    def _listen(self):
+        while not self.stop_event.is_set():
+            connection = None
+            try:
+                # O LISTEN precede a carga dos assinantes, então nenhuma
+                # alteração feita durante a carga é perdida
+                connection = self._connect()
+                for subscriber in self._all_subscribers():
+                    subscriber.on_connect()
+                self.connected = True
+
+                while not self.stop_event.is_set():
+                    if select.select([connection], [], [], 1.0)[0]:
+                        connection.poll()
+                        while connection.notifies:
+                            message = connection.notifies.pop(0)
+                            for subscriber in self.subscribers.get(
+                                    message.channel, ()):
+                                subscriber.on_notify(
+                                    message.channel, message.payload
+                                )
+
+                    for subscriber in self._all_subscribers():
+                        subscriber.on_tick()
+            except Exception:
+                logger.exception("Falha na escuta das notificações")
+            finally:
+                # Sem a conexão de escuta, notificações podem ser perdidas
+                self.connected = False
+                for subscriber in self._all_subscribers():
+                    subscriber.on_disconnect()
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+            self.stop_event.wait(settings.NOTIFICATIONS_RETRY_INTERVAL)
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            get_engine().dialect.name == "postgresql"
+            and not settings.DATABASE_PGBOUNCER
+        )
+
+    def start(self):
+        """
+        Inicia a escuta em segundo plano.
+        """
+        if not self.subscribers or not self.enabled:
+            return
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self._listen, name="notifications", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        """
+        Interrompe a escuta.
+        """
+        self.stop_event.set()
+
+
+listener = NotificationListener()
+
+
+def notify(channel: str, payload: str, db: Session):
+    """
+    Envia uma notificação na transação da sessão.
+
+    A notificação só é entregue no commit (e descartada no rollback). Em
+    bancos sem LISTEN/NOTIFY, nada é feito.
+
+    Args:
+        channel (str): Nome do canal.
+        payload (str): Conteúdo da notificação.
+        db (Session): Sessão do banco de dados.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.connection().execute(func.pg_notify(channel, payload).select())
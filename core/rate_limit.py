@@ -0,0 +1,167 @@
+# Imports do sistema
+import math
+import time
+from functools import lru_cache
+
+# Imports de terceiros
+from fastapi import Depends, Request
+from fastapi.security import OAuth2PasswordRequestForm
+from jose import jwt
+from limits import parse
+from limits.aio.strategies import SlidingWindowCounterRateLimiter
+from limits.storage import storage_from_string
+
+# Imports locais
+from core.config import settings
+from core.exceptions import APIException
+
+
+class RateLimiter:
+    """
+    Limitador de requisições baseado no pacote limits.
+
+    O estado fica em memória no worker por padrão (RATE_LIMIT_STORAGE_URI
+    "async+memory://") e pode ser compartilhado entre workers configurando
+    um storage como Redis ou Memcached. O limitador é criado no primeiro uso,
+    já dentro do processo do worker.
+    """
+    def __init__(self):
+        self._limiter = None
+
+    @property
+    def limiter(self) -> SlidingWindowCounterRateLimiter:
+        if self._limiter is None:
+            self._limiter = SlidingWindowCounterRateLimiter(
+                storage_from_string(settings.RATE_LIMIT_STORAGE_URI)
+            )
+        return self._limiter
+
+    async def hit(self, limit: str, *identifiers: str):
+        """
+        Consome uma requisição do limite informado.
+
+        Args:
+            limit (str): Limite no formato do pacote limits (ex.: "5/minute").
+            identifiers (str): Identificadores do contador (escopo, chave).
+        Raises:
+            APIException: Se o limite tiver sido excedido (HTTP 429).
+        """
+        if not settings.RATE_LIMIT_ENABLED or not limit:
+            return
+
+        item = _parse_limit(limit)
+        if await self.limiter.hit(item, *identifiers):
+            return
+
+        stats = await self.limiter.get_window_stats(item, *identifiers)
+        retry_after = max(math.ceil(stats.reset_time - time.time()), 1)
+
+        raise APIException(
+            code=429,
+            message="Muitas requisições",
+            description=f"Limite de {limit} excedido. Tente novamente "
+                        f"em {retry_after} segundos",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+@lru_cache(maxsize=None)
+def _parse_limit(limit: str):
+    return parse(limit)
+
+
+rate_limiter = RateLimiter()
+
+
+def client_ip(request: Request) -> str:
+    """
+    Obtém o IP do cliente da requisição.
+
+    Args:
+        request (Request): Requisição atual.
+    Returns:
+        str: Endereço IP do cliente.
+    """
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+
+    return request.client.host if request.client else "unknown"
+
+
+def token_subject(authorization: str):
+    """
+    Obtém o usuário do token Bearer de uma requisição, sem acessar o banco.
+
+    Args:
+        authorization (str): Valor do cabeçalho Authorization.
+    Returns:
+        Optional[str]: ID do usuário ou None se o token for inválido.
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+
+    try:
+        payload = jwt.decode(
+            token,
+            settings.JWT_SECRET_KEY,
+            algorithms=[settings.ALGORITHM]
+        )
+    except jwt.JWTError:
+        return None
+
+    return payload.get("sub")
+
+
+async def limit_request(request: Request):
+    """
+    Aplica os limites padrão por IP e por usuário a todas as rotas.
+
+    Args:
+        request (Request): Requisição atual.
+    """
+    await rate_limiter.hit(
+        settings.RATE_LIMIT_PER_IP, "ip", client_ip(request)
+    )
+
+    subject = token_subject(request.headers.get("authorization"))
+    if subject:
+        await rate_limiter.hit(settings.RATE_LIMIT_PER_USER, "user", subject)
+
+
+async def limit_login(
+        request: Request,
+        data: OAuth2PasswordRequestForm = Depends()
+):
+    """
+    Aplica os limites de tentativas de login por IP e por conta (a partir
+    do mesmo IP).
+
+    Executado antes da consulta ao banco e da verificação bcrypt.
+
+    Args:
+        request (Request): Requisição atual.
+        data (OAuth2PasswordRequestForm): Dados de autenticação do usuário.
+    """
+    ip = client_ip(request)
+    await rate_limiter.hit(settings.RATE_LIMIT_LOGIN_PER_IP, "login-ip", ip)
+    await rate_limiter.hit(
+        settings.RATE_LIMIT_LOGIN_PER_ACCOUNT,
+        "login-account",
+        data.username.lower(),
+        ip
+    )
+
+
+async def limit_register(request: Request):
+    """
+    Aplica o limite de cadastros de usuário por IP.
+
+    Args:
+        request (Request): Requisição atual.
+    """
+    await rate_limiter.hit(
+        settings.RATE_LIMIT_REGISTER_PER_IP, "register-ip", client_ip(request)
+    )
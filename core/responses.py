@@ -0,0 +1,165 @@
+# Imports do sistema
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional
+
+# Imports de terceiros
+import orjson
+from pydantic import TypeAdapter
+from starlette.responses import Response, StreamingResponse
+
+
+@lru_cache(maxsize=None)
+def get_adapter(output_type: Any) -> TypeAdapter:
+    """
+    Obtém o TypeAdapter (criado uma única vez) de um tipo de resposta.
+
+    Args:
+        output_type (Any): Tipo do dado serializado (ex.: List[ProductOutput]).
+    Returns:
+        TypeAdapter: Adaptador reutilizado em todas as requisições.
+    """
+    return TypeAdapter(output_type)
+
+
+def _output_type(data: Any) -> Any:
+    """
+    Infere o tipo de resposta a partir do dado retornado pela rota.
+
+    Args:
+        data (Any): Objeto ou lista de objetos da resposta.
+    Returns:
+        Any: Tipo utilizado para obter o TypeAdapter.
+    """
+    if isinstance(data, list):
+        return List[type(data[0])]
+    return type(data)
+
+
+def dump_data(
+        data: Any,
+        output_type: Optional[Any] = None,
+        fields: Optional[frozenset | dict] = None
+) -> bytes:
+    """
+    Serializa o dado da resposta diretamente para JSON.
+
+    Os modelos já foram validados ao serem construídos na rota, então o
+    TypeAdapter apenas os serializa (no pydantic-core), sem nova validação
+    e sem passar pelo jsonable_encoder.
+
+    Args:
+        data (Any): Objeto ou lista de objetos da resposta.
+        output_type (Any): Tipo do dado; inferido quando não informado.
+        fields (Optional[frozenset | dict]): Campos serializados de cada
+        objeto (todos quando None), ou o include completo do pydantic.
+    Returns:
+        bytes: JSON do dado.
+    """
+    if data is None:
+        return b"null"
+
+    if isinstance(data, list) and not data:
+        return b"[]"
+
+    adapter = get_adapter(output_type or _output_type(data))
+    if fields is None:
+        return adapter.dump_json(data)
+
+    if isinstance(fields, dict):
+        include = fields
+    elif isinstance(data, list):
+        include = {"__all__": fields}
+    else:
+        include = fields
+    return adapter.dump_json(data, include=include)
+
+
+def success_response(
+        data: Any = None,
+        message: str = "Requisição bem-sucedida.",
+        output_type: Optional[Any] = None,
+        status_code: int = 200,
+        fields: Optional[frozenset | dict] = None
+) -> Response:
+    """
+    Monta a resposta de sucesso da API já serializada.
+
+    Mantém o mesmo envelope do SuccessResponse (status, data e message),
+    mas entrega os bytes prontos ao FastAPI, que deixa de revalidar e
+    recodificar o conteúdo.
+
+    Args:
+        data (Any): Objeto ou lista de objetos da resposta.
+        message (str): Mensagem da resposta.
+        output_type (Any): Tipo do dado; inferido quando não informado.
+        status_code (int): Código HTTP da resposta.
+        fields (Optional[frozenset | dict]): Campos serializados de cada
+        objeto (todos quando None), ou o include completo do pydantic.
+    Returns:
+        Response: Resposta JSON.
+    """
+    content = b"".join((
+        b'{"status":"success","data":',
+        dump_data(data, output_type, fields),
+        b',"message":',
+        orjson.dumps(message),
+        b"}",
+    ))
+
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def _stream_envelope(
+        batches: Iterable[list],
+        output_type: Any,
+        message: str,
+        fields: Optional[frozenset]
+):
+    yield b'{"status":"success","data":['
+
+    first = True
+    for batch in batches:
+        if not batch:
+            continue
+        # Cada lote é serializado como array; os colchetes são removidos
+        # para que os lotes formem um único array
+        chunk = dump_data(batch, output_type, fields)[1:-1]
+        yield chunk if first else b"," + chunk
+        first = False
+
+    yield b'],"message":' + orjson.dumps(message) + b"}"
+
+
+def streaming_response(
+        batches: Iterable[list],
+        message: str = "Requisição bem-sucedida.",
+        output_type: Optional[Any] = None,
+        fields: Optional[frozenset] = None
+) -> StreamingResponse:
+    """
+    Monta a resposta de sucesso de uma listagem em streaming.
+
+    Mantém o envelope de success_response, mas o array de data é enviado
+    lote a lote, à medida que os lotes são lidos do banco; apenas um lote
+    fica em memória por vez, qualquer que seja o tamanho da listagem. Uma
+    falha no meio da leitura interrompe a resposta (o status 200 já foi
+    enviado).
+
+    Args:
+        batches (Iterable[list]): Lotes de objetos da listagem.
+        message (str): Mensagem da resposta.
+        output_type (Any): Tipo de cada lote (ex.: List[ClientRow]);
+        inferido quando não informado.
+        fields (Optional[frozenset]): Campos serializados de cada objeto
+        (todos quando None).
+    Returns:
+        StreamingResponse: Resposta JSON em streaming.
+    """
+    return StreamingResponse(
+        _stream_envelope(batches, output_type, message, fields),
+        media_type="application/json"
+    )
@@ -0,0 +1,115 @@
+# Imports do sistema
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Warmup:
+    """
+    Etapas de aquecimento executadas na inicialização de cada worker.
+
+    As etapas rodam em uma thread, sem atrasar a abertura do servidor; o
+    worker só é considerado pronto (readiness) quando todas terminam com
+    sucesso. Etapas com falha (ex.: banco indisponível) são repetidas a cada
+    WARMUP_RETRY_INTERVAL segundos, sem repetir as que já foram concluídas.
+    """
+    def __init__(self):
+        self.steps = []
+        self.results = {}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def step(self, name: str):
+        """
+        Registra uma função como etapa de aquecimento.
+
+        Args:
+            name (str): Nome da etapa, exibido no endpoint de readiness.
+        Returns:
+            Callable: Decorador que registra a etapa.
+        """
+        def decorator(function):
+            self.steps.append((name, function))
+            return function
+
+        return decorator
+
+    @property
+    def ready(self) -> bool:
+        with self.lock:
+            return len(self.results) == len(self.steps) and all(
+                result["error"] is None for result in self.results.values()
+            )
+
+    def run_once(self) -> bool:
+        """
+        Executa as etapas pendentes ou que falharam na última tentativa.
+
+        Returns:
+            bool: True se todas as etapas estiverem concluídas.
+        """
+        for name, function in self.steps:
+            result = self.results.get(name)
+            if result and result["error"] is None:
+                continue
+
+            started = time.perf_counter()
+            error = None
+            try:
+                function()
+            except Exception as exc:
+                logger.warning("Falha no aquecimento (%s): %s", name, exc)
+                error = str(exc) or type(exc).__name__
+
+            with self.lock:
+                self.results[name] = {
+                    "name": name,
+                    "seconds": round(time.perf_counter() - started, 4),
+                    "error": error,
+                }
+
+        return self.ready
+
+    def _loop(self, retry_interval: float):
+        while not self.run_once():
+            if self.stop_event.wait(retry_interval):
+                return
+        logger.info("Aquecimento concluído: %s", self.status())
+
+    def start(self, retry_interval: float):
+        """
+        Inicia o aquecimento em segundo plano.
+
+        Args:
+            retry_interval (float): Intervalo, em segundos, entre tentativas.
+        """
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self._loop,
+            args=(retry_interval,),
+            name="warmup",
+            daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        """
+        Interrompe as novas tentativas de aquecimento.
+        """
+        self.stop_event.set()
+
+    def status(self) -> list:
+        """
+        Retorna o resultado de cada etapa executada.
+
+        Returns:
+            list[dict]: Nome, duração (segundos) e erro de cada etapa.
+        """
+        with self.lock:
+            return [dict(result) for result in self.results.values()]
+
+
+warmup = Warmup()
@@ -0,0 +1,58 @@
+# Configuração do gunicorn para o modo de produção:
+#
+#     gunicorn -c gunicorn_conf.py main:app
+#
+# A imagem base do Dockerfile (uvicorn-gunicorn-fastapi) utiliza este
+# arquivo automaticamente quando ele está em /app/gunicorn_conf.py.
+
+# Imports do sistema
+import multiprocessing
+import os
+
+# Quantidade de workers: WEB_CONCURRENCY ou um por núcleo. O valor é
+# exportado para que o orçamento de conexões (DATABASE_CONNECTION_BUDGET)
+# seja dividido pela quantidade real de workers
+workers = int(os.getenv("WEB_CONCURRENCY") or multiprocessing.cpu_count())
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = os.getenv("BIND") or f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# A aplicação é importada no processo principal e compartilhada com os
+# workers (copy-on-write); o engine do banco só é criado no primeiro uso
+preload_app = True
+
+# Reciclagem dos workers para limitar o crescimento de memória; o jitter
+# evita que todos reiniciem ao mesmo tempo. A reciclagem encerra as
+# conexões SSE (/orders/events) abertas após graceful_timeout: um grupo
+# de workers dedicado a elas deve usar MAX_REQUESTS=0 (0 desativa)
+max_requests = int(os.getenv("MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "100"))
+
+# No SIGTERM, os workers param de aceitar conexões e têm até
+# graceful_timeout segundos para concluir as requisições em andamento
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("TIMEOUT", "60"))
+keepalive = int(os.getenv("KEEP_ALIVE", "5"))
+
+accesslog = os.getenv("ACCESS_LOG", "-") or None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    """
+    Descarta as conexões herdadas do processo principal no novo worker.
+    """
+    from core.database import dispose_engines
+
+    dispose_engines(close=False)
+
+
+def worker_exit(server, worker):
+    """
+    Fecha as conexões do pool ao encerrar o worker.
+    """
+    from core.database import dispose_engines
+
+    dispose_engines()
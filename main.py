@@ -1,51 +1,145 @@
-# Imports de terceiros
-from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
-
-# Imports locais
-from core.exceptions import APIException
-from src.auth.routers import router as auth_router
-from src.clients.routers import router as client_router
-from src.orders.routers import router as order_router
-from src.products.routers import router as product_router
-
-# Inicialização do FastAPI
-app = FastAPI(
-    title="Lu Estilo API",
-    version="1.0.0"
-)
-
-# Monta a pasta 'static' para servir arquivos estáticos
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
-# Middlewares
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Rotas/Controles
-app.include_router(auth_router)
-app.include_router(client_router)
-app.include_router(product_router)
-app.include_router(order_router)
-
-
-# Manipulador de exceções para APIException
-@app.exception_handler(APIException)
-async def api_exception_handler(request: Request, exc: APIException):
-    return JSONResponse(
-        status_code=exc.code,
-        content={
-            "status": exc.status,
-            "message": exc.message,
-            "code": exc.code,
-            "description": exc.description,
-            "data": exc.data
-        }
+# Imports do sistema
+from contextlib import asynccontextmanager
+
+
+@asynccontextmanager
+async def lifespan(app):
+    from core.config import settings
+    from core.notifications import listener
+    from core.warmup import warmup
+    from src.jobs.worker import JobWorker
+
+    # Conexão de escuta (LISTEN/NOTIFY) que mantém os caches do worker
+    # sincronizados (tokens revogados, códigos de barras)
+    listener.start()
+
+    # Aquecimento em segundo plano; /health/ready responde 503 até o fim
+    if settings.WARMUP_ENABLED:
+        import src.health.warmup  # noqa: F401
+        warmup.start(settings.WARMUP_RETRY_INTERVAL)
+
+    # Workers da fila de tarefas no próprio processo da API (opcional)
+    worker = JobWorker() if settings.JOBS_RUN_IN_APP else None
+    if worker:
+        worker.start()
+    yield
+    warmup.stop()
+    listener.stop()
+    if worker:
+        worker.stop()
+
+
+def create_app():
+    """
+    Cria a aplicação FastAPI.
+
+    Configurações, engine do banco de dados, rotas e middlewares só são
+    carregados aqui (e o engine apenas na primeira sessão), mantendo a
+    importação deste módulo praticamente sem custo. Servidores podem usar
+    "uvicorn --factory main:create_app" ou, como antes, "main:app".
+
+    Returns:
+        FastAPI: Aplicação configurada.
+    """
+    # Imports de terceiros
+    from fastapi import Depends, FastAPI, Request
+    from fastapi.responses import ORJSONResponse
+    from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+    from starlette.middleware.cors import CORSMiddleware
+
+    # Imports locais
+    from core.compression import (CompressionMiddleware,
+                                  PrecompressedStaticFiles)
+    from core.config import settings
+    from core.database import ReadYourWritesMiddleware, get_pool_metrics
+    from core.exceptions import APIException
+    from core.rate_limit import limit_request
+    from src.auth.routers import router as auth_router
+    from src.clients.routers import router as client_router
+    from src.health.routers import router as health_router
+    from src.idempotency.middleware import IdempotencyMiddleware
+    from src.orders.routers import router as order_router
+    from src.products.routers import router as product_router
+
+    # Inicialização do FastAPI
+    app = FastAPI(
+        title="Lu Estilo API",
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
+
+    # Monta a pasta 'static' para servir arquivos estáticos, entregando as
+    # versões pré-comprimidas (.br/.gz) quando disponíveis; a pasta não
+    # precisa existir na inicialização (é criada no primeiro upload)
+    app.mount(
+        "/static",
+        PrecompressedStaticFiles(directory="static", check_dir=False),
+        name="static"
+    )
+
+    # Middlewares
+    app.add_middleware(ReadYourWritesMiddleware)
+    app.add_middleware(IdempotencyMiddleware)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(CompressionMiddleware)
+
+    # Rotas/Controles (com os limites padrão de requisições por IP e
+    # usuário)
+    app.include_router(auth_router, dependencies=[Depends(limit_request)])
+    app.include_router(client_router, dependencies=[Depends(limit_request)])
+    app.include_router(product_router, dependencies=[Depends(limit_request)])
+    app.include_router(order_router, dependencies=[Depends(limit_request)])
+    app.include_router(health_router)
+
+    # Manipulador de exceções para APIException
+    @app.exception_handler(APIException)
+    async def api_exception_handler(request: Request, exc: APIException):
+        return ORJSONResponse(
+            status_code=exc.code,
+            headers=exc.headers,
+            content={
+                "status": exc.status,
+                "message": exc.message,
+                "code": exc.code,
+                "description": exc.description,
+                "data": exc.data
+            }
+        )
+
+    # Manipulador de exceções para o esgotamento do pool de conexões
+    @app.exception_handler(PoolTimeoutError)
+    async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+        get_pool_metrics().record_timeout()
+        return ORJSONResponse(
+            status_code=503,
+            headers={
+                "Retry-After": str(int(settings.DATABASE_POOL_TIMEOUT) or 1)
+            },
+            content={
+                "status": "error",
+                "message": "Serviço temporariamente indisponível",
+                "code": 503,
+                "description": "Nenhuma conexão com o banco de dados "
+                               "disponível. Tente novamente em instantes",
+                "data": {}
+            }
+        )
+
+    return app
+
+
+def __getattr__(name: str):
+    # "main:app" continua funcionando: a aplicação é criada no primeiro
+    # acesso ao atributo, e não na importação do módulo
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,45 @@
+# Imports do sistema
+import threading
+import time
+
+# Imports locais
+from core.config import settings
+
+
+class UserCache:
+    """
+    Registro, em memória do worker, dos usuários confirmados no banco.
+
+    Permite autenticar rotas de alto volume (get_current_user_id) sem
+    consultar o banco: um usuário encontrado é considerado existente por
+    AUTH_USER_CACHE_SECONDS. A exclusão de um usuário é aplicada de
+    imediato no worker que a executa e, nos demais, ao fim desse prazo.
+    """
+    MAX_ENTRIES = 100_000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.expires = {}
+
+    def contains(self, user_id: int) -> bool:
+        return self.expires.get(user_id, 0.0) > time.monotonic()
+
+    def add(self, user_id: int):
+        if settings.AUTH_USER_CACHE_SECONDS <= 0:
+            return
+
+        now = time.monotonic()
+        with self.lock:
+            if len(self.expires) >= self.MAX_ENTRIES:
+                self.expires = {
+                    item: expires for item, expires in self.expires.items()
+                    if expires > now
+                }
+            self.expires[user_id] = now + settings.AUTH_USER_CACHE_SECONDS
+
+    def discard(self, user_id: int):
+        with self.lock:
+            self.expires.pop(user_id, None)
+
+
+user_cache = UserCache()
@@ -1,8 +1,16 @@
+# Imports do sistema
+from datetime import datetime
+
 # Imports de terceiros
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 # Imports locais
-from src.auth.models import UserModel
+from core.notifications import notify
+from src.auth.models import RevokedTokenModel, UserModel
+
+# Canal do LISTEN/NOTIFY que avisa os workers sobre tokens revogados
+REVOKED_TOKENS_CHANNEL = "revoked_tokens"
 
 
 def get_user_by_email(
@@ -34,3 +42,81 @@ def get_user_by_id(user_id: int, db: Session):
         encontrado.
     """
     return db.query(UserModel).filter(UserModel.id == user_id).first()
+
+
+def revoke_token(
+        jti: str,
+        user_id: int,
+        expires_at: datetime,
+        db: Session
+):
+    """
+    Registra um token como revogado e notifica os demais workers.
+
+    No PostgreSQL, a notificação (pg_notify) só é entregue no commit da
+    transação, junto com o registro na tabela. O commit é responsabilidade
+    de quem chama.
+
+    Args:
+        jti (str): Identificador único do token (claim jti).
+        user_id (int): ID do usuário dono do token.
+        expires_at (datetime): Expiração do token.
+        db (Session): Sessão do banco de dados.
+    """
+    if db.get(RevokedTokenModel, jti) is None:
+        db.add(RevokedTokenModel(
+            jti=jti,
+            user_id=user_id,
+            expires_at=expires_at,
+            revoked_at=datetime.now()
+        ))
+        db.flush()
+
+    notify(REVOKED_TOKENS_CHANNEL, jti, db)
+
+
+def is_token_in_denylist(jti: str, db: Session) -> bool:
+    """
+    Verifica no banco de dados se um token foi revogado.
+
+    Args:
+        jti (str): Identificador único do token (claim jti).
+        db (Session): Sessão do banco de dados.
+    Returns:
+        bool: True se o token foi revogado.
+    """
+    return db.query(RevokedTokenModel.jti).filter(
+        RevokedTokenModel.jti == jti
+    ).first() is not None
+
+
+def list_revoked_jtis(db: Session) -> list:
+    """
+    Lista os identificadores dos tokens revogados ainda não expirados.
+
+    Args:
+        db (Session): Sessão do banco de dados.
+    Returns:
+        list[str]: Identificadores (jti) dos tokens.
+    """
+    return db.scalars(
+        select(RevokedTokenModel.jti).where(
+            RevokedTokenModel.expires_at > datetime.now()
+        )
+    ).all()
+
+
+def purge_expired_revoked_tokens(db: Session) -> int:
+    """
+    Remove os tokens revogados que já expiraram.
+
+    Args:
+        db (Session): Sessão do banco de dados.
+    Returns:
+        int: Quantidade de registros removidos.
+    """
+    deleted = db.query(RevokedTokenModel).filter(
+        RevokedTokenModel.expires_at <= datetime.now()
+    ).delete()
+    db.commit()
+    return deleted
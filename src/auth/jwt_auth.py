@@ -1,6 +1,7 @@
 # Imports do sistema
 from datetime import datetime, timedelta, timezone
 from typing import Any, Union
+from uuid import uuid4
 
 # Imports de terceiros
 from fastapi import Depends, HTTPException, status
@@ -12,9 +13,11 @@ from sqlalchemy.orm import Session
 
 # Imports locais
 from core.config import settings
-from core.database import get_db
+from core.database import SessionLocal, get_db
+from src.auth.cache import user_cache
 from src.auth.crud import get_user_by_id
 from src.auth.models import UserModel
+from src.auth.revocation import is_token_revoked, token_denylist
 from src.auth.schemas import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -70,9 +73,11 @@ def create_access_token(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
+    # O jti identifica o token para uma eventual revogação (logout)
     to_encode = {
         "exp": expires,
-        "sub": str(subject)
+        "sub": str(subject),
+        "jti": uuid4().hex
     }
 
     return jwt.encode(
@@ -105,7 +110,8 @@ def create_refresh_token(
 
     to_encode = {
         "exp": expires,
-        "sub": str(subject)
+        "sub": str(subject),
+        "jti": uuid4().hex
     }
 
     return jwt.encode(
@@ -115,18 +121,16 @@ def create_refresh_token(
     )
 
 
-async def get_current_user(
-        token: str = Depends(oauth2_scheme),
-        db: Session = Depends(get_db)
-) -> UserModel:
+def decode_access_token(token: str) -> TokenPayload:
     """
-    Obtém o usuário atual a partir do token JWT.
+    Valida a assinatura e a expiração de um token de acesso JWT.
 
     Args:
         token (str): O token JWT do usuário.
-        db (Session): A sessão do banco de dados.
     Returns:
-        UserModel: O modelo do usuário atual.
+        TokenPayload: O payload do token.
+    Raises:
+        HTTPException: Se o token for inválido (403) ou expirado (401).
     """
     try:
         payload = jwt.decode(
@@ -150,18 +154,88 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
+    return token_data
+
+
+def _revoked_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token has been revoked",
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+def _user_not_found_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="User not found",
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+async def get_current_user(
+        token: str = Depends(oauth2_scheme),
+        db: Session = Depends(get_db)
+) -> UserModel:
+    """
+    Obtém o usuário atual a partir do token JWT.
+
+    Args:
+        token (str): O token JWT do usuário.
+        db (Session): A sessão do banco de dados.
+    Returns:
+        UserModel: O modelo do usuário atual.
+    """
+    token_data = decode_access_token(token)
+
+    # O filtro de Bloom descarta quase todos os tokens válidos sem consulta
+    if is_token_revoked(token_data.jti, db):
+        raise _revoked_exception()
+
     user = get_user_by_id(token_data.sub, db)
 
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+        raise _user_not_found_exception()
 
+    user_cache.add(user.id)
     return user
 
 
+def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    """
+    Obtém o ID do usuário atual sem acessar o banco, para rotas de alto
+    volume que não precisam do modelo do usuário.
+
+    O token é descartado como revogado pelo filtro de Bloom e o usuário é
+    confirmado pelo registro em memória (user_cache); apenas quando um
+    deles não responde (token possivelmente revogado, usuário não visto
+    recentemente ou filtro não sincronizado) uma sessão é aberta.
+
+    Args:
+        token (str): O token JWT do usuário.
+    Returns:
+        int: ID do usuário atual.
+    """
+    token_data = decode_access_token(token)
+    maybe_revoked = bool(token_data.jti) \
+        and token_denylist.might_contain(token_data.jti)
+
+    if not maybe_revoked and user_cache.contains(token_data.sub):
+        return token_data.sub
+
+    db = SessionLocal()
+    try:
+        if is_token_revoked(token_data.jti, db):
+            raise _revoked_exception()
+        if not get_user_by_id(token_data.sub, db):
+            raise _user_not_found_exception()
+    finally:
+        db.close()
+
+    user_cache.add(token_data.sub)
+    return token_data.sub
+
+
 def require_role(role: str):
     """
     Verifica se o usuário atual tem a função especificada.
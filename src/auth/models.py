@@ -2,7 +2,7 @@
 import enum
 
 # Imports de terceiros
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 
 # Imports locais
 from core.database import Base
@@ -23,3 +23,22 @@ class UserModel(Base):
     email = Column(String, unique=True)
     hashed_password = Column(String)
     # role = Column(Enum(UserRole), default=UserRole.USER)
+
+
+class RevokedTokenModel(Base):
+    """
+    Modelo dos tokens revogados (logout) antes da expiração.
+
+    Os registros só precisam existir até a expiração do token; depois disso
+    o próprio JWT deixa de ser aceito e o registro pode ser removido.
+    """
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(32), primary_key=True)
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, nullable=False)
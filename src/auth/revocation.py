@@ -0,0 +1,160 @@
+# Imports do sistema
+import threading
+import time
+from datetime import datetime
+
+# Imports de terceiros
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.bloom import BloomFilter
+from core.config import settings
+from core.database import SessionLocal
+from core.notifications import Subscriber, listener
+from src.auth.crud import (REVOKED_TOKENS_CHANNEL, is_token_in_denylist,
+                           list_revoked_jtis, revoke_token)
+from src.auth.schemas import TokenPayload
+
+
+class TokenDenylist(Subscriber):
+    """
+    Cópia, em memória do worker, dos tokens revogados em um filtro de Bloom.
+
+    O filtro responde "certamente não revogado" sem acessar o banco; apenas
+    os tokens presentes no filtro (revogados ou falsos positivos) são
+    confirmados na tabela revoked_tokens. O filtro é mantido sincronizado
+    pelo NotificationListener do worker e reconstruído periodicamente,
+    descartando os tokens já expirados.
+
+    Enquanto o filtro não está sincronizado (inicialização, conexão de
+    escuta perdida, PgBouncer ou bancos sem LISTEN/NOTIFY), todas as
+    consultas vão ao banco.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.filter = None
+        self.rebuilt_at = 0.0
+
+    @property
+    def synced(self) -> bool:
+        return self.filter is not None
+
+    def might_contain(self, jti: str) -> bool:
+        """
+        Verifica se um token pode ter sido revogado.
+
+        Args:
+            jti (str): Identificador único do token (claim jti).
+        Returns:
+            bool: False somente se o token certamente não foi revogado.
+        """
+        bloom = self.filter
+        return bloom is None or jti in bloom
+
+    def add(self, jti: str):
+        """
+        Adiciona um token revogado ao filtro deste worker.
+
+        Args:
+            jti (str): Identificador único do token (claim jti).
+        """
+        with self.lock:
+            if self.filter is not None:
+                self.filter.add(jti)
+
+    def rebuild(self):
+        """
+        Reconstrói o filtro com os tokens revogados ainda não expirados.
+        """
+        db = SessionLocal()
+        try:
+            jtis = list_revoked_jtis(db)
+        finally:
+            db.close()
+
+        bloom = BloomFilter(
+            max(settings.TOKEN_DENYLIST_CAPACITY, 2 * len(jtis)),
+            settings.TOKEN_DENYLIST_ERROR_RATE
+        )
+        for jti in jtis:
+            bloom.add(jti)
+
+        with self.lock:
+            self.filter = bloom
+        self.rebuilt_at = time.monotonic()
+
+    def on_connect(self):
+        self.rebuild()
+
+    def on_notify(self, channel: str, payload: str):
+        self.add(payload)
+
+    def on_disconnect(self):
+        with self.lock:
+            self.filter = None
+
+    def on_tick(self):
+        if time.monotonic() - self.rebuilt_at >= \
+                settings.TOKEN_DENYLIST_REBUILD_INTERVAL:
+            self.rebuild()
+
+    def status(self) -> dict:
+        """
+        Retorna o estado do filtro deste worker.
+
+        Returns:
+            dict: Sincronização, itens, tamanho (bytes) e funções de hash.
+        """
+        bloom = self.filter
+        return {
+            "synced": bloom is not None,
+            "items": len(bloom) if bloom else 0,
+            "size_bytes": len(bloom.bits) if bloom else 0,
+            "hashes": bloom.hashes if bloom else 0,
+        }
+
+
+token_denylist = TokenDenylist()
+listener.subscribe(REVOKED_TOKENS_CHANNEL, token_denylist)
+
+
+def is_token_revoked(jti: str, db: Session) -> bool:
+    """
+    Verifica se um token foi revogado.
+
+    Tokens emitidos sem jti não podem ser revogados e continuam válidos até
+    a expiração.
+
+    Args:
+        jti (str): Identificador único do token (claim jti).
+        db (Session): Sessão do banco de dados.
+    Returns:
+        bool: True se o token foi revogado.
+    """
+    if not jti or not token_denylist.might_contain(jti):
+        return False
+    return is_token_in_denylist(jti, db)
+
+
+def revoke(token_data: TokenPayload, db: Session):
+    """
+    Revoga um token até a sua expiração.
+
+    Args:
+        token_data (TokenPayload): Payload do token a ser revogado.
+        db (Session): Sessão do banco de dados.
+    """
+    if not token_data.jti:
+        return
+
+    revoke_token(
+        token_data.jti,
+        token_data.sub,
+        datetime.fromtimestamp(token_data.exp),
+        db
+    )
+    db.commit()
+
+    # Os demais workers recebem a notificação; este já passa a recusar o
+    # token mesmo antes dela chegar
+    token_denylist.add(token_data.jti)
@@ -1,3 +1,6 @@
+# Imports do sistema
+from typing import Optional
+
 # Imports de terceiros
 from fastapi import APIRouter, Body, HTTPException
 from fastapi.params import Depends
@@ -10,11 +13,15 @@ from starlette import status
 # Imports locais
 from core.config import settings
 from core.database import get_db
-from core.exceptions import APIException, SuccessResponse
+from core.exceptions import APIException
+from core.rate_limit import limit_login, limit_register
+from core.responses import success_response
 from src.auth.crud import get_user_by_email, get_user_by_id
 from src.auth.jwt_auth import (create_access_token, create_refresh_token,
-                               get_password, verify_password)
+                               get_current_user, get_password, oauth2_scheme,
+                               verify_password)
 from src.auth.models import UserModel
+from src.auth.revocation import is_token_revoked, revoke
 from src.auth.schemas import TokenPayload, UserAuth
 from src.clients.crud import get_client_by_email
 
@@ -25,7 +32,11 @@ router = APIRouter(
 )
 
 
-@router.post("/register", summary="Registro de novo usuário")
+@router.post(
+    "/register",
+    summary="Registro de novo usuário",
+    dependencies=[Depends(limit_register)]
+)
 async def create_user(user: UserAuth, db: Session = Depends(get_db)):
     """
     Cria um novo usuário.
@@ -58,13 +69,17 @@ async def create_user(user: UserAuth, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(user_model)
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Usuário criado com sucesso"
     )
 
 
-@router.post("/login", summary="Autenticação de usuário")
+@router.post(
+    "/login",
+    summary="Autenticação de usuário",
+    dependencies=[Depends(limit_login)]
+)
 def authenticate(
         data: OAuth2PasswordRequestForm = Depends(),
         db: Session = Depends(get_db)
@@ -123,6 +138,14 @@ async def refresh_token(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
+    # Verifica se o refresh token foi revogado (logout)
+    if is_token_revoked(token_data.jti, db):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token revogado",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
     user = get_user_by_id(token_data.sub, db)
 
     # Verifica se o usuário existe
@@ -137,3 +160,62 @@ async def refresh_token(
         "access_token": create_access_token(user.id),
         "refresh_token": create_refresh_token(user.id)
     }
+
+
+@router.post("/logout", summary="Logout (revogação dos tokens)")
+def logout(
+        token_refresh: Optional[str] = Body(None),
+        token: str = Depends(oauth2_scheme),
+        current_user: UserModel = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    """
+    Revoga o token de acesso atual e, se informado, o refresh token.
+
+    Os tokens revogados são recusados por todos os workers até a sua
+    expiração.
+
+    Args:
+        token_refresh (Optional[str]): Refresh token a ser revogado.
+        token (str): Token de acesso da requisição.
+        current_user (UserModel): Usuário autenticado.
+        db (Session): Sessão do banco de dados.
+    Returns:
+        dict: Resposta de sucesso.
+    """
+    tokens = [TokenPayload(**jwt.decode(
+        token,
+        settings.JWT_SECRET_KEY,
+        algorithms=[settings.ALGORITHM]
+    ))]
+
+    if token_refresh:
+        try:
+            tokens.append(TokenPayload(**jwt.decode(
+                token_refresh,
+                settings.JWT_REFRESH_SECRET_KEY,
+                algorithms=[settings.ALGORITHM]
+            )))
+        except (jwt.JWTError, ValidationError):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token inválido",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+
+        # Um usuário só pode revogar os próprios tokens
+        if tokens[-1].sub != current_user.id:
+            raise APIException(
+                code=403,
+                message="Refresh token de outro usuário",
+                description="O refresh token informado não pertence ao "
+                            "usuário autenticado"
+            )
+
+    for token_data in tokens:
+        revoke(token_data, db)
+
+    return success_response(
+        data=None,
+        message="Logout realizado com sucesso"
+    )
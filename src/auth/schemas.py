@@ -38,6 +38,7 @@ class TokenPayload(BaseModel):
     """
     sub: int = None
     exp: int = None
+    jti: str = None
 
     class Config:
         """
@@ -1,8 +1,22 @@
 # Imports de terceiros
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 # Imports locais
+from core.database import match_any
+from core.fields import build_row, wants
 from src.clients.models import ClientModel
+from src.clients.schemas import ClientRow
+
+# Colunas de cada campo de ClientRow
+CLIENT_COLUMNS = {
+    "id": ClientModel.id,
+    "name": ClientModel.name,
+    "last_name": ClientModel.last_name,
+    "email": ClientModel.email,
+    "cpf": ClientModel.cpf,
+    "phone": ClientModel.phone,
+}
 
 
 def get_client_by_email(
@@ -54,3 +68,132 @@ def get_client_by_cpf(
         encontrado.
     """
     return db.query(ClientModel).filter(ClientModel.cpf == cpf).first()
+
+
+def list_clients(
+        db: Session,
+        name: str = None,
+        email: str = None,
+        page: int = 1,
+        limit: int = 10,
+        fields: frozenset = None
+):
+    """
+    Lista os clientes selecionando apenas as colunas de saída.
+
+    As linhas não passam pelo ORM (sem identity map), sendo convertidas
+    diretamente em ClientRow. Com fields, apenas as colunas dos campos
+    pedidos são lidas.
+
+    Args:
+        db (Session): Sessão do banco de dados.
+        name (str): Filtro parcial pelo nome do cliente (opcional).
+        email (str): Filtro parcial pelo email do cliente (opcional).
+        page (int): Número da página.
+        limit (int): Limite de resultados por página.
+        fields (frozenset): Campos de ClientRow a carregar (todos quando
+        None).
+    Returns:
+        list[ClientRow]: Clientes da página.
+    """
+    columns, query = _clients_query(name, email, page, limit, fields)
+
+    return [
+        build_row(ClientRow, dict(zip(columns, row)))
+        for row in db.execute(query)
+    ]
+
+
+def stream_clients(
+        db: Session,
+        name: str = None,
+        email: str = None,
+        page: int = 1,
+        limit: int = 10,
+        fields: frozenset = None,
+        batch_size: int = 1000
+):
+    """
+    Lê os clientes da listagem em lotes, para respostas em streaming.
+
+    Com yield_per, o PostgreSQL usa um cursor do lado do servidor, e apenas
+    um lote de linhas fica em memória por vez.
+
+    Args:
+        db (Session): Sessão do banco de dados.
+        name (str): Filtro parcial pelo nome do cliente (opcional).
+        email (str): Filtro parcial pelo email do cliente (opcional).
+        page (int): Número da página.
+        limit (int): Limite de resultados por página.
+        fields (frozenset): Campos de ClientRow a carregar (todos quando
+        None).
+        batch_size (int): Quantidade de clientes por lote.
+    Yields:
+        list[ClientRow]: Lote de clientes.
+    """
+    columns, query = _clients_query(name, email, page, limit, fields)
+    result = db.execute(query.execution_options(yield_per=batch_size))
+
+    for partition in result.partitions():
+        yield [
+            build_row(ClientRow, dict(zip(columns, row)))
+            for row in partition
+        ]
+
+
+def _clients_query(
+        name: str,
+        email: str,
+        page: int,
+        limit: int,
+        fields: frozenset
+):
+    """
+    Monta a consulta da listagem de clientes.
+
+    Args:
+        name (str): Filtro parcial pelo nome do cliente.
+        email (str): Filtro parcial pelo email do cliente.
+        page (int): Número da página.
+        limit (int): Limite de resultados por página.
+        fields (frozenset): Campos de ClientRow a carregar.
+    Returns:
+        tuple[dict, Select]: Colunas selecionadas, por campo de ClientRow,
+        e a consulta.
+    """
+    columns = {
+        name: column for name, column in CLIENT_COLUMNS.items()
+        if wants(fields, name)
+    }
+    query = select(*columns.values())
+
+    if name:
+        query = query.where(ClientModel.name.ilike(f"%{name}%"))
+
+    if email:
+        query = query.where(ClientModel.email.ilike(f"%{email}%"))
+
+    query = query.order_by(ClientModel.id) \
+        .offset((page - 1) * limit).limit(limit)
+
+    return columns, query
+
+
+def get_clients_by_ids(client_ids, db: Session):
+    """
+    Carrega vários clientes em uma única consulta.
+
+    Args:
+        client_ids (Iterable[int]): IDs dos clientes.
+        db (Session): Sessão do banco de dados.
+    Returns:
+        dict[int, ClientRow]: Clientes encontrados, por ID.
+    """
+    ids = set(client_ids)
+    if not ids:
+        return {}
+
+    query = select(*CLIENT_COLUMNS.values()) \
+        .where(match_any(ClientModel.id, ids, db))
+
+    return {row.id: ClientRow(*row) for row in db.execute(query)}
@@ -1,23 +1,31 @@
 # Imports do sistema
 import re
-from typing import Annotated
+from typing import Annotated, List
 
 # Imports de terceiros
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.params import Depends
 from sqlalchemy.orm import Session
 
 # Imports locais
-from core.database import get_db
-from core.exceptions import APIException, SuccessResponse
+from core.config import settings
+from core.database import get_db, get_read_db, stream_with_read_db
+from core.exceptions import APIException
+from core.fields import parse_fields, parse_ids
+from core.responses import streaming_response, success_response
+from src.auth.cache import user_cache
 from src.auth.crud import get_user_by_email
 from src.auth.jwt_auth import get_current_user
 from src.auth.models import UserModel
-from src.clients.crud import (get_client_by_cpf, get_client_by_email)
+from src.clients.crud import (get_client_by_cpf, get_client_by_email,
+                              get_clients_by_ids, list_clients,
+                              stream_clients)
 from src.clients.models import ClientModel
-from src.clients.schemas import ClientCreate, ClientOutput, ClientUpdate
+from src.clients.schemas import (ClientBatch, ClientCreate, ClientOutput,
+                                 ClientRow, ClientUpdate)
+from src.orders.crud import restore_order_stock
 from src.orders.models import OrderModel
-from src.products.crud import get_product_by_id
+from src.orders.schemas import StatusOrder
 
 router = APIRouter(
     prefix="/clients",
@@ -31,7 +39,7 @@ router = APIRouter(
     summary="Obter informações de um cliente específico"
 )
 async def get_client(
-        db: Session = Depends(get_db),
+        db: Session = Depends(get_read_db),
         current_user: Annotated[UserModel, Depends(get_current_user)] = None
 ):
     """
@@ -52,12 +60,52 @@ async def get_client(
             description="O cliente não foi encontrado"
         )
 
-    return SuccessResponse(
+    return success_response(
         data=ClientOutput(**client.__dict__),
         message="Dados do cliente retornado com sucesso"
     )
 
 
+@router.get(
+    "",
+    summary="Obter vários clientes pelos IDs, em uma única requisição"
+)
+def get_clients_batch(
+        ids: str,
+        db: Session = Depends(get_read_db),
+        current_user: Annotated[UserModel, Depends(get_current_user)] = None
+):
+    """
+    Obtém vários clientes pelos IDs (ex.: ?ids=3,1,2).
+
+    Os clientes são retornados na ordem dos IDs informados, e os IDs não
+    encontrados são listados em missing.
+
+    Args:
+        ids (str): IDs dos clientes separados por vírgula (no máximo
+        BATCH_MAX_IDS).
+        db (Session): Sessão do banco de dados.
+        current_user (UserModel): Cliente autenticado.
+    Returns:
+        SuccessResponse: Clientes encontrados e IDs não encontrados.
+    """
+    client_ids = parse_ids(ids, settings.BATCH_MAX_IDS)
+    clients = get_clients_by_ids(client_ids, db)
+
+    # Mantém a ordem dos IDs informados
+    batch = ClientBatch(items=[], missing=[])
+    for client_id in client_ids:
+        if client_id in clients:
+            batch.items.append(clients[client_id])
+        else:
+            batch.missing.append(client_id)
+
+    return success_response(
+        data=batch,
+        message="Clientes retornados com sucesso"
+    )
+
+
 @router.get(
     "/get_clients",
     summary="Listar todos os clientes, com suporte a"
@@ -68,36 +116,50 @@ async def get_clients(
         email: str = None,
         page: int = 1,
         limit: int = 10,
-        db: Session = Depends(get_db),
+        fields: str = None,
+        request: Request = None,
+        db: Session = Depends(get_read_db),
         current_user: Annotated[UserModel, Depends(get_current_user)] = None
 ):
     """
     Obtém uma lista de clientes.
 
+    Com limit acima de STREAMING_LIMIT_THRESHOLD, a lista é enviada em
+    streaming, lida do banco em lotes.
+
     Args:
         name (str): Nome do cliente a ser buscado.
         email (str): Email do cliente a ser buscado.
         page (int): Número da página para paginação.
         limit (int): Limite de resultados por página.
+        fields (str): Campos retornados, separados por vírgula (ex.:
+        "id,name,email"); todos quando não informado.
+        request (Request): Requisição.
         db (Session): Sessão do banco de dados.
         current_user (UserModel): Cliente autenticado.
     Returns:
         SuccessResponse: Resposta de sucesso com os dados
         dos clientes encontrados.
     """
-    clients = db.query(ClientModel)
-
-    if name:
-        clients = clients.filter(ClientModel.name.ilike(f"%{name}%"))
-
-    if email:
-        clients = clients.filter(ClientModel.email.ilike(f"%{email}%"))
+    selected = parse_fields(fields, ClientRow)
+
+    if limit > settings.STREAMING_LIMIT_THRESHOLD:
+        return streaming_response(
+            stream_with_read_db(
+                request, stream_clients, name, email, page, limit, selected,
+                settings.STREAMING_BATCH_SIZE
+            ),
+            message="Clientes retornados com sucesso",
+            output_type=List[ClientRow],
+            fields=selected
+        )
 
-    clients = clients.offset((page - 1) * limit).limit(limit).all()
+    clients = list_clients(db, name, email, page, limit, selected)
 
-    return SuccessResponse(
-        data=[ClientOutput(**client.__dict__) for client in clients],
-        message="Clientes retornados com sucesso"
+    return success_response(
+        data=clients,
+        message="Clientes retornados com sucesso",
+        fields=selected
     )
 
 
@@ -191,7 +253,7 @@ async def create_client(
     db.commit()
     db.refresh(client_model)
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Cliente criado com sucesso"
     )
@@ -309,7 +371,7 @@ async def update_client(
     db.commit()
     db.refresh(client_model)
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Cliente atualizado com sucesso"
     )
@@ -339,18 +401,15 @@ async def delete_client(
             description="O cliente não foi encontrado"
         )
 
-    # Buscar todos os pedidos associados ao cliente
-    orders = db.query(OrderModel).filter(
-        OrderModel.client_id == client_model.id
-    ).all()
-
-    if orders:
-        for order in orders:
-            # Reverter o estoque dos itens do pedido
-            for item in order.items:
-                product = get_product_by_id(item.product_id, db)
-                product.stock += item.quantity
-                db.add(product)
+    # Reverter o estoque dos itens dos pedidos do cliente (os entregues já
+    # saíram do estoque)
+    restore_order_stock(
+        [
+            OrderModel.client_id == client_model.id,
+            OrderModel.status != StatusOrder.ENTREGUE
+        ],
+        db
+    )
 
     # Verifica se o cliente está associado a algum usuário
     user = get_user_by_email(client_model.email, db)
@@ -359,11 +418,12 @@ async def delete_client(
     if user:
         db.delete(user)
         db.commit()
+        user_cache.discard(user.id)
 
     db.delete(client_model)
     db.commit()
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Cliente deletado com sucesso"
     )
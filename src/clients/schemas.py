@@ -1,5 +1,6 @@
 # Imports do sistema
-from typing import Optional
+from dataclasses import dataclass
+from typing import List, Optional
 
 # Imports de terceiros
 from pydantic import BaseModel, EmailStr, Field
@@ -65,3 +66,31 @@ class ClientOutput(BaseModel):
         Configurações adicionais para o modelo.
         """
         from_attributes = True
+
+
+@dataclass(slots=True)
+class ClientRow:
+    """
+    Dados de um cliente em listagens, lidos diretamente das colunas.
+
+    Estrutura leve (sem validação e sem rastreamento pela sessão) com os
+    mesmos campos de ClientOutput.
+    """
+    id: int
+    name: str
+    last_name: str
+    email: str
+    cpf: str
+    phone: str
+
+
+@dataclass(slots=True)
+class ClientBatch:
+    """
+    Resultado da busca de vários clientes pelos IDs.
+
+    Os clientes seguem a ordem dos IDs informados; os IDs sem cliente
+    correspondente são listados em missing.
+    """
+    items: List[ClientRow]
+    missing: List[int]
@@ -0,0 +1,115 @@
+# Imports do sistema
+import os
+from typing import Annotated
+
+# Imports de terceiros
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.config import settings
+from core.database import get_db, get_pool_metrics, get_replica_set
+from core.exceptions import APIException
+from core.responses import success_response
+from core.warmup import warmup
+from src.auth.jwt_auth import get_current_user
+from src.auth.models import UserModel
+from src.health.schemas import PoolOutput, ReadinessOutput, ReplicaOutput
+from src.jobs.crud import get_queue_stats
+from src.jobs.schemas import QueueOutput
+
+# /health/ready fica aberto para o orquestrador; as demais rotas expõem
+# detalhes da infraestrutura e exigem autenticação
+router = APIRouter(
+    prefix="/health",
+    tags=["health"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/pool", summary="Métricas do pool de conexões do worker")
+async def get_pool(
+        current_user: Annotated[UserModel, Depends(get_current_user)] = None
+):
+    """
+    Obtém as métricas do pool de conexões do worker que atendeu a requisição.
+
+    Args:
+        current_user (UserModel): Cliente autenticado.
+    Returns:
+        SuccessResponse: Estado atual do pool e contadores de eventos.
+    """
+    return success_response(
+        data=PoolOutput(**get_pool_metrics().snapshot()),
+        message="Métricas do pool retornadas com sucesso"
+    )
+
+
+@router.get("/replicas", summary="Estado das réplicas de leitura")
+async def get_replicas(
+        current_user: Annotated[UserModel, Depends(get_current_user)] = None
+):
+    """
+    Obtém o estado das réplicas de leitura no worker que atendeu a requisição.
+
+    Args:
+        current_user (UserModel): Cliente autenticado.
+    Returns:
+        SuccessResponse: Disponibilidade e falhas de cada réplica.
+    """
+    return success_response(
+        data=[
+            ReplicaOutput(**replica.status())
+            for replica in get_replica_set().replicas
+        ],
+        message="Estado das réplicas retornado com sucesso"
+    )
+
+
+@router.get("/jobs", summary="Profundidade da fila de tarefas")
+def get_jobs(
+        db: Session = Depends(get_db),
+        current_user: Annotated[UserModel, Depends(get_current_user)] = None
+):
+    """
+    Obtém a quantidade de tarefas na fila por estado.
+
+    Args:
+        db (Session): Sessão do banco de dados.
+        current_user (UserModel): Cliente autenticado.
+    Returns:
+        SuccessResponse: Contagem de tarefas e idade da mais antiga pronta.
+    """
+    return success_response(
+        data=QueueOutput(**get_queue_stats(db)),
+        message="Estado da fila de tarefas retornado com sucesso"
+    )
+
+
+@router.get("/ready", summary="Prontidão do worker para receber tráfego")
+async def get_ready():
+    """
+    Informa se o worker concluiu o aquecimento e pode receber tráfego.
+
+    Enquanto o aquecimento não termina, responde 503 para que o balanceador
+    de carga não direcione requisições a um worker frio.
+
+    Returns:
+        SuccessResponse: Resultado de cada etapa do aquecimento.
+    """
+    if not warmup.ready:
+        raise APIException(
+            code=503,
+            message="Serviço em aquecimento",
+            description="O worker ainda não concluiu o aquecimento",
+            headers={"Retry-After": str(
+                int(settings.WARMUP_RETRY_INTERVAL) or 1
+            )}
+        )
+
+    return success_response(
+        data=ReadinessOutput(
+            pid=os.getpid(), ready=True, steps=warmup.status()
+        ),
+        message="Worker pronto"
+    )
@@ -0,0 +1,75 @@
+# Imports do sistema
+from typing import List, Optional
+
+# Imports de terceiros
+from pydantic import BaseModel
+
+
+class PoolOutput(BaseModel):
+    """
+    Schema para as métricas do pool de conexões de um worker.
+    """
+    pid: int
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    timeout: float
+    connects: int
+    checkouts: int
+    checkins: int
+    invalidations: int
+    timeouts: int
+
+    class Config:
+        """
+        Configurações adicionais para o modelo.
+        """
+        from_attributes = True
+
+
+class WarmupStepOutput(BaseModel):
+    """
+    Schema para o resultado de uma etapa de aquecimento.
+    """
+    name: str
+    seconds: float
+    error: Optional[str]
+
+    class Config:
+        """
+        Configurações adicionais para o modelo.
+        """
+        from_attributes = True
+
+
+class ReadinessOutput(BaseModel):
+    """
+    Schema para o estado de prontidão de um worker.
+    """
+    pid: int
+    ready: bool
+    steps: List[WarmupStepOutput]
+
+    class Config:
+        """
+        Configurações adicionais para o modelo.
+        """
+        from_attributes = True
+
+
+class ReplicaOutput(BaseModel):
+    """
+    Schema para o estado de uma réplica de leitura.
+    """
+    host: Optional[str]
+    port: Optional[int]
+    database: Optional[str]
+    available: bool
+    failures: int
+
+    class Config:
+        """
+        Configurações adicionais para o modelo.
+        """
+        from_attributes = True
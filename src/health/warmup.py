@@ -0,0 +1,119 @@
+# Imports do sistema
+from typing import List
+
+# Imports locais
+from core.config import settings
+from core.database import SessionLocal, get_engine, get_replica_set
+from core.notifications import listener
+from core.responses import get_adapter
+from core.warmup import warmup
+from src.auth.crud import get_user_by_email
+from src.auth.jwt_auth import password_context
+from src.auth.schemas import Token
+from src.clients.crud import list_clients
+from src.clients.schemas import ClientBatch, ClientOutput, ClientRow
+from src.health.schemas import PoolOutput, ReplicaOutput
+from src.jobs.schemas import QueueOutput
+from src.orders.crud import list_orders
+from src.orders.models import OrderModel
+from src.orders.schemas import (ExpandedOrderOutput, ExpandedOrderRow,
+                                OrderOutput, OrderRow)
+from src.products.crud import get_product_by_id, list_products
+from src.products.cache import barcode_cache
+from src.products.schemas import (ProductBatch, ProductChanges,
+                                  ProductListing, ProductOutput, ProductRow,
+                                  ProductSummary, ProductSummaryBatch)
+from src.products.snapshot import product_snapshot
+
+# Tipos de resposta serializados pelas rotas
+RESPONSE_TYPES = (
+    List[ProductRow], ProductOutput, ProductBatch, ProductListing,
+    ProductChanges,
+    ProductSummary, ProductSummaryBatch,
+    List[ClientRow], ClientOutput, ClientBatch,
+    List[OrderRow], OrderOutput,
+    List[ExpandedOrderRow], ExpandedOrderOutput,
+    Token, PoolOutput, List[ReplicaOutput], QueueOutput,
+)
+
+
+def _session_factories() -> list:
+    return [SessionLocal] + [
+        replica.session_factory for replica in get_replica_set().replicas
+    ]
+
+
+@warmup.step("pool")
+def open_pool():
+    """
+    Abre as conexões mínimas do pool do primário e das réplicas.
+    """
+    engines = [get_engine()] + [
+        replica.engine for replica in get_replica_set().replicas
+    ]
+    for engine in engines:
+        connections = []
+        try:
+            for _ in range(engine.pool.size()):
+                connections.append(engine.connect())
+        finally:
+            for connection in connections:
+                connection.close()
+
+
+@warmup.step("password_hash")
+def load_password_hash():
+    """
+    Carrega o backend do bcrypt, inicializado no primeiro hash.
+    """
+    password_context.hash("warmup")
+
+
+@warmup.step("schemas")
+def build_response_adapters():
+    """
+    Cria os TypeAdapters das respostas antes da primeira requisição.
+    """
+    for output_type in RESPONSE_TYPES:
+        get_adapter(output_type)
+
+
+@warmup.step("queries")
+def compile_hot_queries():
+    """
+    Executa as consultas mais frequentes, preenchendo o cache de compilação
+    do SQLAlchemy de cada engine (e o cache de páginas do Postgres com a
+    primeira página de produtos).
+    """
+    for session_factory in _session_factories():
+        db = session_factory()
+        try:
+            get_user_by_email("", db)
+            get_product_by_id(0, db)
+            list_products(db)
+            list_clients(db)
+            list_orders([OrderModel.id == 0], db)
+        finally:
+            db.close()
+
+
+@warmup.step("barcode_cache")
+def wait_barcode_cache():
+    """
+    Aguarda a carga do mapa de códigos de barras, feita pela conexão de
+    escuta do worker (quando disponível).
+    """
+    if settings.BARCODE_CACHE_ENABLED and listener.enabled \
+            and not barcode_cache.synced:
+        raise RuntimeError("Mapa de códigos de barras ainda não carregado")
+
+
+@warmup.step("product_snapshot")
+def wait_product_snapshot():
+    """
+    Aguarda a carga da cópia em memória do catálogo, feita pela conexão de
+    escuta do worker (quando disponível).
+    """
+    if settings.PRODUCTS_SNAPSHOT_ENABLED and listener.enabled \
+            and not product_snapshot.synced:
+        raise RuntimeError("Cópia do catálogo ainda não carregada")
@@ -0,0 +1,143 @@
+# Imports do sistema
+from datetime import datetime, timedelta
+
+# Imports de terceiros
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.config import settings
+from src.idempotency.models import IdempotencyKeyModel
+
+
+def get_idempotency_key(user_id: int, key: str, db: Session):
+    """
+    Obtém o registro de uma chave de idempotência do usuário.
+
+    Args:
+        user_id (int): ID do usuário.
+        key (str): Valor do cabeçalho Idempotency-Key.
+        db (Session): Sessão do banco de dados.
+    Returns:
+        Optional[IdempotencyKeyModel]: Registro da chave ou None.
+    """
+    return db.query(IdempotencyKeyModel).filter(
+        IdempotencyKeyModel.user_id == user_id,
+        IdempotencyKeyModel.key == key
+    ).first()
+
+
+def reserve_idempotency_key(
+        user_id: int,
+        key: str,
+        request_hash: str,
+        db: Session
+):
+    """
+    Reserva uma chave de idempotência para a requisição atual.
+
+    Chaves expiradas, ou cuja requisição original foi abandonada há mais de
+    IDEMPOTENCY_LOCK_TIMEOUT segundos, são reaproveitadas.
+
+    Args:
+        user_id (int): ID do usuário.
+        key (str): Valor do cabeçalho Idempotency-Key.
+        request_hash (str): Impressão digital da requisição.
+        db (Session): Sessão do banco de dados.
+    Returns:
+        tuple[Optional[IdempotencyKeyModel], bool]: Registro da chave (None
+        se a reserva concorrente já foi liberada) e se ela foi reservada
+        por esta requisição.
+    """
+    now = datetime.now()
+    record = get_idempotency_key(user_id, key, db)
+
+    if record:
+        expired = record.expires_at <= now
+        abandoned = (
+            record.status_code is None
+            and record.created_at + timedelta(
+                seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT
+            ) <= now
+        )
+        if not expired and not abandoned:
+            return record, False
+
+        db.delete(record)
+        db.commit()
+
+    record = IdempotencyKeyModel(
+        user_id=user_id,
+        key=key,
+        request_hash=request_hash,
+        created_at=now,
+        expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS)
+    )
+
+    try:
+        db.add(record)
+        db.commit()
+    except IntegrityError:
+        # Outra requisição com a mesma chave reservou primeiro (o registro
+        # pode já ter sido liberado quando a consulta é feita)
+        db.rollback()
+        return get_idempotency_key(user_id, key, db), False
+
+    return record, True
+
+
+def save_idempotent_response(
+        record_id: int,
+        status_code: int,
+        content_type: str,
+        body: bytes,
+        db: Session
+):
+    """
+    Armazena a resposta da requisição original de uma chave.
+
+    Args:
+        record_id (int): ID do registro da chave.
+        status_code (int): Código HTTP da resposta.
+        content_type (str): Tipo de conteúdo da resposta.
+        body (bytes): Corpo da resposta.
+        db (Session): Sessão do banco de dados.
+    """
+    db.query(IdempotencyKeyModel).filter(
+        IdempotencyKeyModel.id == record_id
+    ).update({
+        IdempotencyKeyModel.status_code: status_code,
+        IdempotencyKeyModel.content_type: content_type,
+        IdempotencyKeyModel.response_body: body,
+    })
+    db.commit()
+
+
+def release_idempotency_key(record_id: int, db: Session):
+    """
+    Libera uma chave cuja requisição falhou, permitindo novas tentativas.
+
+    Args:
+        record_id (int): ID do registro da chave.
+        db (Session): Sessão do banco de dados.
+    """
+    db.query(IdempotencyKeyModel).filter(
+        IdempotencyKeyModel.id == record_id
+    ).delete()
+    db.commit()
+
+
+def purge_expired_idempotency_keys(db: Session) -> int:
+    """
+    Remove as chaves de idempotência expiradas.
+
+    Args:
+        db (Session): Sessão do banco de dados.
+    Returns:
+        int: Quantidade de chaves removidas.
+    """
+    deleted = db.query(IdempotencyKeyModel).filter(
+        IdempotencyKeyModel.expires_at <= datetime.now()
+    ).delete()
+    db.commit()
+    return deleted
@@ -0,0 +1,220 @@
+# Imports do sistema
+import hashlib
+
+# Imports de terceiros
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.responses import Response
+
+# Imports locais
+from core.database import SessionLocal
+from core.rate_limit import token_subject
+from src.idempotency.crud import (release_idempotency_key,
+                                  reserve_idempotency_key,
+                                  save_idempotent_response)
+
+IDEMPOTENT_METHODS = {"POST"}
+
+# Respostas que não são armazenadas e liberam a chave para uma nova
+# tentativa (além das 5xx): autenticação, permissão, método, conflito,
+# validação da requisição e limite de requisições são, em geral,
+# respondidos antes de a rota processar a requisição, ou dependem de um
+# estado que muda
+RELEASED_STATUSES = {401, 403, 405, 409, 422, 429}
+
+
+def _error(code: int, message: str, description: str) -> Response:
+    return ORJSONResponse(
+        status_code=code,
+        content={
+            "status": "error",
+            "message": message,
+            "code": code,
+            "description": description,
+            "data": {}
+        }
+    )
+
+
+def _reserve(user_id: int, key: str, request_hash: str):
+    db = SessionLocal()
+    try:
+        record, created = reserve_idempotency_key(
+            user_id, key, request_hash, db
+        )
+        if record is None:
+            return None
+        return {
+            "id": record.id,
+            "created": created,
+            "request_hash": record.request_hash,
+            "status_code": record.status_code,
+            "content_type": record.content_type,
+            "body": record.response_body,
+        }
+    finally:
+        db.close()
+
+
+def _save(record_id: int, status_code: int, content_type: str, body: bytes):
+    db = SessionLocal()
+    try:
+        save_idempotent_response(
+            record_id, status_code, content_type, body, db
+        )
+    finally:
+        db.close()
+
+
+def _release(record_id: int):
+    db = SessionLocal()
+    try:
+        release_idempotency_key(record_id, db)
+    finally:
+        db.close()
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+class IdempotencyMiddleware:
+    """
+    Middleware ASGI que torna idempotentes os POSTs com Idempotency-Key.
+
+    A primeira requisição de um usuário com uma chave é processada e sua
+    resposta é armazenada por IDEMPOTENCY_TTL_SECONDS; as repetições com a
+    mesma chave recebem a resposta original, sem executar a rota novamente
+    (sem alterar pedidos ou estoque). Respostas 5xx e as de
+    RELEASED_STATUSES não são armazenadas e liberam a chave para uma nova
+    tentativa.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or \
+                scope["method"] not in IDEMPOTENT_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get("idempotency-key")
+        subject = token_subject(headers.get("authorization")) if key else None
+
+        # Sem chave ou sem usuário autenticado, segue o fluxo normal
+        if not subject:
+            await self.app(scope, receive, send)
+            return
+
+        if len(key) > 255:
+            response = _error(
+                400,
+                "Idempotency-Key inválida",
+                "A chave de idempotência deve ter até 255 caracteres"
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        request_hash = hashlib.sha256(
+            b"\n".join((
+                scope["method"].encode(),
+                scope["path"].encode(),
+                scope.get("query_string", b""),
+                body,
+            ))
+        ).hexdigest()
+
+        record = await run_in_threadpool(
+            _reserve, int(subject), key, request_hash
+        )
+
+        if record is None:
+            # A reserva concorrente que impediu esta foi liberada antes de
+            # ser consultada: o cliente pode repetir a requisição
+            response = _error(
+                409,
+                "Requisição em processamento",
+                "A requisição original com esta chave de "
+                "idempotência ainda está em processamento"
+            )
+            await response(scope, receive, send)
+            return
+
+        if not record["created"]:
+            if record["request_hash"] != request_hash:
+                response = _error(
+                    422,
+                    "Idempotency-Key reutilizada",
+                    "A chave de idempotência já foi utilizada em uma "
+                    "requisição diferente"
+                )
+            elif record["status_code"] is None:
+                response = _error(
+                    409,
+                    "Requisição em processamento",
+                    "A requisição original com esta chave de "
+                    "idempotência ainda está em processamento"
+                )
+            else:
+                response = Response(
+                    content=record["body"],
+                    status_code=record["status_code"],
+                    media_type=record["content_type"],
+                    headers={"Idempotent-Replayed": "true"}
+                )
+            await response(scope, receive, send)
+            return
+
+        consumed = False
+
+        async def replay_receive():
+            # Entrega o corpo já lido à aplicação e depois repassa os
+            # demais eventos (ex.: desconexão do cliente)
+            nonlocal consumed
+            if not consumed:
+                consumed = True
+                return {
+                    "type": "http.request", "body": body, "more_body": False
+                }
+            return await receive()
+
+        captured = {"status": 500, "content_type": None, "body": []}
+
+        async def send_capture(message):
+            if message["type"] == "http.response.start":
+                captured["status"] = message["status"]
+                captured["content_type"] = Headers(
+                    raw=message["headers"]
+                ).get("content-type")
+            elif message["type"] == "http.response.body":
+                captured["body"].append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, send_capture)
+        except Exception:
+            await run_in_threadpool(_release, record["id"])
+            raise
+
+        # Só a resposta de uma rota encontrada é armazenada (o roteador
+        # registra a rota no scope); redirecionamentos de barra final e
+        # 404 de caminhos inexistentes não chegam a nenhuma rota
+        if "route" not in scope or captured["status"] >= 500 \
+                or captured["status"] in RELEASED_STATUSES:
+            await run_in_threadpool(_release, record["id"])
+        else:
+            await run_in_threadpool(
+                _save,
+                record["id"],
+                captured["status"],
+                captured["content_type"],
+                b"".join(captured["body"])
+            )
@@ -0,0 +1,31 @@
+# Imports de terceiros
+from sqlalchemy import (Column, DateTime, ForeignKey, Integer, LargeBinary,
+                        String, UniqueConstraint)
+
+# Imports locais
+from core.database import Base
+
+
+class IdempotencyKeyModel(Base):
+    """
+    Modelo das chaves de idempotência e das respostas armazenadas.
+    """
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("user_id", "key", name="uq_idempotency_user_key"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    key = Column(String(255), nullable=False)
+    request_hash = Column(String(64), nullable=False)
+    # Nulo enquanto a requisição original está em processamento
+    status_code = Column(Integer, nullable=True)
+    content_type = Column(String, nullable=True)
+    response_body = Column(LargeBinary, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -0,0 +1,225 @@
+# Imports do sistema
+from datetime import datetime, timedelta
+
+# Imports de terceiros
+from sqlalchemy import and_, func, or_, select, text, update
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.config import settings
+from src.jobs.models import JobModel
+from src.jobs.schemas import StatusJob
+
+# Chave do advisory lock que serializa o agendamento das tarefas periódicas
+# entre os workers
+SCHEDULE_LOCK_KEY = 7301
+
+
+def enqueue_job(
+        name: str,
+        payload: dict,
+        db: Session,
+        delay: float = 0,
+        max_attempts: int = None
+) -> JobModel:
+    """
+    Adiciona uma tarefa à fila na transação da sessão informada.
+
+    A tarefa só fica visível para os workers após o commit do chamador,
+    junto com as demais alterações da requisição.
+
+    Args:
+        name (str): Nome do handler que executará a tarefa.
+        payload (dict): Dados da tarefa (serializáveis em JSON).
+        db (Session): Sessão do banco de dados.
+        delay (float): Atraso, em segundos, antes da primeira execução.
+        max_attempts (int): Limite de tentativas (padrão JOBS_MAX_ATTEMPTS).
+    Returns:
+        JobModel: Tarefa adicionada à sessão.
+    """
+    now = datetime.now()
+    job = JobModel(
+        name=name,
+        payload=payload,
+        status=StatusJob.QUEUED,
+        attempts=0,
+        max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+        run_at=now + timedelta(seconds=delay),
+        created_at=now
+    )
+    db.add(job)
+    return job
+
+
+def has_pending_job(name: str, db: Session) -> bool:
+    """
+    Verifica se existe uma tarefa pendente ou em execução com o nome.
+
+    Args:
+        name (str): Nome da tarefa.
+        db (Session): Sessão do banco de dados.
+    Returns:
+        bool: True se a tarefa já estiver na fila.
+    """
+    return db.execute(
+        select(
+            select(JobModel.id)
+            .where(
+                JobModel.name == name,
+                JobModel.status.in_((StatusJob.QUEUED, StatusJob.RUNNING))
+            )
+            .exists()
+        )
+    ).scalar()
+
+
+def lock_job_schedule(db: Session):
+    """
+    Serializa o agendamento de tarefas entre os workers até o fim da
+    transação, para que a verificação de tarefas pendentes e a inclusão na
+    fila não sejam intercaladas por outro processo.
+
+    Args:
+        db (Session): Sessão do banco de dados.
+    """
+    # Advisory locks existem apenas no PostgreSQL
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"),
+            {"key": SCHEDULE_LOCK_KEY}
+        )
+
+
+def claim_jobs(limit: int, db: Session) -> list:
+    """
+    Reserva as próximas tarefas prontas para execução.
+
+    Usa FOR UPDATE SKIP LOCKED, de modo que vários workers (no mesmo ou em
+    outros processos) consomem a fila sem disputar as mesmas linhas. Tarefas
+    em execução há mais de JOBS_VISIBILITY_TIMEOUT segundos (worker
+    interrompido) voltam a ser elegíveis.
+
+    Args:
+        limit (int): Quantidade máxima de tarefas reservadas.
+        db (Session): Sessão do banco de dados.
+    Returns:
+        list[Row]: Tarefas reservadas (id, name, payload, attempts e
+        max_attempts).
+    """
+    now = datetime.now()
+    stale = now - timedelta(seconds=settings.JOBS_VISIBILITY_TIMEOUT)
+
+    ready = (
+        select(JobModel.id)
+        .where(or_(
+            and_(
+                JobModel.status == StatusJob.QUEUED,
+                JobModel.run_at <= now
+            ),
+            and_(
+                JobModel.status == StatusJob.RUNNING,
+                JobModel.locked_at < stale
+            )
+        ))
+        .order_by(JobModel.run_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    jobs = db.execute(
+        update(JobModel)
+        .where(JobModel.id.in_(ready.scalar_subquery()))
+        .values(
+            status=StatusJob.RUNNING,
+            locked_at=now,
+            attempts=JobModel.attempts + 1
+        )
+        .returning(
+            JobModel.id,
+            JobModel.name,
+            JobModel.payload,
+            JobModel.attempts,
+            JobModel.max_attempts
+        )
+    ).all()
+    db.commit()
+
+    return jobs
+
+
+def complete_job(job_id: int, db: Session):
+    """
+    Remove da fila uma tarefa executada com sucesso.
+
+    Args:
+        job_id (int): ID da tarefa.
+        db (Session): Sessão do banco de dados.
+    """
+    db.query(JobModel).filter(JobModel.id == job_id).delete()
+    db.commit()
+
+
+def fail_job(job_id: int, attempts: int, max_attempts: int, error: str,
+             db: Session):
+    """
+    Registra a falha de uma tarefa, reagendando-a com backoff exponencial.
+
+    Após max_attempts tentativas, a tarefa permanece com status "failed"
+    para inspeção.
+
+    Args:
+        job_id (int): ID da tarefa.
+        attempts (int): Tentativas já realizadas (incluindo a atual).
+        max_attempts (int): Limite de tentativas da tarefa.
+        error (str): Descrição do erro.
+        db (Session): Sessão do banco de dados.
+    """
+    values = {"last_error": error, "locked_at": None}
+
+    if attempts >= max_attempts:
+        values["status"] = StatusJob.FAILED
+    else:
+        delay = min(
+            settings.JOBS_BACKOFF_BASE * 2 ** (attempts - 1),
+            settings.JOBS_BACKOFF_MAX
+        )
+        values["status"] = StatusJob.QUEUED
+        values["run_at"] = datetime.now() + timedelta(seconds=delay)
+
+    db.query(JobModel).filter(JobModel.id == job_id).update(values)
+    db.commit()
+
+
+def get_queue_stats(db: Session) -> dict:
+    """
+    Obtém a profundidade da fila em uma única consulta.
+
+    Args:
+        db (Session): Sessão do banco de dados.
+    Returns:
+        dict: Quantidade de tarefas por status, tarefas prontas e a idade
+        (em segundos) da tarefa pronta mais antiga.
+    """
+    now = datetime.now()
+    is_ready = and_(
+        JobModel.status == StatusJob.QUEUED, JobModel.run_at <= now
+    )
+
+    row = db.execute(
+        select(
+            func.count().filter(JobModel.status == StatusJob.QUEUED),
+            func.count().filter(JobModel.status == StatusJob.RUNNING),
+            func.count().filter(JobModel.status == StatusJob.FAILED),
+            func.count().filter(is_ready),
+            func.min(JobModel.run_at).filter(is_ready)
+        )
+    ).one()
+
+    return {
+        "queued": row[0],
+        "running": row[1],
+        "failed": row[2],
+        "ready": row[3],
+        "oldest_ready_seconds": (now - row[4]).total_seconds()
+        if row[4] else None,
+    }
@@ -0,0 +1,125 @@
+# Imports do sistema
+import logging
+from datetime import date, datetime, timedelta
+
+# Imports de terceiros
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.compression import remove_file
+from core.config import settings
+from src.auth.crud import purge_expired_revoked_tokens
+from src.idempotency.crud import purge_expired_idempotency_keys
+from src.jobs.worker import job_handler
+from src.orders.partitions import (add_months, archive_order_partitions,
+                                   ensure_order_partitions, month_start)
+from src.products.crud import purge_product_tombstones
+
+logger = logging.getLogger(__name__)
+
+
+@job_handler("remove_files")
+def remove_files(payload: dict, db: Session):
+    """
+    Remove arquivos estáticos e suas versões pré-comprimidas.
+
+    Args:
+        payload (dict): {"paths": [caminhos dos arquivos]}.
+        db (Session): Sessão do banco de dados (não utilizada).
+    """
+    for path in payload["paths"]:
+        remove_file(path)
+
+
+@job_handler(
+    "maintain_order_partitions",
+    every=settings.ORDERS_PARTITION_MAINTENANCE_INTERVAL
+)
+def maintain_order_partitions(payload: dict, db: Session):
+    """
+    Cria as partições mensais futuras de pedidos e arquiva as antigas.
+
+    Args:
+        payload (dict): Não utilizado.
+        db (Session): Sessão do banco de dados.
+    """
+    # Tabelas particionadas existem apenas no PostgreSQL
+    if db.get_bind().dialect.name != "postgresql":
+        return
+
+    current = month_start(date.today())
+    created = ensure_order_partitions(
+        db, current, settings.ORDERS_PARTITIONS_AHEAD + 1
+    )
+
+    archived = []
+    if settings.ORDERS_RETENTION_MONTHS:
+        archived = archive_order_partitions(
+            db,
+            add_months(current, -settings.ORDERS_RETENTION_MONTHS),
+            settings.ORDERS_ARCHIVE_TABLESPACE or None
+        )
+
+    db.commit()
+
+    if created or archived:
+        logger.info(
+            "Partições de pedidos criadas: %s; arquivadas: %s",
+            created, archived
+        )
+
+
+@job_handler(
+    "purge_revoked_tokens",
+    every=settings.TOKEN_DENYLIST_REBUILD_INTERVAL
+)
+def purge_revoked_tokens(payload: dict, db: Session):
+    """
+    Remove os tokens revogados que já expiraram.
+
+    Args:
+        payload (dict): Não utilizado.
+        db (Session): Sessão do banco de dados.
+    """
+    deleted = purge_expired_revoked_tokens(db)
+    if deleted:
+        logger.info("Tokens revogados expirados removidos: %s", deleted)
+
+
+@job_handler(
+    "purge_idempotency_keys",
+    every=settings.IDEMPOTENCY_PURGE_INTERVAL
+)
+def purge_idempotency_keys(payload: dict, db: Session):
+    """
+    Remove as chaves de idempotência expiradas.
+
+    Args:
+        payload (dict): Não utilizado.
+        db (Session): Sessão do banco de dados.
+    """
+    deleted = purge_expired_idempotency_keys(db)
+    if deleted:
+        logger.info("Chaves de idempotência expiradas removidas: %s", deleted)
+
+
+@job_handler(
+    "purge_product_tombstones",
+    every=settings.PRODUCTS_TOMBSTONE_PURGE_INTERVAL
+)
+def purge_deleted_products(payload: dict, db: Session):
+    """
+    Remove os marcadores de produtos e imagens excluídos há mais tempo que
+    o prazo de retenção da sincronização incremental.
+
+    Args:
+        payload (dict): Não utilizado.
+        db (Session): Sessão do banco de dados.
+    """
+    deleted = purge_product_tombstones(
+        db,
+        datetime.now()
+        - timedelta(days=settings.PRODUCTS_TOMBSTONE_RETENTION_DAYS)
+    )
+    if deleted:
+        logger.info("Produtos excluídos removidos: %s", deleted)
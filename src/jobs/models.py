@@ -0,0 +1,30 @@
+# Imports de terceiros
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+
+# Imports locais
+from core.database import Base
+from src.jobs.schemas import StatusJob
+
+
+class JobModel(Base):
+    """
+    Modelo de tarefa da fila de execução em segundo plano.
+
+    Tarefas concluídas são removidas da tabela; permanecem apenas as
+    pendentes, em execução e as que esgotaram as tentativas.
+    """
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_run_at", "status", "run_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String, nullable=False, default=StatusJob.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime, nullable=False)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False)
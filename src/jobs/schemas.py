@@ -0,0 +1,32 @@
+# Imports do sistema
+from enum import Enum
+from typing import Optional
+
+# Imports de terceiros
+from pydantic import BaseModel
+
+
+class StatusJob(str, Enum):
+    """
+    Enumeração de status das tarefas da fila.
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+class QueueOutput(BaseModel):
+    """
+    Schema para o estado da fila de tarefas.
+    """
+    queued: int
+    running: int
+    failed: int
+    ready: int
+    oldest_ready_seconds: Optional[float]
+
+    class Config:
+        """
+        Configurações adicionais para o modelo.
+        """
+        from_attributes = True
@@ -0,0 +1,207 @@
+# Imports do sistema
+import argparse
+import logging
+import signal
+import threading
+import traceback
+
+# Imports locais
+from core.config import settings
+from core.database import SessionLocal
+from src.jobs.crud import (claim_jobs, complete_job, enqueue_job, fail_job,
+                           has_pending_job, lock_job_schedule)
+
+logger = logging.getLogger(__name__)
+
+# Handlers registrados por nome de tarefa
+HANDLERS = {}
+
+# Intervalo, em segundos, das tarefas periódicas
+PERIODIC = {}
+
+
+def job_handler(name: str, every: float = None):
+    """
+    Registra uma função como handler de um tipo de tarefa.
+
+    O handler recebe o payload da tarefa e uma sessão do banco de dados,
+    cujo commit é responsabilidade do próprio handler. Tarefas periódicas
+    (every) são agendadas na inicialização dos workers e reagendadas ao fim
+    de cada execução: após o sucesso ou após a última tentativa com falha.
+
+    Args:
+        name (str): Nome da tarefa.
+        every (float): Intervalo, em segundos, entre execuções (opcional).
+    Returns:
+        Callable: Decorador que registra o handler.
+    """
+    def decorator(function):
+        HANDLERS[name] = function
+        if every:
+            PERIODIC[name] = every
+        return function
+
+    return decorator
+
+
+def run_job(job) -> bool:
+    """
+    Executa uma tarefa reservada e registra o resultado.
+
+    Args:
+        job (Row): Tarefa retornada por claim_jobs.
+    Returns:
+        bool: True se a tarefa foi concluída com sucesso.
+    """
+    db = SessionLocal()
+    try:
+        handler = HANDLERS.get(job.name)
+        if handler is None:
+            raise LookupError(f"Nenhum handler registrado para {job.name}")
+
+        handler(job.payload, db)
+
+        # A próxima execução é agendada no mesmo commit da conclusão
+        if job.name in PERIODIC:
+            enqueue_job(job.name, job.payload, db, delay=PERIODIC[job.name])
+        complete_job(job.id, db)
+        return True
+    except Exception:
+        db.rollback()
+        logger.exception("Falha na tarefa %s (%s)", job.id, job.name)
+
+        # Esgotadas as tentativas, a tarefa fica com status "failed", mas a
+        # cadeia de uma tarefa periódica continua (mesmo commit da falha)
+        if job.name in PERIODIC and job.attempts >= job.max_attempts:
+            enqueue_job(job.name, job.payload, db, delay=PERIODIC[job.name])
+        fail_job(
+            job.id, job.attempts, job.max_attempts,
+            traceback.format_exc(limit=5), db
+        )
+        return False
+    finally:
+        db.close()
+
+
+def run_once(batch_size: int = None) -> int:
+    """
+    Reserva e executa um lote de tarefas prontas.
+
+    Args:
+        batch_size (int): Tamanho do lote (padrão JOBS_BATCH_SIZE).
+    Returns:
+        int: Quantidade de tarefas processadas.
+    """
+    db = SessionLocal()
+    try:
+        jobs = claim_jobs(batch_size or settings.JOBS_BATCH_SIZE, db)
+    finally:
+        db.close()
+
+    for job in jobs:
+        run_job(job)
+
+    return len(jobs)
+
+
+def schedule_periodic_jobs():
+    """
+    Agenda as tarefas periódicas que ainda não estão na fila.
+
+    Os workers iniciados ao mesmo tempo agendam sob um advisory lock, para
+    que cada tarefa periódica tenha uma única cadeia de execuções.
+    """
+    db = SessionLocal()
+    try:
+        lock_job_schedule(db)
+        for name in PERIODIC:
+            if not has_pending_job(name, db):
+                enqueue_job(name, {}, db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Falha ao agendar as tarefas periódicas")
+    finally:
+        db.close()
+
+
+class JobWorker:
+    """
+    Conjunto de threads que consomem a fila de tarefas.
+
+    Pode ser executado dentro do processo da API (JOBS_RUN_IN_APP) ou ao
+    lado dela, com "python -m src.jobs.worker".
+    """
+    def __init__(self, threads: int = None):
+        self.threads_count = threads or settings.JOBS_WORKERS
+        self.stop_event = threading.Event()
+        self.threads = []
+
+    def _loop(self):
+        while not self.stop_event.is_set():
+            try:
+                processed = run_once()
+            except Exception:
+                logger.exception("Falha ao consultar a fila de tarefas")
+                processed = 0
+
+            # Com a fila vazia, aguarda antes de consultar novamente
+            if not processed:
+                self.stop_event.wait(settings.JOBS_POLL_INTERVAL)
+
+    def start(self):
+        # Garante que os handlers estejam registrados
+        import src.jobs.handlers  # noqa: F401
+
+        schedule_periodic_jobs()
+
+        self.stop_event.clear()
+        self.threads = [
+            threading.Thread(
+                target=self._loop, name=f"job-worker-{index}", daemon=True
+            )
+            for index in range(self.threads_count)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """
+        Sinaliza a parada e aguarda as tarefas em execução terminarem.
+
+        Args:
+            timeout (float): Tempo máximo de espera por thread.
+        """
+        self.stop_event.set()
+        for thread in self.threads:
+            thread.join(timeout=timeout)
+        self.threads = []
+
+
+def main():
+    """
+    Executa os workers da fila em um processo separado da API.
+    """
+    parser = argparse.ArgumentParser(
+        description="Executa os workers da fila de tarefas"
+    )
+    parser.add_argument("--threads", type=int, default=settings.JOBS_WORKERS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    worker = JobWorker(args.threads)
+    stopped = threading.Event()
+
+    def handle_signal(signum, frame):
+        stopped.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    worker.start()
+    stopped.wait()
+    worker.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,20 @@
+# Imports do sistema
+from collections import defaultdict
+from datetime import datetime
+
 # Imports de terceiros
+from sqlalchemy import and_, exists, func, select, tuple_, update
 from sqlalchemy.orm import Session, joinedload
 
 # Imports locais
-from src.orders.models import OrderModel
+from core.fields import build_row, wants
+from core.money import from_cents
+from src.orders.models import OrderItemModel, OrderModel
+from src.orders.schemas import (ExpandedOrderItemRow, ExpandedOrderRow,
+                                OrderItemRow, OrderRow)
+from src.products.crud import get_products_by_ids
+from src.products.events import notify_stock
+from src.products.models import ProductModel
 
 
 def get_order_by_id(order_id: int, db: Session):
@@ -52,3 +64,213 @@ def get_all_orders_detail(db: Session):
         .options(joinedload(OrderModel.items))
         .all()
     )
+
+
+def restore_order_stock(conditions: list, db: Session):
+    """
+    Devolve ao estoque os itens dos pedidos que atendem às condições.
+
+    As quantidades são somadas por produto e aplicadas em um único UPDATE,
+    independentemente da quantidade de pedidos e itens. O commit fica a
+    cargo do chamador (e, com ele, a notificação do novo estoque).
+
+    Args:
+        conditions (list): Condições aplicadas à tabela de pedidos.
+        db (Session): A sessão do banco de dados.
+    """
+    quantities = (
+        select(
+            OrderItemModel.product_id,
+            func.sum(OrderItemModel.quantity).label("quantity")
+        )
+        .where(
+            OrderItemModel.order_id.in_(
+                select(OrderModel.id).where(*conditions)
+            )
+        )
+        .group_by(OrderItemModel.product_id)
+        .subquery()
+    )
+
+    restored = db.execute(
+        update(ProductModel)
+        .where(ProductModel.id == quantities.c.product_id)
+        .values(stock=ProductModel.stock + quantities.c.quantity)
+        .returning(ProductModel.id, ProductModel.stock)
+        .execution_options(synchronize_session="fetch")
+    )
+
+    # O UPDATE em lote não passa pelo flush da sessão; os workers são
+    # notificados do novo estoque diretamente
+    notify_stock(restored.all(), db)
+
+
+def category_condition(category: str):
+    """
+    Monta a condição de pedidos com ao menos um produto da categoria.
+
+    Args:
+        category (str): Seção dos produtos.
+    Returns:
+        ColumnElement: Condição EXISTS aplicável a consultas de pedidos.
+    """
+    return exists(
+        select(OrderItemModel.id)
+        .join(ProductModel, ProductModel.id == OrderItemModel.product_id)
+        .where(
+            OrderItemModel.order_id == OrderModel.id,
+            func.upper(ProductModel.section) == category.upper()
+        )
+    )
+
+
+def has_orders(conditions: list, db: Session) -> bool:
+    """
+    Verifica se existe ao menos um pedido que atenda às condições.
+
+    Args:
+        conditions (list): Condições aplicadas à tabela de pedidos.
+        db (Session): A sessão do banco de dados.
+    Returns:
+        bool: True se existir algum pedido.
+    """
+    return db.execute(
+        select(exists(select(OrderModel.id).where(*conditions)))
+    ).scalar()
+
+
+def list_orders(
+        conditions: list,
+        db: Session,
+        start: datetime = None,
+        end: datetime = None,
+        fields: frozenset = None,
+        expand_products: bool = False
+):
+    """
+    Lista os pedidos e seus itens selecionando apenas as colunas de saída.
+
+    São executadas duas consultas (pedidos com seus totais e itens), sem
+    passar pelo ORM. Os totais são somados no banco em centavos inteiros,
+    sem acúmulo de erros de ponto flutuante.
+    O período (start/end) também é aplicado diretamente aos itens, para que
+    o PostgreSQL descarte as partições mensais fora dele.
+    Com fields, os totais só são agregados, e os itens só são consultados,
+    quando pedidos. Com expand_products, os produtos de todos os itens são
+    carregados em lote (ver load_item_products).
+
+    Args:
+        conditions (list): Condições aplicadas à tabela de pedidos.
+        db (Session): A sessão do banco de dados.
+        start (datetime): Início do período de criação (opcional).
+        end (datetime): Fim do período de criação (opcional).
+        fields (frozenset): Campos de OrderRow a carregar (todos quando
+        None).
+        expand_products (bool): Inclui os dados do produto em cada item.
+    Returns:
+        list[OrderRow]: Pedidos que atendem às condições
+        (ExpandedOrderRow com expand_products).
+    """
+    item_conditions = [
+        tuple_(OrderItemModel.order_id, OrderItemModel.created_at).in_(
+            select(OrderModel.id, OrderModel.created_at).where(*conditions)
+        )
+    ]
+    if start:
+        item_conditions.append(OrderItemModel.created_at >= start)
+    if end:
+        item_conditions.append(OrderItemModel.created_at <= end)
+
+    with_items = wants(fields, "items")
+    columns = {
+        name: getattr(OrderModel, name)
+        for name in ("id", "client_id", "status", "created_at")
+        if wants(fields, name) or (name == "id" and with_items)
+    }
+    query = select(*columns.values()).select_from(OrderModel)
+
+    if wants(fields, "total_itens", "total_price"):
+        # Totais de cada pedido somados no banco, em centavos inteiros
+        totals = (
+            select(
+                OrderItemModel.order_id,
+                OrderItemModel.created_at,
+                func.sum(OrderItemModel.quantity).label("total_itens"),
+                func.sum(
+                    OrderItemModel.quantity * OrderItemModel.unit_price_cents
+                ).label("total_cents")
+            )
+            .where(*item_conditions)
+            .group_by(OrderItemModel.order_id, OrderItemModel.created_at)
+            .subquery()
+        )
+        columns["total_itens"] = func.coalesce(totals.c.total_itens, 0)
+        columns["total_price"] = func.coalesce(totals.c.total_cents, 0)
+        query = select(*columns.values()).select_from(OrderModel) \
+            .outerjoin(totals, and_(
+                totals.c.order_id == OrderModel.id,
+                totals.c.created_at == OrderModel.created_at
+            ))
+
+    orders = [
+        dict(zip(columns, row))
+        for row in db.execute(
+            query.where(*conditions).order_by(OrderModel.id)
+        )
+    ]
+
+    if not orders:
+        return []
+
+    if with_items:
+        items = defaultdict(list)
+        rows = db.execute(
+            select(
+                OrderItemModel.order_id,
+                OrderItemModel.product_id,
+                OrderItemModel.quantity
+            )
+            .where(*item_conditions)
+            .order_by(OrderItemModel.id)
+        )
+        if expand_products:
+            for order_id, product_id, quantity in rows:
+                items[order_id].append(
+                    ExpandedOrderItemRow(product_id, quantity, None)
+                )
+            load_item_products(
+                [item for group in items.values() for item in group], db
+            )
+        else:
+            for order_id, product_id, quantity in rows:
+                items[order_id].append(OrderItemRow(product_id, quantity))
+
+        for order in orders:
+            order["items"] = items.get(order["id"], [])
+
+    for order in orders:
+        if "created_at" in order:
+            order["created_at"] = str(order["created_at"])
+        if "total_itens" in order:
+            order["total_itens"] = int(order["total_itens"])
+            order["total_price"] = from_cents(order["total_price"])
+
+    row_type = ExpandedOrderRow if expand_products else OrderRow
+    return [build_row(row_type, order) for order in orders]
+
+
+def load_item_products(items: list, db: Session):
+    """
+    Preenche o produto de cada item de pedido, carregando-os em lote.
+
+    Os produtos de todos os itens (de um ou vários pedidos) são reunidos e
+    deduplicados, sendo lidos com uma consulta para os produtos e outra para
+    as imagens, em vez de uma requisição por item.
+
+    Args:
+        items (list[ExpandedOrderItemRow]): Itens dos pedidos.
+        db (Session): A sessão do banco de dados.
+    """
+    products = get_products_by_ids([item.product_id for item in items], db)
+    for item in items:
+        item.product = products.get(item.product_id)
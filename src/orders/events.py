@@ -0,0 +1,186 @@
+# Imports do sistema
+import asyncio
+import threading
+
+# Imports de terceiros
+import orjson
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.config import settings
+from core.notifications import Subscriber, listener, notify
+from src.orders.models import OrderModel
+
+# Canal do LISTEN/NOTIFY com os eventos de pedidos (payload: JSON com
+# event, id, client_id e status)
+ORDERS_CHANNEL = "orders_events"
+
+# Evento enviado aos assinantes quando a conexão de escuta é perdida:
+# eventos podem ter sido perdidos e os pedidos devem ser recarregados
+RESET_EVENT = {"event": "reset"}
+
+
+def notify_order_event(event: str, order: OrderModel, db: Session):
+    """
+    Publica um evento de pedido, entregue no commit da transação.
+
+    Args:
+        event (str): Tipo do evento (created, updated, delivered, cancelled
+        ou deleted).
+        order (OrderModel): Pedido do evento.
+        db (Session): Sessão do banco de dados.
+    """
+    notify(
+        ORDERS_CHANNEL,
+        orjson.dumps({
+            "event": event,
+            "id": order.id,
+            "client_id": order.client_id,
+            "status": order.status,
+        }).decode(),
+        db
+    )
+
+
+class OrderSubscription:
+    """
+    Conexão SSE inscrita nos eventos de pedidos, com os seus filtros.
+
+    Os eventos são entregues em uma fila limitada, consumida no event loop
+    da requisição; se o cliente não acompanha o ritmo e a fila enche, a
+    inscrição é marcada como transbordada e a conexão é encerrada.
+    """
+    __slots__ = ("loop", "queue", "client_id", "status", "overflowed")
+
+    def __init__(self, client_id: int = None, status: str = None):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(settings.ORDER_EVENTS_QUEUE_SIZE)
+        self.client_id = client_id
+        self.status = status
+        self.overflowed = False
+
+    def matches(self, event: dict) -> bool:
+        if event["event"] == RESET_EVENT["event"]:
+            return True
+        if self.client_id is not None \
+                and event["client_id"] != self.client_id:
+            return False
+        return self.status is None or event["status"] == self.status
+
+    def push(self, event: dict):
+        # Executado no event loop da requisição
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class OrderEventHub(Subscriber):
+    """
+    Distribui, no worker, os eventos de pedidos recebidos pela conexão de
+    escuta compartilhada (NotificationListener) às conexões SSE abertas.
+
+    Cada conexão inativa custa apenas uma fila e uma corrotina em espera:
+    nenhuma consulta ou conexão com o banco é mantida por assinante.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscriptions = set()
+
+    @property
+    def available(self) -> bool:
+        return listener.enabled
+
+    @property
+    def full(self) -> bool:
+        return len(self.subscriptions) >= settings.ORDER_EVENTS_MAX_SUBSCRIBERS
+
+    def subscribe(self, subscription: OrderSubscription):
+        """
+        Inscreve uma conexão nos eventos.
+
+        Args:
+            subscription (OrderSubscription): Inscrição da conexão.
+        """
+        with self.lock:
+            self.subscriptions.add(subscription)
+
+    def unsubscribe(self, subscription: OrderSubscription):
+        """
+        Cancela a inscrição de uma conexão.
+
+        Args:
+            subscription (OrderSubscription): Inscrição da conexão.
+        """
+        with self.lock:
+            self.subscriptions.discard(subscription)
+
+    def publish(self, event: dict):
+        """
+        Entrega um evento às inscrições cujos filtros o aceitam.
+
+        Args:
+            event (dict): Evento de pedido.
+        """
+        with self.lock:
+            subscriptions = list(self.subscriptions)
+
+        for subscription in subscriptions:
+            if subscription.matches(event):
+                try:
+                    subscription.loop.call_soon_threadsafe(
+                        subscription.push, event
+                    )
+                except RuntimeError:
+                    # Event loop já encerrado (desligamento do worker)
+                    self.unsubscribe(subscription)
+
+    def on_notify(self, channel: str, payload: str):
+        self.publish(orjson.loads(payload))
+
+    def on_disconnect(self):
+        self.publish(RESET_EVENT)
+
+
+order_events = OrderEventHub()
+listener.subscribe(ORDERS_CHANNEL, order_events)
+
+
+async def stream_order_events(subscription: OrderSubscription):
+    """
+    Gera a resposta SSE de uma inscrição.
+
+    A inscrição é feita quando o envio começa e cancelada quando o cliente
+    desconecta. Um comentário periódico (heartbeat) mantém a conexão
+    aberta em proxies e balanceadores.
+
+    Args:
+        subscription (OrderSubscription): Inscrição da conexão.
+    Yields:
+        bytes: Mensagens no formato text/event-stream.
+    """
+    order_events.subscribe(subscription)
+    try:
+        yield b"retry: 5000\n\n"
+
+        while not subscription.overflowed:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(),
+                    settings.ORDER_EVENTS_HEARTBEAT_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+                continue
+
+            yield b"".join((
+                b"event: ", event["event"].encode(),
+                b"\ndata: ", orjson.dumps(event),
+                b"\n\n",
+            ))
+
+        # O cliente não acompanhou os eventos: ao reconectar, deve
+        # recarregar os pedidos
+        yield b"event: reset\ndata: " + orjson.dumps(RESET_EVENT) + b"\n\n"
+    finally:
+        order_events.unsubscribe(subscription)
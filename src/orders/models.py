@@ -1,5 +1,6 @@
 # Imports de terceiros
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (BigInteger, Column, DateTime, ForeignKey,
+                        ForeignKeyConstraint, Integer, String)
 from sqlalchemy.orm import relationship
 
 # Imports locais
@@ -9,17 +10,22 @@ from core.database import Base
 class OrderModel(Base):
     """
     Modelo de pedido para o banco de dados.
+
+    A tabela é particionada por mês de created_at (PostgreSQL), por isso a
+    chave primária inclui a coluna de particionamento. As partições são
+    criadas e arquivadas pela tarefa "maintain_order_partitions".
     """
     __tablename__ = "orders"
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     client_id = Column(
         Integer,
         ForeignKey("clients.id", ondelete="CASCADE"),
         nullable=False
     )
     status = Column(String, nullable=False)
-    created_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, primary_key=True)
 
     # Relacionamento com o cliente
     client = relationship("ClientModel", back_populates="orders")
@@ -35,22 +41,31 @@ class OrderModel(Base):
 class OrderItemModel(Base):
     """
     Modelo de item de pedido para o banco de dados.
+
+    Os itens repetem o created_at do pedido e são particionados pelo mesmo
+    mês, de modo que pedido e itens ficam em partições correspondentes.
     """
     __tablename__ = "order_items"
-
-    id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(
-        Integer,
-        ForeignKey("orders.id", ondelete="CASCADE"),
-        nullable=False
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["order_id", "created_at"],
+            ["orders.id", "orders.created_at"],
+            ondelete="CASCADE"
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    order_id = Column(Integer, nullable=False)
     product_id = Column(
         Integer,
         ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False
     )
     quantity = Column(Integer, nullable=False)
-    unit_price = Column(Float, nullable=False)
+    # Preço unitário em centavos no momento do pedido
+    unit_price_cents = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, primary_key=True)
 
     # Relacionamento com o pedido e o produto
     order = relationship("OrderModel", back_populates="items")
@@ -0,0 +1,202 @@
+# Imports do sistema
+import logging
+import re
+from datetime import date
+
+# Imports de terceiros
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Tabelas particionadas por mês de created_at, na ordem de criação (os itens
+# referenciam os pedidos); o arquivamento segue a ordem inversa
+PARTITIONED_TABLES = ("orders", "order_items")
+
+PARTITION_PATTERN = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def month_start(value: date) -> date:
+    """
+    Obtém o primeiro dia do mês de uma data.
+
+    Args:
+        value (date): Data de referência.
+    Returns:
+        date: Primeiro dia do mês.
+    """
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """
+    Soma meses ao primeiro dia do mês de uma data.
+
+    Args:
+        value (date): Data de referência.
+        months (int): Quantidade de meses (pode ser negativa).
+    Returns:
+        date: Primeiro dia do mês resultante.
+    """
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """
+    Monta o nome da partição mensal de uma tabela (ex.: orders_p2024_01).
+
+    Args:
+        table (str): Tabela particionada.
+        month (date): Mês da partição.
+    Returns:
+        str: Nome da partição.
+    """
+    return f"{table}_p{month:%Y_%m}"
+
+
+def ensure_order_partitions(db: Session, start: date, months: int) -> list:
+    """
+    Cria as partições mensais de pedidos e itens que ainda não existem.
+
+    Também garante a partição DEFAULT, que recebe linhas de meses sem
+    partição. Uma partição não pode ser criada se a DEFAULT já tiver linhas
+    do mesmo mês; nesse caso o mês é ignorado e registrado no log.
+
+    Args:
+        db (Session): Sessão ou conexão do banco de dados (PostgreSQL).
+        start (date): Primeiro mês a ser criado.
+        months (int): Quantidade de meses a partir de start.
+    Returns:
+        list[str]: Partições criadas.
+    """
+    created = []
+    existing = {
+        name
+        for table in PARTITIONED_TABLES
+        for name, _ in list_order_partitions(db, table)
+    }
+
+    for table in PARTITIONED_TABLES:
+        try:
+            with db.begin_nested():
+                db.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {table}_default "
+                    f"PARTITION OF {table} DEFAULT"
+                ))
+        except DBAPIError:
+            logger.warning(
+                "Não foi possível criar a partição %s_default", table,
+                exc_info=True
+            )
+
+    for offset in range(months):
+        month = add_months(start, offset)
+        for table in PARTITIONED_TABLES:
+            name = partition_name(table, month)
+            if name in existing:
+                continue
+
+            try:
+                with db.begin_nested():
+                    db.execute(text(
+                        f"CREATE TABLE {name} PARTITION OF {table} "
+                        f"FOR VALUES FROM ('{month}') "
+                        f"TO ('{add_months(month, 1)}')"
+                    ))
+            except DBAPIError:
+                logger.warning(
+                    "Não foi possível criar a partição %s", name,
+                    exc_info=True
+                )
+                break
+
+            created.append(name)
+
+    return created
+
+
+def list_order_partitions(db: Session, table: str) -> list:
+    """
+    Lista as partições mensais anexadas a uma tabela.
+
+    Args:
+        db (Session): Sessão ou conexão do banco de dados (PostgreSQL).
+        table (str): Tabela particionada.
+    Returns:
+        list[tuple[str, date]]: Nome e mês de cada partição, em ordem.
+    """
+    rows = db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table}
+    ).scalars()
+
+    partitions = []
+    for name in rows:
+        match = PARTITION_PATTERN.search(name)
+        if match:
+            partitions.append(
+                (name, date(int(match[1]), int(match[2]), 1))
+            )
+
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def archive_order_partitions(
+        db: Session,
+        before: date,
+        tablespace: str = None
+) -> list:
+    """
+    Desanexa as partições de pedidos e itens anteriores a um mês.
+
+    As partições desanexadas continuam no banco como tabelas comuns (para
+    consulta, dump ou exclusão), fora das consultas da API. A chave
+    estrangeira dos itens para os pedidos é removida, pois deixa de fazer
+    sentido fora da tabela particionada. Opcionalmente, as tabelas são
+    movidas para um tablespace de armazenamento mais barato.
+
+    Args:
+        db (Session): Sessão ou conexão do banco de dados (PostgreSQL).
+        before (date): Partições de meses anteriores a este são arquivadas.
+        tablespace (str): Tablespace de destino (opcional).
+    Returns:
+        list[str]: Partições desanexadas.
+    """
+    archived = []
+
+    for table in reversed(PARTITIONED_TABLES):
+        for name, month in list_order_partitions(db, table):
+            if month >= month_start(before):
+                continue
+
+            db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+
+            foreign_keys = db.execute(
+                text(
+                    "SELECT conname FROM pg_constraint "
+                    "WHERE contype = 'f' "
+                    "AND conrelid = CAST(:name AS regclass) "
+                    "AND confrelid IN (SELECT CAST(t AS regclass) "
+                    "FROM unnest(CAST(:tables AS text[])) AS t)"
+                ),
+                {"name": name, "tables": list(PARTITIONED_TABLES)}
+            ).scalars().all()
+            for constraint in foreign_keys:
+                db.execute(text(
+                    f'ALTER TABLE {name} DROP CONSTRAINT "{constraint}"'
+                ))
+
+            if tablespace:
+                db.execute(text(
+                    f'ALTER TABLE {name} SET TABLESPACE "{tablespace}"'
+                ))
+
+            archived.append(name)
+
+    return archived
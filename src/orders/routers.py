@@ -4,20 +4,28 @@ from typing import Annotated, Optional
 
 # Imports de terceiros
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 # Imports locais
-from core.database import get_db
-from core.exceptions import APIException, SuccessResponse
+from core.database import get_db, get_read_db
+from core.exceptions import APIException
+from core.fields import parse_expand, parse_fields
+from core.money import from_cents
+from core.responses import success_response
 from src.auth.jwt_auth import get_current_user
 from src.auth.models import UserModel
 from src.clients.crud import get_client_by_email
-from src.orders.crud import (get_all_orders_detail, get_order_by_id,
-                             get_order_detail_by_id)
+from src.orders.crud import (category_condition, get_order_by_id,
+                             get_order_detail_by_id, has_orders, list_orders,
+                             restore_order_stock)
+from src.orders.events import (OrderSubscription, notify_order_event,
+                               order_events, stream_order_events)
 from src.orders.models import OrderItemModel, OrderModel
-from src.orders.schemas import (CreateOrder, OrderItem, OrderOutput,
-                                StatusOrder, UpdateOrder)
-from src.products.crud import get_product_by_id
+from src.orders.schemas import (CreateOrder, ExpandedOrderItem,
+                                ExpandedOrderOutput, OrderItem, OrderOutput,
+                                OrderRow, StatusOrder, UpdateOrder)
+from src.products.crud import get_product_by_id, get_products_by_ids
 
 router = APIRouter(
     prefix="/orders",
@@ -25,13 +33,18 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Relações que podem ser incluídas na resposta (parâmetro expand)
+EXPANDABLE = ("items.product",)
+
 
 @router.get(
     "/get_detail_order/{order_id}",
     summary="Obter informações de um pedido específico"
 )
 def get_order(
-        order_id: int, db: Session = Depends(get_db),
+        order_id: int,
+        expand: str = None,
+        db: Session = Depends(get_read_db),
         current_user: Annotated[UserModel, Depends(get_current_user)] = None
 ):
     """
@@ -39,11 +52,14 @@ def get_order(
 
     Args:
         order_id (int): ID do pedido.
+        expand (str): Relações incluídas na resposta; "items.product"
+        inclui os dados do produto em cada item.
         db (Session): Sessão do banco de dados.
         current_user (UserModel): Cliente autenticado.
     Returns:
         OrderOutput: Detalhes do pedido.
     """
+    expand_products = "items.product" in parse_expand(expand, EXPANDABLE)
     order = get_order_detail_by_id(order_id, db)
 
     # Verifica se o pedido existe
@@ -56,20 +72,43 @@ def get_order(
 
     # Calcular o total de itens e o preço total do pedido
     total_itens = sum(item.quantity for item in order.items)
-    total_price = sum(item.quantity * item.unit_price for item in order.items)
+    total_cents = sum(
+        item.quantity * item.unit_price_cents for item in order.items
+    )
 
     # Cria o objeto de saída com os detalhes do pedido
-    order_output = OrderOutput(
-        id=order.id,
-        client_id=order.client_id,
-        status=order.status,
-        created_at=str(order.created_at),
-        items=[OrderItem(**item.__dict__) for item in order.items],
-        total_itens=total_itens,
-        total_price=total_price
-    )
+    if expand_products:
+        products = get_products_by_ids(
+            [item.product_id for item in order.items], db
+        )
+        order_output = ExpandedOrderOutput(
+            id=order.id,
+            client_id=order.client_id,
+            status=order.status,
+            created_at=str(order.created_at),
+            items=[
+                ExpandedOrderItem(
+                    product_id=item.product_id,
+                    quantity=item.quantity,
+                    product=products.get(item.product_id)
+                )
+                for item in order.items
+            ],
+            total_itens=total_itens,
+            total_price=from_cents(total_cents)
+        )
+    else:
+        order_output = OrderOutput(
+            id=order.id,
+            client_id=order.client_id,
+            status=order.status,
+            created_at=str(order.created_at),
+            items=[OrderItem(**item.__dict__) for item in order.items],
+            total_itens=total_itens,
+            total_price=from_cents(total_cents)
+        )
 
-    return SuccessResponse(
+    return success_response(
         data=order_output,
         message="Dados do pedido retornado com sucesso"
     )
@@ -88,7 +127,9 @@ def get_orders(
         category: str = None,
         start_date: str = None,
         end_date: str = None,
-        db: Session = Depends(get_db),
+        fields: str = None,
+        expand: str = None,
+        db: Session = Depends(get_read_db),
         current_user: Annotated[UserModel, Depends(get_current_user)] = None
 ):
     """
@@ -101,136 +142,172 @@ def get_orders(
         category (str): Categoria do produto (opcional).
         start_date (str): Data de início no formato YYYY-MM-DD (opcional).
         end_date (str): Data de término no formato YYYY-MM-DD (opcional).
+        fields (str): Campos retornados, separados por vírgula (ex.:
+        "id,status,total_price"); todos quando não informado.
+        expand (str): Relações incluídas na resposta; "items.product"
+        inclui os dados do produto em cada item.
         db (Session): Sessão do banco de dados.
         current_user (UserModel): Cliente autenticado.
     Returns:
         List[OrderOutput]: Lista de pedidos com detalhes.
     """
-    orders = get_all_orders_detail(db)
-
-    # Verifica se há pedidos
-    if not orders:
+    selected = parse_fields(fields, OrderRow)
+    expand_products = "items.product" in parse_expand(expand, EXPANDABLE)
+
+    # Converter as datas, incluindo o final do dia em end_date
+    try:
+        start_datetime = datetime.strptime(start_date, "%Y-%m-%d") \
+            if start_date else None
+        end_datetime = (datetime.strptime(end_date, "%Y-%m-%d")
+                        + timedelta(days=1)
+                        - timedelta(seconds=1)) if end_date else None
+    except ValueError:
         raise APIException(
-            code=404,
-            message="Nenhum pedido encontrado",
-            description="Nenhum pedido encontrado no sistema"
+            code=400,
+            message="Formato de data inválido",
+            description="As datas devem estar no formato YYYY-MM-DD"
         )
 
-    if order_id:
-        orders = [order for order in orders if order.id == order_id]
+    # Cada filtro é aplicado na consulta e acompanha a exceção retornada
+    # quando é ele que deixa o resultado vazio
+    filters = []
 
-        if not orders:
-            raise APIException(
+    if order_id:
+        filters.append((
+            OrderModel.id == order_id,
+            APIException(
                 code=404,
                 message="Pedido não encontrado",
                 description=f"Pedido com ID {order_id} não foi encontrado"
             )
+        ))
 
     if client_id:
-        orders = [order for order in orders if order.client_id == client_id]
-
-        if not orders:
-            raise APIException(
+        filters.append((
+            OrderModel.client_id == client_id,
+            APIException(
                 code=404,
                 message="Cliente não encontrado",
                 description=f"Cliente com ID {client_id} não foi encontrado"
             )
+        ))
 
     if status:
-        orders = [order for order in orders if order.status == status]
-
-        if not orders:
-            raise APIException(
+        filters.append((
+            OrderModel.status == status,
+            APIException(
                 code=404,
                 message="Pedido não encontrado",
                 description=f"Pedido com status {status} não foi encontrado"
             )
+        ))
 
     if category:
-        orders = [
-            order for order in orders
-            if any(
-                item.product.section.upper() == category.upper()
-                for item in order.items
-            )
-                  ]
-
-        if not orders:
-            raise APIException(
+        filters.append((
+            category_condition(category),
+            APIException(
                 code=404,
                 message="Nenhum pedido encontrado",
                 description=f"Nenhum pedido encontrado para "
                             f"a categoria {category}"
             )
+        ))
 
-    # Verifica se as datas de início e término foram fornecidas
-    if start_date or end_date:
-        try:
-            filtered_orders = []
-            # Converter start_date para datetime, se fornecida
-            start_datetime = datetime.strptime(start_date, "%Y-%m-%d") \
-                if start_date else None
-
-            # Converter end_date para datetime, incluindo o final do dia,
-            # se fornecida
-            end_datetime = (datetime.strptime(end_date, "%Y-%m-%d")
-                            + timedelta(days=1)
-                            - timedelta(seconds=1)) if end_date else None
-
-            for order in orders:
-                include_order = True
-                # Filtro por start_date
-                if start_datetime and order.created_at < start_datetime:
-                    include_order = False
-                # Filtro por end_date
-                if end_datetime and order.created_at > end_datetime:
-                    include_order = False
-                if include_order:
-                    filtered_orders.append(order)
-
-            orders = filtered_orders
-
-            if not orders:
-                raise APIException(
-                    code=404,
-                    message="Nenhum pedido encontrado",
-                    description=f"Nenhum pedido encontrado "
-                                f"entre as datas {start_date} e {end_date}"
-                )
-        except ValueError:
-            raise APIException(
-                code=400,
-                message="Formato de data inválido",
-                description="As datas devem estar no formato YYYY-MM-DD"
-            )
-
-    # Calcular o total de itens e o preço total de cada pedido
-    for order in orders:
-        total_itens = sum(item.quantity for item in order.items)
-        total_price = sum(
-            item.quantity * item.unit_price for item in order.items
+    if start_datetime or end_datetime:
+        date_exception = APIException(
+            code=404,
+            message="Nenhum pedido encontrado",
+            description=f"Nenhum pedido encontrado "
+                        f"entre as datas {start_date} e {end_date}"
         )
 
-        order.total_itens = total_itens
-        order.total_price = total_price
+        if start_datetime:
+            filters.append((
+                OrderModel.created_at >= start_datetime, date_exception
+            ))
 
-    # Criar a lista de pedidos com os detalhes
-    orders = [
-        OrderOutput(
-            id=order.id,
-            client_id=order.client_id,
-            status=order.status,
-            created_at=str(order.created_at),
-            items=[OrderItem(**item.__dict__) for item in order.items],
-            total_itens=order.total_itens,
-            total_price=order.total_price
+        if end_datetime:
+            filters.append((
+                OrderModel.created_at <= end_datetime, date_exception
+            ))
+
+    conditions = [condition for condition, _ in filters]
+    orders = list_orders(
+        conditions, db, start_datetime, end_datetime, selected,
+        expand_products
+    )
+
+    if not orders:
+        # Identifica o primeiro filtro que deixou o resultado vazio
+        if has_orders([], db):
+            for index, (_, exception) in enumerate(filters):
+                if not has_orders(conditions[:index + 1], db):
+                    raise exception
+
+        raise APIException(
+            code=404,
+            message="Nenhum pedido encontrado",
+            description="Nenhum pedido encontrado no sistema"
         )
-        for order in orders
-    ]
 
-    return SuccessResponse(
+    return success_response(
         data=orders,
-        message="Pedidos retornado com sucesso"
+        message="Pedidos retornado com sucesso",
+        fields=selected
+    )
+
+
+@router.get(
+    "/events",
+    summary="Receber, em tempo real (Server-Sent Events), a criação, "
+            "alteração, entrega, cancelamento e exclusão de pedidos"
+)
+async def get_order_events(
+        client_id: int = None,
+        status: Optional[StatusOrder] = None,
+        current_user: Annotated[UserModel, Depends(get_current_user)] = None
+):
+    """
+    Abre um fluxo SSE (text/event-stream) com os eventos de pedidos, em
+    substituição à consulta periódica de get_orders.
+
+    Cada mensagem tem o tipo do evento (created, updated, delivered,
+    cancelled ou deleted) e, em data, o ID, o cliente e o status do
+    pedido. Um evento reset indica que eventos podem ter sido perdidos e
+    que os pedidos devem ser recarregados por get_orders.
+
+    O token é validado apenas na abertura da conexão: o cliente deve
+    reconectar ao renovar o token. A reciclagem de workers do gunicorn
+    (MAX_REQUESTS) encerra as conexões abertas; veja gunicorn_conf.py.
+
+    Args:
+        client_id (int): Recebe apenas os pedidos do cliente (opcional).
+        status (StatusOrder): Recebe apenas os eventos com o status
+        (opcional).
+        current_user (UserModel): Cliente autenticado.
+    Returns:
+        StreamingResponse: Fluxo de eventos.
+    """
+    # Os eventos dependem do LISTEN/NOTIFY do PostgreSQL (sem PgBouncer)
+    if not order_events.available:
+        raise APIException(
+            code=503,
+            message="Eventos indisponíveis",
+            description="Os eventos de pedidos não estão disponíveis neste "
+                        "ambiente; consulte get_orders"
+        )
+
+    if order_events.full:
+        raise APIException(
+            code=503,
+            message="Limite de conexões atingido",
+            description="Tente novamente em instantes"
+        )
+
+    return StreamingResponse(
+        stream_order_events(OrderSubscription(client_id, status)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
@@ -287,9 +364,12 @@ def create_order(
     for item in order.items:
         order_item = OrderItemModel(
             order_id=new_order.id,
+            created_at=new_order.created_at,
             product_id=item.product_id,
             quantity=item.quantity,
-            unit_price=get_product_by_id(item.product_id, db).price
+            unit_price_cents=get_product_by_id(
+                item.product_id, db
+            ).price_cents
         )
         db.add(order_item)
 
@@ -298,9 +378,10 @@ def create_order(
         product.stock -= item.quantity
         db.add(product)
 
+    notify_order_event("created", new_order, db)
     db.commit()
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Pedido criado com sucesso"
     )
@@ -347,26 +428,35 @@ def update_order(
             description="Você não tem permissão para atualizar este pedido"
         )
 
+    # Pedidos entregues são histórico: o estoque já saiu e não é revertido
+    if order_model.status == StatusOrder.ENTREGUE and (
+            status == StatusOrder.CANCELADO or (order and order.items)):
+        raise APIException(
+            code=400,
+            message="Pedido já entregue",
+            description=f"O pedido com ID {order_id} já foi entregue e não "
+                        f"pode ser cancelado nem ter os itens alterados"
+        )
+
     if status:
         if status == StatusOrder.ENTREGUE:
-            db.delete(order_model)
+            # Pedidos entregues são mantidos como histórico; o tamanho da
+            # tabela é controlado pelo arquivamento das partições antigas
+            order_model.status = StatusOrder.ENTREGUE
+            notify_order_event("delivered", order_model, db)
             db.commit()
         elif status == StatusOrder.CANCELADO:
             # Reverter o estoque dos itens do pedido
-            for item in order_model.items:
-                product = get_product_by_id(item.product_id, db)
-                product.stock += item.quantity
-                db.add(product)
+            restore_order_stock([OrderModel.id == order_model.id], db)
 
+            order_model.status = StatusOrder.CANCELADO
+            notify_order_event("cancelled", order_model, db)
             db.delete(order_model)
             db.commit()
 
     if order and order.items:
         # Reverter o estoque dos itens atuais
-        for item in order_model.items:
-            product = get_product_by_id(item.product_id, db)
-            product.stock += item.quantity
-            db.add(product)
+        restore_order_stock([OrderModel.id == order_model.id], db)
 
         # Remover itens antigos
         for item in order_model.items:
@@ -398,9 +488,10 @@ def update_order(
             # Cria o modelo do item do pedido
             order_item = OrderItemModel(
                 order_id=order_model.id,
+                created_at=order_model.created_at,
                 product_id=item.product_id,
                 quantity=item.quantity,
-                unit_price=product.price
+                unit_price_cents=product.price_cents
             )
             db.add(order_item)
 
@@ -408,10 +499,11 @@ def update_order(
             product.stock -= item.quantity
             db.add(product)
 
+        notify_order_event("updated", order_model, db)
         db.commit()
         db.refresh(order_model)
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Pedido atualizado com sucesso"
     )
@@ -451,17 +543,24 @@ def delete_order(
             description="Você não tem permissão para excluir este pedido"
         )
 
+    # Pedidos entregues são histórico: o estoque já saiu e não é revertido
+    if order_model.status == StatusOrder.ENTREGUE:
+        raise APIException(
+            code=400,
+            message="Pedido já entregue",
+            description=f"O pedido com ID {order_id} já foi entregue e não "
+                        f"pode ser excluído"
+        )
+
     # Reverter o estoque dos itens do pedido
-    for item in order_model.items:
-        product = get_product_by_id(item.product_id, db)
-        product.stock += item.quantity
-        db.add(product)
+    restore_order_stock([OrderModel.id == order_model.id], db)
 
     # Excluir o pedido
+    notify_order_event("deleted", order_model, db)
     db.delete(order_model)
     db.commit()
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Pedido excluído com sucesso"
     )
@@ -1,10 +1,14 @@
 # Imports do sistema
+from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 # Imports de terceiros
 from pydantic import BaseModel
 
+# Imports locais
+from src.products.schemas import ProductRow
+
 
 class OrderItem(BaseModel):
     """
@@ -59,6 +63,63 @@ class OrderOutput(BaseModel):
         from_attributes = True
 
 
+class ExpandedOrderItem(OrderItem):
+    """
+    Schema para um item do pedido com os dados do produto
+    (expand=items.product).
+    """
+    product: Optional[ProductRow]
+
+
+class ExpandedOrderOutput(OrderOutput):
+    """
+    Schema para a saída de um pedido com os produtos dos itens.
+    """
+    items: List[ExpandedOrderItem]
+
+
+@dataclass(slots=True)
+class OrderItemRow:
+    """
+    Item de um pedido em listagens, lido diretamente das colunas.
+    """
+    product_id: int
+    quantity: int
+
+
+@dataclass(slots=True)
+class OrderRow:
+    """
+    Dados de um pedido em listagens, lidos diretamente das colunas.
+
+    Estrutura leve (sem validação e sem rastreamento pela sessão) com os
+    mesmos campos de OrderOutput.
+    """
+    id: int
+    client_id: int
+    status: str
+    created_at: str
+    items: List[OrderItemRow]
+    total_itens: int
+    total_price: float
+
+
+@dataclass(slots=True)
+class ExpandedOrderItemRow(OrderItemRow):
+    """
+    Item de um pedido em listagens com os dados do produto.
+    """
+    product: Optional[ProductRow]
+
+
+@dataclass(slots=True)
+class ExpandedOrderRow(OrderRow):
+    """
+    Pedido em listagens com os produtos dos itens (expand=items.product).
+    """
+    items: List[ExpandedOrderItemRow]
+
+
 class StatusOrder(str, Enum):
     """
     Enumeração de status do pedido.
@@ -0,0 +1,129 @@
+# Imports do sistema
+import threading
+from typing import Callable
+
+# Imports de terceiros
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.config import settings
+from core.database import SessionLocal
+from core.notifications import Subscriber, listener
+from src.products.crud import list_product_summaries
+from src.products.events import PRODUCTS_CHANNEL
+
+
+class BarcodeCache(Subscriber):
+    """
+    Mapa, em memória do worker, de código de barras para o resumo do
+    produto, usado na leitura de códigos de barras do PDV.
+
+    O mapa é carregado quando a conexão de escuta do worker é aberta e
+    atualizado produto a produto a cada notificação de alteração; enquanto
+    não está sincronizado (inicialização, conexão de escuta perdida,
+    PgBouncer ou bancos sem LISTEN/NOTIFY), as buscas vão ao banco.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.by_barcode = None
+        self.barcodes = {}
+
+    @property
+    def synced(self) -> bool:
+        return self.by_barcode is not None
+
+    def reload(self):
+        """
+        Recarrega o mapa com todos os produtos.
+        """
+        db = SessionLocal()
+        try:
+            summaries = list_product_summaries(db)
+        finally:
+            db.close()
+
+        with self.lock:
+            self.by_barcode = {
+                summary.barcode: summary for summary in summaries
+            }
+            self.barcodes = {
+                summary.id: summary.barcode for summary in summaries
+            }
+
+    def refresh(self, product_id: int):
+        """
+        Atualiza (ou remove) um produto no mapa.
+
+        Args:
+            product_id (int): ID do produto alterado.
+        """
+        db = SessionLocal()
+        try:
+            summaries = list_product_summaries(db, [product_id])
+        finally:
+            db.close()
+
+        with self.lock:
+            if self.by_barcode is None:
+                return
+
+            old_barcode = self.barcodes.pop(product_id, None)
+            if old_barcode is not None:
+                self.by_barcode.pop(old_barcode, None)
+
+            for summary in summaries:
+                self.by_barcode[summary.barcode] = summary
+                self.barcodes[summary.id] = summary.barcode
+
+    def on_connect(self):
+        if settings.BARCODE_CACHE_ENABLED:
+            self.reload()
+
+    def on_notify(self, channel: str, payload: str):
+        self.refresh(int(payload))
+
+    def on_disconnect(self):
+        with self.lock:
+            self.by_barcode = None
+            self.barcodes = {}
+
+
+barcode_cache = BarcodeCache()
+listener.subscribe(PRODUCTS_CHANNEL, barcode_cache)
+
+
+def get_summaries_by_barcodes(
+        barcodes: list,
+        open_db: Callable[[], Session]
+) -> dict:
+    """
+    Obtém os resumos dos produtos pelos códigos de barras.
+
+    Usa o mapa em memória quando sincronizado, sem abrir sessão nem obter
+    conexão do pool; caso contrário, consulta o banco em uma sessão aberta
+    por open_db.
+
+    Args:
+        barcodes (list[str]): Códigos de barras.
+        open_db (Callable[[], Session]): Abre a sessão de leitura usada
+        quando o mapa não está sincronizado.
+    Returns:
+        dict[str, ProductSummary]: Resumos encontrados, por código.
+    """
+    by_barcode = barcode_cache.by_barcode
+    if by_barcode is not None:
+        found = {}
+        for barcode in barcodes:
+            summary = by_barcode.get(barcode)
+            if summary is not None:
+                found[barcode] = summary
+        return found
+
+    db = open_db()
+    try:
+        return {
+            summary.barcode: summary
+            for summary in list_product_summaries(db, barcodes=barcodes)
+        }
+    finally:
+        db.close()
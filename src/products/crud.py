@@ -1,8 +1,35 @@
+# Imports do sistema
+from collections import defaultdict
+from datetime import datetime, timedelta
+
 # Imports de terceiros
+from sqlalchemy import (and_, case, delete, exists, func, literal_column, or_,
+                        select, text, tuple_, update)
 from sqlalchemy.orm import Session
 
 # Imports locais
-from src.products.models import ProductModel
+from core.config import settings
+from core.database import estimate_count, match_any
+from core.fields import build_row, format_cursor, wants
+from core.money import from_cents, to_cents
+from src.orders.models import OrderItemModel
+from src.products.models import ProductImageModel, ProductModel
+from src.products.schemas import (PriceBucket, ProductChanges, ProductFacets,
+                                  ProductRow, ProductSummary, SectionCount)
+
+# Colunas de cada campo de ProductRow (url_images vem de product_images)
+PRODUCT_COLUMNS = {
+    "id": ProductModel.id,
+    "description": ProductModel.description,
+    "price": ProductModel.price_cents,
+    "barcode": ProductModel.barcode,
+    "section": ProductModel.section,
+    "stock": ProductModel.stock,
+    "expiry_date": ProductModel.expiry_date,
+}
+
+# Produtos não excluídos (sem marcador de exclusão)
+PRODUCT_ACTIVE = ProductModel.deleted_at.is_(None)
 
 
 def get_product_by_id(product_id: int, db: Session):
@@ -15,7 +42,9 @@ def get_product_by_id(product_id: int, db: Session):
     Returns:
         ProductModel: O produto correspondente ao ID fornecido.
     """
-    return db.query(ProductModel).filter(ProductModel.id == product_id).first()
+    return db.query(ProductModel).filter(
+        ProductModel.id == product_id, PRODUCT_ACTIVE
+    ).first()
 
 
 def get_product_by_barcode(barcode: str, db: Session):
@@ -29,5 +58,622 @@ def get_product_by_barcode(barcode: str, db: Session):
         ProductModel: O produto correspondente ao código de barras fornecido.
     """
     return db.query(ProductModel).filter(
-        ProductModel.barcode == barcode
+        ProductModel.barcode == barcode, PRODUCT_ACTIVE
     ).first()
+
+
+def get_image_urls(product_ids: list, db: Session):
+    """
+    Obtém as URLs das imagens de vários produtos em uma única consulta.
+
+    Args:
+        product_ids (list[int]): IDs dos produtos.
+        db (Session): A sessão do banco de dados.
+    Returns:
+        dict[int, list[str]]: URLs das imagens agrupadas pelo ID do produto.
+    """
+    images = defaultdict(list)
+    if not product_ids:
+        return images
+
+    rows = db.execute(
+        select(ProductImageModel.product_id, ProductImageModel.image_url)
+        .where(
+            ProductImageModel.product_id.in_(product_ids),
+            ProductImageModel.deleted_at.is_(None)
+        )
+        .order_by(ProductImageModel.id)
+    )
+    for product_id, image_url in rows:
+        images[product_id].append(image_url)
+
+    return images
+
+
+def _product_filters(
+        category: str = None,
+        price: float = None,
+        available: bool = None
+) -> dict:
+    """
+    Monta as condições dos filtros da listagem de produtos.
+
+    Args:
+        category (str): Seção do produto (opcional).
+        price (float): Preço máximo do produto (opcional).
+        available (bool): Disponibilidade em estoque (opcional).
+    Returns:
+        dict[str, ColumnElement]: Condições informadas, por filtro.
+    """
+    filters = {}
+
+    if category:
+        filters["category"] = \
+            func.upper(ProductModel.section) == category.upper()
+
+    if price:
+        filters["price"] = ProductModel.price_cents <= to_cents(price)
+
+    if available is not None:
+        filters["available"] = ProductModel.stock > 0 \
+            if available else ProductModel.stock == 0
+
+    return filters
+
+
+def list_products(
+        db: Session,
+        category: str = None,
+        price: float = None,
+        available: bool = None,
+        page: int = 1,
+        limit: int = 10,
+        fields: frozenset = None
+):
+    """
+    Lista os produtos selecionando apenas as colunas de saída.
+
+    As linhas não passam pelo ORM (sem identity map) e as imagens da página
+    são carregadas em uma única consulta, em vez de uma por produto. Com
+    fields, apenas as colunas dos campos pedidos são lidas, e as imagens
+    só são consultadas quando url_images é um deles.
+
+    Args:
+        db (Session): A sessão do banco de dados.
+        category (str): Seção do produto (opcional).
+        price (float): Preço máximo do produto (opcional).
+        available (bool): Disponibilidade em estoque (opcional).
+        page (int): Número da página.
+        limit (int): Limite de produtos por página.
+        fields (frozenset): Campos de ProductRow a carregar (todos quando
+        None).
+    Returns:
+        list[ProductRow]: Produtos da página.
+    """
+    columns, query = _products_query(
+        category, price, available, page, limit, fields
+    )
+
+    return _product_rows(query, columns, wants(fields, "url_images"), db)
+
+
+def stream_products(
+        db: Session,
+        category: str = None,
+        price: float = None,
+        available: bool = None,
+        page: int = 1,
+        limit: int = 10,
+        fields: frozenset = None,
+        batch_size: int = 1000
+):
+    """
+    Lê os produtos da listagem em lotes, para respostas em streaming.
+
+    Com yield_per, o PostgreSQL usa um cursor do lado do servidor, e apenas
+    um lote de linhas (e das suas imagens) fica em memória por vez.
+
+    Args:
+        db (Session): A sessão do banco de dados.
+        category (str): Seção do produto (opcional).
+        price (float): Preço máximo do produto (opcional).
+        available (bool): Disponibilidade em estoque (opcional).
+        page (int): Número da página.
+        limit (int): Limite de produtos por página.
+        fields (frozenset): Campos de ProductRow a carregar (todos quando
+        None).
+        batch_size (int): Quantidade de produtos por lote.
+    Yields:
+        list[ProductRow]: Lote de produtos.
+    """
+    columns, query = _products_query(
+        category, price, available, page, limit, fields
+    )
+    with_images = wants(fields, "url_images")
+    result = db.execute(query.execution_options(yield_per=batch_size))
+
+    for partition in result.partitions():
+        yield _build_product_rows(partition, columns, with_images, db)
+
+
+def _products_query(
+        category: str,
+        price: float,
+        available: bool,
+        page: int,
+        limit: int,
+        fields: frozenset
+):
+    """
+    Monta a consulta da listagem de produtos.
+
+    Args:
+        category (str): Seção do produto.
+        price (float): Preço máximo do produto.
+        available (bool): Disponibilidade em estoque.
+        page (int): Número da página.
+        limit (int): Limite de produtos por página.
+        fields (frozenset): Campos de ProductRow a carregar.
+    Returns:
+        tuple[dict, Select]: Colunas selecionadas, por campo de ProductRow,
+        e a consulta.
+    """
+    with_images = wants(fields, "url_images")
+    columns = {
+        name: column for name, column in PRODUCT_COLUMNS.items()
+        if wants(fields, name) or (name == "id" and with_images)
+    }
+    query = select(*columns.values()).where(
+        PRODUCT_ACTIVE, *_product_filters(category, price, available).values()
+    )
+
+    query = query.order_by(ProductModel.id) \
+        .offset((page - 1) * limit).limit(limit)
+
+    return columns, query
+
+
+def _product_rows(query, columns: dict, with_images: bool, db: Session):
+    """
+    Executa a consulta de produtos e converte as linhas em ProductRow.
+
+    Args:
+        query (Select): Consulta com as colunas selecionadas.
+        columns (dict): Colunas selecionadas, por campo de ProductRow.
+        with_images (bool): Se as URLs das imagens devem ser carregadas.
+        db (Session): A sessão do banco de dados.
+    Returns:
+        list[ProductRow]: Produtos retornados pela consulta.
+    """
+    return _build_product_rows(db.execute(query), columns, with_images, db)
+
+
+def _build_product_rows(
+        result,
+        columns: dict,
+        with_images: bool,
+        db: Session
+):
+    """
+    Converte linhas de produtos em ProductRow, carregando as imagens delas
+    em uma única consulta.
+
+    Args:
+        result (Iterable[Row]): Linhas com as colunas selecionadas.
+        columns (dict): Colunas selecionadas, por campo de ProductRow.
+        with_images (bool): Se as URLs das imagens devem ser carregadas.
+        db (Session): A sessão do banco de dados.
+    Returns:
+        list[ProductRow]: Produtos das linhas.
+    """
+    rows = [dict(zip(columns, row)) for row in result]
+
+    if with_images:
+        images = get_image_urls([row["id"] for row in rows], db)
+        for row in rows:
+            row["url_images"] = images.get(row["id"], [])
+
+    for row in rows:
+        if "price" in row:
+            row["price"] = from_cents(row["price"])
+
+    return [build_row(ProductRow, row) for row in rows]
+
+
+def get_products_by_ids(product_ids, db: Session):
+    """
+    Carrega vários produtos, com suas imagens, em lote.
+
+    Os IDs repetidos são consultados uma única vez, com uma consulta para
+    os produtos e outra para as imagens, independentemente da quantidade
+    de IDs (em vez de uma consulta por produto).
+
+    Args:
+        product_ids (Iterable[int]): IDs dos produtos (podem se repetir).
+        db (Session): A sessão do banco de dados.
+    Returns:
+        dict[int, ProductRow]: Produtos encontrados, por ID.
+    """
+    ids = set(product_ids)
+    if not ids:
+        return {}
+
+    query = select(*PRODUCT_COLUMNS.values()) \
+        .where(match_any(ProductModel.id, ids, db), PRODUCT_ACTIVE)
+
+    return {
+        product.id: product
+        for product in _product_rows(query, PRODUCT_COLUMNS, True, db)
+    }
+
+
+def list_product_summaries(
+        db: Session,
+        product_ids: list = None,
+        barcodes: list = None
+):
+    """
+    Lista os resumos (PDV) dos produtos, opcionalmente filtrados por IDs ou
+    por códigos de barras.
+
+    Args:
+        db (Session): A sessão do banco de dados.
+        product_ids (list[int]): IDs dos produtos (opcional).
+        barcodes (list[str]): Códigos de barras (opcional).
+    Returns:
+        list[ProductSummary]: Resumos dos produtos.
+    """
+    query = select(
+        ProductModel.id,
+        ProductModel.barcode,
+        ProductModel.description,
+        ProductModel.price_cents,
+        ProductModel.section
+    ).where(PRODUCT_ACTIVE)
+
+    if product_ids is not None:
+        query = query.where(match_any(ProductModel.id, product_ids, db))
+
+    if barcodes is not None:
+        query = query.where(match_any(ProductModel.barcode, barcodes, db))
+
+    return [
+        ProductSummary(
+            row.id,
+            row.barcode,
+            row.description,
+            from_cents(row.price_cents),
+            row.section
+        )
+        for row in db.execute(query)
+    ]
+
+
+def count_products(
+        db: Session,
+        category: str = None,
+        price: float = None,
+        available: bool = None,
+        estimated: bool = False
+):
+    """
+    Conta os produtos da listagem com os filtros informados.
+
+    Com estimated, a quantidade vem das estatísticas do planejador (sem
+    percorrer a tabela), quando o banco oferece esse recurso.
+
+    Args:
+        db (Session): A sessão do banco de dados.
+        category (str): Seção do produto (opcional).
+        price (float): Preço máximo do produto (opcional).
+        available (bool): Disponibilidade em estoque (opcional).
+        estimated (bool): Se a quantidade pode ser estimada.
+    Returns:
+        tuple[int, bool]: Quantidade e se ela é uma estimativa.
+    """
+    filters = [
+        PRODUCT_ACTIVE, *_product_filters(category, price, available).values()
+    ]
+
+    if estimated:
+        total = estimate_count(
+            select(ProductModel.id).where(*filters), db
+        )
+        if total is not None:
+            return total, True
+
+    total = db.scalar(
+        select(func.count()).select_from(ProductModel).where(*filters)
+    )
+    return total, False
+
+
+def _price_edges() -> list:
+    """
+    Obtém os limites das faixas de preço das facetas, em centavos.
+
+    Returns:
+        list[int]: Limites em ordem crescente.
+    """
+    return sorted({
+        to_cents(value)
+        for value in settings.PRODUCTS_PRICE_BUCKETS.split(",")
+        if value.strip()
+    })
+
+
+def count_product_facets(
+        db: Session,
+        category: str = None,
+        price: float = None,
+        available: bool = None
+):
+    """
+    Conta os produtos da listagem por seção, faixa de preço e
+    disponibilidade, junto com o total.
+
+    No PostgreSQL, todas as contagens saem de uma única consulta agrupada
+    com GROUPING SETS; nos demais bancos, é feita uma consulta por faceta.
+    Cada faceta aplica os demais filtros, exceto o seu próprio (com
+    FILTER), e o total aplica todos.
+
+    Args:
+        db (Session): A sessão do banco de dados.
+        category (str): Seção do produto (opcional).
+        price (float): Preço máximo do produto (opcional).
+        available (bool): Disponibilidade em estoque (opcional).
+    Returns:
+        tuple[int, ProductFacets]: Total e contagens por faceta.
+    """
+    filters = _product_filters(category, price, available)
+
+    def counted(ignored: str = None):
+        conditions = [
+            condition for name, condition in filters.items()
+            if name != ignored
+        ]
+        if not conditions:
+            return func.count()
+        return func.count().filter(and_(*conditions))
+
+    # Os limites entram como literais: com parâmetros, o PostgreSQL não
+    # reconhece a mesma expressão no SELECT e no GROUP BY
+    edges = _price_edges()
+    section = func.upper(ProductModel.section)
+    bucket = case(
+        *(
+            (ProductModel.price_cents < literal_column(str(edge)),
+             literal_column(str(index)))
+            for index, edge in enumerate(edges)
+        ),
+        else_=literal_column(str(len(edges)))
+    ) if edges else literal_column("0")
+    in_stock = ProductModel.stock > literal_column("0")
+
+    facets = {
+        "section": (section, counted("category")),
+        "price": (bucket, counted("price")),
+        "available": (in_stock, counted("available")),
+    }
+    groups = {name: [] for name in facets}
+
+    if db.get_bind().dialect.name == "postgresql":
+        query = select(
+            func.grouping(section, bucket, in_stock),
+            section, bucket, in_stock,
+            counted(),
+            *(count for _, count in facets.values())
+        ).group_by(func.grouping_sets(
+            tuple_(), tuple_(section), tuple_(bucket), tuple_(in_stock)
+        )).where(PRODUCT_ACTIVE)
+
+        # GROUPING marca com 1 as expressões fora do conjunto da linha:
+        # 0b111 é o total, e cada faceta deixa apenas o seu bit zerado
+        positions = {0b011: 0, 0b101: 1, 0b110: 2}
+        names = list(facets)
+        total = 0
+        for row in db.execute(query):
+            keys, counts = row[1:4], row[4:]
+            if row[0] == 0b111:
+                total = counts[0]
+                continue
+            position = positions[row[0]]
+            groups[names[position]].append(
+                (keys[position], counts[1 + position])
+            )
+    else:
+        total = db.scalar(
+            select(counted()).select_from(ProductModel).where(PRODUCT_ACTIVE)
+        )
+        for name, (key, count) in facets.items():
+            groups[name] = db.execute(
+                select(key, count).select_from(ProductModel)
+                .where(PRODUCT_ACTIVE).group_by(key)
+            ).all()
+
+    sections = [
+        SectionCount(key, count)
+        for key, count in sorted(groups["section"]) if count
+    ]
+
+    bucket_counts = dict(groups["price"])
+    bounds = [0, *edges]
+    prices = [
+        PriceBucket(
+            from_cents(low),
+            from_cents(bounds[index + 1]) if index + 1 < len(bounds)
+            else None,
+            bucket_counts.get(index, 0)
+        )
+        for index, low in enumerate(bounds)
+    ]
+
+    stock_counts = dict(groups["available"])
+
+    return total, ProductFacets(
+        sections,
+        prices,
+        stock_counts.get(True, 0),
+        stock_counts.get(False, 0)
+    )
+
+
+def mark_images_deleted(product: ProductModel, db: Session):
+    """
+    Marca como excluídas as imagens atuais de um produto.
+
+    Args:
+        product (ProductModel): Produto cujas imagens serão excluídas.
+        db (Session): A sessão do banco de dados.
+    """
+    db.execute(
+        update(ProductImageModel)
+        .where(
+            ProductImageModel.product_id == product.id,
+            ProductImageModel.deleted_at.is_(None)
+        )
+        .values(deleted_at=func.now(), updated_at=func.now())
+    )
+    product.updated_at = func.now()
+
+
+def mark_product_deleted(product: ProductModel, db: Session):
+    """
+    Marca um produto, e as suas imagens, como excluídos.
+
+    As linhas permanecem como marcadores de exclusão até o fim do prazo de
+    retenção (PRODUCTS_TOMBSTONE_RETENTION_DAYS), para que a sincronização
+    incremental informe a exclusão aos aplicativos.
+
+    Args:
+        product (ProductModel): Produto a ser excluído.
+        db (Session): A sessão do banco de dados.
+    """
+    mark_images_deleted(product, db)
+    product.deleted_at = func.now()
+
+
+def _changes_horizon(db: Session) -> datetime:
+    """
+    Obtém, no relógio do banco, o instante antes do qual todas as
+    alterações de produtos já foram confirmadas.
+
+    No PostgreSQL, updated_at é o início da transação que alterou a linha:
+    o horizonte é o início da transação mais antiga ainda aberta (ou o
+    instante atual, sem transações abertas). Nos demais bancos, desconta
+    PRODUCTS_CHANGES_SETTLE_SECONDS do instante atual.
+
+    Args:
+        db (Session): A sessão do banco de dados (primário).
+    Returns:
+        datetime: Horizonte das alterações (exclusivo).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return db.execute(text(
+            "SELECT CAST(least(statement_timestamp(), ("
+            "SELECT min(xact_start) FROM pg_stat_activity "
+            "WHERE datname = current_database() "
+            "AND backend_type = 'client backend' "
+            "AND pid <> pg_backend_pid()"
+            ")) AS timestamp)"
+        )).scalar()
+
+    return db.execute(select(func.now())).scalar() - timedelta(
+        seconds=settings.PRODUCTS_CHANGES_SETTLE_SECONDS
+    )
+
+
+def list_product_changes(
+        db: Session,
+        since: tuple = None,
+        limit: int = 500
+):
+    """
+    Lista os produtos alterados ou excluídos após um cursor, na ordem das
+    alterações.
+
+    A consulta percorre o índice (updated_at, id) a partir do cursor, até
+    o horizonte de _changes_horizon: transações em andamento podem gravar
+    um updated_at anterior ao das já confirmadas, e o cursor passaria por
+    elas.
+
+    Args:
+        db (Session): A sessão do banco de dados (primário, onde as
+        transações em andamento são visíveis).
+        since (tuple[datetime, int]): Cursor da sincronização anterior;
+        sem ele, são listados todos os produtos (sem as exclusões).
+        limit (int): Quantidade máxima de alterações.
+    Returns:
+        ProductChanges: Produtos alterados, IDs excluídos e o novo cursor.
+    """
+    horizon = _changes_horizon(db)
+
+    query = select(
+        *PRODUCT_COLUMNS.values(),
+        ProductModel.updated_at,
+        ProductModel.deleted_at
+    ).where(ProductModel.updated_at < horizon)
+
+    if since is None:
+        query = query.where(PRODUCT_ACTIVE)
+    else:
+        query = query.where(
+            tuple_(ProductModel.updated_at, ProductModel.id) > tuple_(*since)
+        )
+
+    rows = db.execute(
+        query.order_by(ProductModel.updated_at, ProductModel.id).limit(limit)
+    ).all()
+
+    size = len(PRODUCT_COLUMNS)
+    changes = ProductChanges(
+        items=_build_product_rows(
+            (row[:size] for row in rows if row.deleted_at is None),
+            PRODUCT_COLUMNS, True, db
+        ),
+        deleted=[row.id for row in rows if row.deleted_at is not None],
+        cursor=None,
+        has_more=len(rows) == limit
+    )
+
+    if rows:
+        changes.cursor = format_cursor(rows[-1].updated_at, rows[-1].id)
+    elif since is not None:
+        changes.cursor = format_cursor(*since)
+    else:
+        changes.cursor = format_cursor(horizon, 0)
+
+    return changes
+
+
+def purge_product_tombstones(db: Session, before: datetime) -> int:
+    """
+    Remove definitivamente os produtos e imagens excluídos antes de uma
+    data.
+
+    Produtos ainda referenciados por itens de pedidos permanecem como
+    marcadores: a remoção excluiria, em cascata, os itens do histórico de
+    pedidos.
+
+    Args:
+        db (Session): A sessão do banco de dados.
+        before (datetime): Exclusões anteriores a esta data são removidas.
+    Returns:
+        int: Quantidade de produtos removidos.
+    """
+    purgeable = and_(
+        ProductModel.deleted_at < before,
+        ~exists().where(OrderItemModel.product_id == ProductModel.id)
+    )
+
+    db.execute(
+        delete(ProductImageModel).where(or_(
+            ProductImageModel.deleted_at < before,
+            ProductImageModel.product_id.in_(
+                select(ProductModel.id).where(purgeable)
+            )
+        ))
+    )
+    deleted = db.execute(delete(ProductModel).where(purgeable)).rowcount
+    db.commit()
+    return deleted
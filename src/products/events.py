@@ -0,0 +1,97 @@
+# Imports de terceiros
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.database import SessionLocal
+from core.notifications import notify
+from src.products.models import ProductImageModel, ProductModel
+
+# Canal do LISTEN/NOTIFY que avisa os workers sobre produtos alterados
+# (payload: ID do produto)
+PRODUCTS_CHANNEL = "products_changed"
+
+# Canal das alterações apenas de estoque (payload: "ID:estoque")
+STOCK_CHANNEL = "products_stock"
+
+# Colunas cuja alteração é notificada em PRODUCTS_CHANNEL
+PRODUCT_ATTRIBUTES = (
+    "barcode", "description", "price_cents", "section", "expiry_date",
+    "deleted_at"
+)
+
+
+def notify_stock(rows, db: Session):
+    """
+    Notifica os workers sobre o novo estoque de produtos.
+
+    Args:
+        rows (Iterable[tuple[int, int]]): Pares (ID do produto, estoque).
+        db (Session): Sessão do banco de dados.
+    """
+    for product_id, stock in rows:
+        notify(STOCK_CHANNEL, f"{product_id}:{stock}", db)
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _touch_image_products(session: Session, flush_context, instances):
+    """
+    Renova o updated_at dos produtos cujas imagens foram incluídas,
+    alteradas ou excluídas, para que a sincronização incremental os envie.
+    """
+    product_ids = {
+        instance.product_id
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(instance, ProductImageModel)
+    }
+    if not product_ids:
+        return
+
+    with session.no_autoflush:
+        for product_id in product_ids:
+            product = session.get(ProductModel, product_id)
+            if product is not None:
+                product.updated_at = func.now()
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _notify_product_changes(session: Session, flush_context):
+    """
+    Notifica os workers sobre os produtos criados, alterados ou excluídos.
+
+    As notificações são entregues no commit da transação. Alterações apenas
+    de estoque (ex.: criação de pedidos) vão para STOCK_CHANNEL já com o
+    novo valor, dispensando uma nova leitura do produto.
+    """
+    changed = set()
+    stock = {}
+
+    for instance in session.new:
+        if isinstance(instance, ProductModel):
+            changed.add(instance.id)
+        elif isinstance(instance, ProductImageModel):
+            changed.add(instance.product_id)
+
+    for instance in session.deleted:
+        if isinstance(instance, ProductModel):
+            changed.add(instance.id)
+        elif isinstance(instance, ProductImageModel):
+            changed.add(instance.product_id)
+
+    for instance in session.dirty:
+        if not isinstance(instance, ProductModel):
+            continue
+
+        state = inspect(instance)
+        if any(
+            state.attrs[name].history.has_changes()
+            for name in PRODUCT_ATTRIBUTES
+        ):
+            changed.add(instance.id)
+        elif state.attrs.stock.history.has_changes():
+            stock[instance.id] = instance.stock
+
+    for product_id in changed:
+        notify(PRODUCTS_CHANNEL, str(product_id), session)
+
+    notify_stock(stock.items(), session)
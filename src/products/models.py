@@ -1,5 +1,6 @@
 # Imports de terceiros
-from sqlalchemy import Column, Date, Float, ForeignKey, Integer, String
+from sqlalchemy import (BigInteger, Column, Date, DateTime, ForeignKey, Index,
+                        Integer, String, func, text)
 from sqlalchemy.orm import relationship
 
 # Imports locais
@@ -9,16 +10,39 @@ from core.database import Base
 class ProductModel(Base):
     """
     Modelo de produto para o banco de dados.
+
+    O preço é armazenado em centavos inteiros (price_cents); a API continua
+    recebendo e retornando o valor em reais.
+
+    Produtos excluídos permanecem como marcadores (deleted_at preenchido)
+    até o fim do prazo de retenção, para que a sincronização incremental
+    (/products/changes) informe a exclusão; updated_at é renovado a cada
+    alteração do produto ou das suas imagens, com o relógio do banco
+    (início da transação).
     """
     __tablename__ = "products"
+    __table_args__ = (
+        # O código de barras de um produto excluído pode ser reutilizado
+        Index(
+            "ix_products_barcode_active", "barcode",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL")
+        ),
+        Index("ix_products_updated_at_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     description = Column(String, nullable=False)
-    price = Column(Float, nullable=False)
-    barcode = Column(String, unique=True, nullable=False)
+    price_cents = Column(BigInteger, nullable=False)
+    barcode = Column(String, nullable=False)
     section = Column(String, nullable=False)
     stock = Column(Integer, nullable=False)
     expiry_date = Column(Date, nullable=True)
+    updated_at = Column(
+        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    )
+    deleted_at = Column(DateTime, nullable=True)
 
     # Relacionamento com a tabela de imagens
     images = relationship(
@@ -27,16 +51,33 @@ class ProductModel(Base):
         cascade="all, delete-orphan"
     )
 
+    @property
+    def active_images(self) -> list:
+        """
+        Imagens do produto que não foram excluídas.
+        """
+        return [image for image in self.images if image.deleted_at is None]
+
 
 class ProductImageModel(Base):
     """
     Modelo para imagens associadas a um produto.
+
+    Assim como os produtos, as imagens excluídas permanecem como marcadores
+    (deleted_at preenchido) até o fim do prazo de retenção.
     """
     __tablename__ = "product_images"
+    __table_args__ = (
+        Index("ix_product_images_updated_at_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     image_url = Column(String, nullable=False)
+    updated_at = Column(
+        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    )
+    deleted_at = Column(DateTime, nullable=True)
 
     # Relacionamento com o modelo de produto
     product = relationship("ProductModel", back_populates="images")
@@ -1,21 +1,38 @@
 # Imports de terceiros
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Annotated, List
 
 # Imports de terceiros
-from fastapi import APIRouter, File, UploadFile
+from fastapi import APIRouter, File, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.params import Depends
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
 # Imports locais
-from core.database import get_db
-from core.exceptions import APIException, SuccessResponse
-from src.auth.jwt_auth import get_current_user
+from core.compression import precompress_file
+from core.config import settings
+from core.database import (get_db, get_read_db, open_read_session,
+                           stream_with_read_db)
+from core.exceptions import APIException
+from core.fields import parse_cursor, parse_fields, parse_ids
+from core.money import from_cents, to_cents
+from core.responses import streaming_response, success_response
+from src.auth.jwt_auth import get_current_user, get_current_user_id
 from src.auth.models import UserModel
-from src.products.crud import get_product_by_barcode, get_product_by_id
+from src.jobs.crud import enqueue_job
+from src.products.cache import get_summaries_by_barcodes
+from src.products.crud import (count_product_facets, count_products,
+                               get_product_by_barcode, get_product_by_id,
+                               get_products_by_ids, list_product_changes,
+                               list_products, mark_images_deleted,
+                               mark_product_deleted, stream_products)
 from src.products.models import ProductImageModel, ProductModel
-from src.products.schemas import ProductOutput
+from src.products.schemas import (ProductBatch, ProductListing,
+                                  ProductOutput, ProductRow,
+                                  ProductSummaryBatch)
+from src.products.snapshot import product_snapshot
 
 router = APIRouter(
     prefix="/products",
@@ -33,7 +50,7 @@ IMAGES_DIR = BASE_DIR / "static" / "images"  # Diretório das imagens
 )
 async def get_product(
         product_id: int,
-        db: Session = Depends(get_db),
+        db: Session = Depends(get_read_db),
         current_user: Annotated[UserModel, Depends(get_current_user)] = None
 ):
     """
@@ -49,9 +66,7 @@ async def get_product(
         lista de URLs de imagens.
     """
 
-    product = db.query(ProductModel).filter(
-        ProductModel.id == product_id
-    ).first()
+    product = get_product_by_id(product_id, db)
 
     # Verifica se o produto existe
     if not product:
@@ -65,20 +80,207 @@ async def get_product(
     product_data = ProductOutput(
         id=product.id,
         description=product.description,
-        price=product.price,
+        price=from_cents(product.price_cents),
         barcode=product.barcode,
         section=product.section,
         stock=product.stock,
         expiry_date=product.expiry_date,
-        url_images=[image.image_url for image in product.images]
+        url_images=[image.image_url for image in product.active_images]
     )
 
-    return SuccessResponse(
+    return success_response(
         data=product_data,
         message="Dados do produto retornado com sucesso"
     )
 
 
+@router.get(
+    "",
+    summary="Obter vários produtos pelos IDs, em uma única requisição"
+)
+def get_products_batch(
+        ids: str,
+        db: Session = Depends(get_read_db),
+        current_user: Annotated[UserModel, Depends(get_current_user)] = None
+):
+    """
+    Obtém vários produtos pelos IDs (ex.: ?ids=3,1,2).
+
+    Os produtos são retornados na ordem dos IDs informados, e os IDs não
+    encontrados são listados em missing.
+
+    Args:
+        ids (str): IDs dos produtos separados por vírgula (no máximo
+        BATCH_MAX_IDS).
+        db (Session): Sessão do banco de dados.
+        current_user (UserModel): Cliente autenticado.
+    Returns:
+        SuccessResponse: Produtos encontrados e IDs não encontrados.
+    """
+    product_ids = parse_ids(ids, settings.BATCH_MAX_IDS)
+    products = get_products_by_ids(product_ids, db)
+
+    # Mantém a ordem dos IDs informados
+    batch = ProductBatch(items=[], missing=[])
+    for product_id in product_ids:
+        if product_id in products:
+            batch.items.append(products[product_id])
+        else:
+            batch.missing.append(product_id)
+
+    return success_response(
+        data=batch,
+        message="Produtos retornados com sucesso"
+    )
+
+
+@router.get(
+    "/changes",
+    summary="Obter os produtos alterados e excluídos desde a última "
+            "sincronização"
+)
+def get_product_changes(
+        since: str = None,
+        limit: int = 500,
+        db: Session = Depends(get_db),
+        current_user: Annotated[UserModel, Depends(get_current_user)] = None
+):
+    """
+    Obtém as alterações do catálogo desde o cursor da sincronização
+    anterior, para a sincronização incremental dos aplicativos.
+
+    Sem since, todo o catálogo é enviado (em páginas); depois, basta
+    enviar o cursor retornado para receber apenas o que mudou. Enquanto
+    has_more for verdadeiro, a próxima página deve ser pedida em seguida.
+
+    Args:
+        since (str): Cursor retornado pela sincronização anterior.
+        limit (int): Quantidade máxima de alterações (no máximo
+        PRODUCTS_CHANGES_MAX_LIMIT).
+        db (Session): Sessão do banco de dados primário (o horizonte
+        depende das transações em andamento).
+        current_user (UserModel): Cliente autenticado.
+    Returns:
+        SuccessResponse: Produtos alterados, IDs excluídos e o novo
+        cursor.
+    """
+    cursor = parse_cursor(since) if since else None
+
+    # As exclusões anteriores à retenção já foram removidas
+    retention = timedelta(days=settings.PRODUCTS_TOMBSTONE_RETENTION_DAYS)
+    if cursor and cursor[0] < datetime.now() - retention:
+        raise APIException(
+            code=410,
+            message="Cursor expirado",
+            description="O cursor é anterior ao prazo de retenção das "
+                        "exclusões; refaça a sincronização sem since"
+        )
+
+    changes = list_product_changes(
+        db, cursor, min(max(limit, 1), settings.PRODUCTS_CHANGES_MAX_LIMIT)
+    )
+
+    return success_response(
+        data=changes,
+        message="Alterações do catálogo retornadas com sucesso"
+    )
+
+
+@router.get(
+    "/by_barcode/{code}",
+    summary="Obter o resumo de um produto pelo código de barras (PDV)"
+)
+def get_product_by_code(
+        code: str,
+        request: Request,
+        current_user_id: Annotated[int, Depends(get_current_user_id)] = None
+):
+    """
+    Obtém o resumo de um produto pelo código de barras.
+
+    A autenticação e a busca são feitas em memória no worker (filtro de
+    tokens revogados, usuários recentes e mapa de códigos de barras), sem
+    acesso ao banco enquanto estiverem sincronizados.
+
+    Args:
+        code (str): Código de barras.
+        request (Request): Requisição (sessão de leitura sem o mapa).
+        current_user_id (int): ID do cliente autenticado.
+    Returns:
+        SuccessResponse: Resumo do produto.
+    """
+    summary = get_summaries_by_barcodes(
+        [code], lambda: open_read_session(request)
+    ).get(code)
+
+    # Verifica se o produto existe
+    if not summary:
+        raise APIException(
+            code=404,
+            message="Produto não encontrado",
+            description=f"Nenhum produto com o código de barras {code}"
+        )
+
+    return success_response(
+        data=summary,
+        message="Produto retornado com sucesso"
+    )
+
+
+@router.get(
+    "/by_barcode",
+    summary="Obter o resumo de vários produtos pelos códigos de barras"
+)
+def get_products_by_codes(
+        codes: str,
+        request: Request,
+        current_user_id: Annotated[int, Depends(get_current_user_id)] = None
+):
+    """
+    Obtém o resumo de vários produtos pelos códigos de barras
+    (ex.: ?codes=789123,789456).
+
+    Os produtos são retornados na ordem dos códigos informados, e os
+    códigos não encontrados são listados em missing.
+
+    Args:
+        codes (str): Códigos de barras separados por vírgula (no máximo
+        BATCH_MAX_IDS).
+        request (Request): Requisição (sessão de leitura sem o mapa).
+        current_user_id (int): ID do cliente autenticado.
+    Returns:
+        SuccessResponse: Produtos encontrados e códigos não encontrados.
+    """
+    barcodes = list(dict.fromkeys(
+        code.strip() for code in codes.split(",") if code.strip()
+    ))
+
+    if not barcodes or len(barcodes) > settings.BATCH_MAX_IDS:
+        raise APIException(
+            code=400,
+            message="Códigos de barras inválidos",
+            description=f"Informe de 1 a {settings.BATCH_MAX_IDS} códigos "
+                        f"de barras separados por vírgula"
+        )
+
+    summaries = get_summaries_by_barcodes(
+        barcodes, lambda: open_read_session(request)
+    )
+
+    # Mantém a ordem dos códigos informados
+    batch = ProductSummaryBatch(items=[], missing=[])
+    for barcode in barcodes:
+        if barcode in summaries:
+            batch.items.append(summaries[barcode])
+        else:
+            batch.missing.append(barcode)
+
+    return success_response(
+        data=batch,
+        message="Produtos retornados com sucesso"
+    )
+
+
 @router.get(
     "/get_products",
     summary="Listar todos os produtos, com suporte a paginação e "
@@ -90,54 +292,97 @@ async def get_products(
         available: bool = None,
         page: int = 1,
         limit: int = 10,
-        db: Session = Depends(get_db),
+        fields: str = None,
+        count: str = None,
+        facets: bool = False,
+        request: Request = None,
+        db: Session = Depends(get_read_db),
         current_user: Annotated[UserModel, Depends(get_current_user)] = None
 ):
     """
     Obtém uma lista de produtos com suporte a paginação e filtros.
 
+    Com count ou facets, a lista passa a vir em items, junto com o total
+    (exato ou estimado pelas estatísticas do banco) e as contagens por
+    seção, faixa de preço e disponibilidade. Sem eles, e com limit acima
+    de STREAMING_LIMIT_THRESHOLD, a lista é enviada em streaming, lida do
+    banco em lotes.
+
     Args:
         category (str): Categoria do produto.
         price (float): Preço do produto.
         available (bool): Disponibilidade do produto.
         page (int): Número da página.
         limit (int): Limite de produtos por página.
+        fields (str): Campos retornados, separados por vírgula (ex.:
+        "id,description,price"); todos quando não informado.
+        count (str): Inclui o total de produtos: "exact" ou "estimated".
+        facets (bool): Inclui o total e as contagens por faceta.
+        request (Request): Requisição.
         db (Session): Sessão do banco de dados.
         current_user (UserModel): Cliente autenticado.
     Returns:
-        list[ProductModel]: Lista de produtos filtrados e paginados.
+        list[ProductModel] | ProductListing: Lista de produtos filtrados e
+        paginados, acompanhada do total e das facetas quando solicitados.
     """
-    products = db.query(ProductModel)
+    if count not in (None, "exact", "estimated"):
+        raise APIException(
+            code=400,
+            message="Contagem inválida",
+            description="Valores aceitos para count: exact, estimated"
+        )
 
-    if category:
-        products = products.filter(
-            func.upper(ProductModel.section) == category.upper()
+    selected = parse_fields(fields, ProductRow)
+    paged = count is None and not facets
+
+    # Listagens grandes (ex.: conciliação) são lidas do banco em lotes
+    if paged and limit > settings.STREAMING_LIMIT_THRESHOLD:
+        return streaming_response(
+            stream_with_read_db(
+                request, stream_products, category, price, available, page,
+                limit, selected, settings.STREAMING_BATCH_SIZE
+            ),
+            message="Lista de produtos retornada com sucesso",
+            output_type=List[ProductRow],
+            fields=selected
         )
 
-    if price:
-        products = products.filter(ProductModel.price <= price)
-
-    if available is not None:
-        products = products.filter(ProductModel.stock > 0) \
-            if available else products.filter(ProductModel.stock == 0)
-
-    # Paginando os resultados
-    products = products.offset((page - 1) * limit).limit(limit).all()
-
-    return SuccessResponse(
-        data=[
-            ProductOutput(
-                id=product.id,
-                description=product.description,
-                price=product.price,
-                barcode=product.barcode,
-                section=product.section,
-                stock=product.stock,
-                expiry_date=product.expiry_date,
-                url_images=[image.image_url for image in product.images]
-            ) for product in products
-        ],
-        message="Lista de produtos retornada com sucesso"
+    # A cópia em memória atende à listagem quando sincronizada
+    products = product_snapshot.list_products(
+        category, price, available, page, limit
+    )
+    if products is None:
+        products = list_products(
+            db, category, price, available, page, limit, selected
+        )
+
+    if paged:
+        return success_response(
+            data=products,
+            message="Lista de produtos retornada com sucesso",
+            fields=selected
+        )
+
+    listing = ProductListing(products, None, False, None)
+    if facets:
+        # O total sai da mesma consulta das facetas
+        listing.total, listing.facets = count_product_facets(
+            db, category, price, available
+        )
+    else:
+        listing.total, listing.estimated = count_products(
+            db, category, price, available, count == "estimated"
+        )
+
+    return success_response(
+        data=listing,
+        message="Lista de produtos retornada com sucesso",
+        fields=None if selected is None else {
+            "items": {"__all__": selected},
+            "total": True,
+            "estimated": True,
+            "facets": True,
+        }
     )
 
 
@@ -195,7 +440,7 @@ async def create_product(
     # Cria o modelo do produto
     novo_produto = ProductModel(
         description=description,
-        price=price,
+        price_cents=to_cents(price),
         barcode=barcode,
         section=section,
         stock=stock,
@@ -217,6 +462,9 @@ async def create_product(
         with open(caminho_arquivo, "wb") as objeto_arquivo:
             objeto_arquivo.write(await arquivo.read())
 
+        # Gera as versões pré-comprimidas servidas em /static
+        await run_in_threadpool(precompress_file, caminho_arquivo)
+
         # Cria uma entrada na tabela product_images
         nova_imagem = ProductImageModel(
             product_id=novo_produto.id,
@@ -227,7 +475,7 @@ async def create_product(
 
     db.commit()
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Produto criado com sucesso"
     )
@@ -281,7 +529,7 @@ async def update_product(
         product.description = description
 
     if price:
-        product.price = price
+        product.price_cents = to_cents(price)
 
     if barcode:
         barcode_model = get_product_by_barcode(barcode, db)
@@ -307,15 +555,10 @@ async def update_product(
         product.expiry_date = expiry_date
 
     if files:
-        # Deleta o arquivo da imagem se existir
-        for image in product.images:
-            if Path(image.image_url).exists():
-                Path(image.image_url).unlink()
+        old_images = {image.image_url for image in product.active_images}
 
-        # Deleta as imagens existentes do banco de dados
-        db.query(ProductImageModel).filter(
-            ProductImageModel.product_id == product_id
-        ).delete()
+        # Marca as imagens existentes como excluídas
+        mark_images_deleted(product, db)
 
         # Certifique-se de que o diretório de imagens existe
         IMAGES_DIR.mkdir(parents=True, exist_ok=True)
@@ -328,6 +571,9 @@ async def update_product(
             with open(caminho_arquivo, "wb") as objeto_arquivo:
                 objeto_arquivo.write(await arquivo.read())
 
+            # Gera as versões pré-comprimidas servidas em /static
+            await run_in_threadpool(precompress_file, caminho_arquivo)
+
             # Cria o modelo da imagem
             nova_imagem = ProductImageModel(
                 product_id=product_id,
@@ -335,11 +581,16 @@ async def update_product(
             )
 
             db.add(nova_imagem)
+            old_images.discard(str(caminho_arquivo))
+
+        # Agenda a exclusão dos arquivos antigos que não foram sobrescritos
+        if old_images:
+            enqueue_job("remove_files", {"paths": sorted(old_images)}, db)
 
     db.commit()
     db.refresh(product)
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Produto atualizado com sucesso"
     )
@@ -371,15 +622,20 @@ async def delete_product(
             description=f"O produto com o ID {product_id} não foi encontrado"
         )
 
-    # Deleta o arquivo da imagem se existir
-    for image in product.images:
-        if Path(image.image_url).exists():
-            Path(image.image_url).unlink()
+    # Agenda a exclusão dos arquivos das imagens e suas versões comprimidas
+    images = product.active_images
+    if images:
+        enqueue_job(
+            "remove_files",
+            {"paths": [image.image_url for image in images]},
+            db
+        )
 
-    db.delete(product)
+    # O produto permanece como marcador de exclusão para a sincronização
+    mark_product_deleted(product, db)
     db.commit()
 
-    return SuccessResponse(
+    return success_response(
         data=None,
         message="Produto excluído com sucesso"
     )
@@ -1,4 +1,5 @@
 # Imports do sistema
+from dataclasses import dataclass
 from datetime import date
 from typing import List, Optional
 
@@ -24,3 +25,123 @@ class ProductOutput(BaseModel):
         Configurações adicionais para o modelo.
         """
         from_attributes = True
+
+
+@dataclass(slots=True, frozen=True)
+class ProductRow:
+    """
+    Dados de um produto em listagens, lidos diretamente das colunas.
+
+    Estrutura leve (sem validação e sem rastreamento pela sessão) com os
+    mesmos campos de ProductOutput. Imutável: a cópia em memória do
+    catálogo (snapshot) compartilha as linhas com as respostas em
+    andamento.
+    """
+    id: int
+    description: str
+    price: float
+    barcode: str
+    section: str
+    stock: int
+    expiry_date: Optional[date]
+    url_images: List[str]
+
+
+@dataclass(slots=True)
+class ProductBatch:
+    """
+    Resultado da busca de vários produtos pelos IDs.
+
+    Os produtos seguem a ordem dos IDs informados; os IDs sem produto
+    correspondente são listados em missing.
+    """
+    items: List[ProductRow]
+    missing: List[int]
+
+
+@dataclass(slots=True)
+class ProductSummary:
+    """
+    Resumo de um produto para leitura de código de barras (PDV).
+    """
+    id: int
+    barcode: str
+    description: str
+    price: float
+    section: str
+
+
+@dataclass(slots=True)
+class ProductSummaryBatch:
+    """
+    Resultado da busca de vários produtos pelos códigos de barras.
+
+    Os produtos seguem a ordem dos códigos informados; os códigos sem
+    produto correspondente são listados em missing.
+    """
+    items: List[ProductSummary]
+    missing: List[str]
+
+
+@dataclass(slots=True)
+class SectionCount:
+    """
+    Quantidade de produtos de uma seção.
+    """
+    section: str
+    count: int
+
+
+@dataclass(slots=True)
+class PriceBucket:
+    """
+    Quantidade de produtos em uma faixa de preço [min, max); a última faixa
+    não tem limite superior (max nulo).
+    """
+    min: float
+    max: Optional[float]
+    count: int
+
+
+@dataclass(slots=True)
+class ProductFacets:
+    """
+    Contagens dos produtos por seção, faixa de preço e disponibilidade.
+
+    Cada contagem aplica os demais filtros da listagem, exceto o seu próprio
+    (ex.: sections ignora category), indicando quantos produtos a listagem
+    retornaria ao trocar aquele filtro.
+    """
+    sections: List[SectionCount]
+    prices: List[PriceBucket]
+    in_stock: int
+    out_of_stock: int
+
+
+@dataclass(slots=True)
+class ProductListing:
+    """
+    Página de produtos acompanhada do total e das contagens por faceta.
+
+    total é nulo quando não solicitado; estimated indica que ele veio das
+    estatísticas do banco, e não de uma contagem.
+    """
+    items: List[ProductRow]
+    total: Optional[int]
+    estimated: bool
+    facets: Optional[ProductFacets]
+
+
+@dataclass(slots=True)
+class ProductChanges:
+    """
+    Alterações do catálogo desde o cursor informado.
+
+    items traz os produtos incluídos ou alterados (com as imagens atuais) e
+    deleted, os IDs dos excluídos. O cursor deve ser enviado em since na
+    próxima sincronização; com has_more, ainda há alterações a buscar.
+    """
+    items: List[ProductRow]
+    deleted: List[int]
+    cursor: Optional[str]
+    has_more: bool
@@ -0,0 +1,296 @@
+# Imports do sistema
+import threading
+from dataclasses import replace
+
+# Imports de terceiros
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Imports locais
+from core.config import settings
+from core.database import SessionLocal, match_any
+from core.money import from_cents, to_cents
+from core.notifications import Subscriber, listener
+from src.products.crud import PRODUCT_ACTIVE, get_image_urls
+from src.products.events import PRODUCTS_CHANNEL, STOCK_CHANNEL
+from src.products.models import ProductModel
+from src.products.schemas import ProductRow
+
+
+class _Columns:
+    """
+    Colunas do catálogo alinhadas por posição e ordenadas pelo ID.
+
+    Um conjunto de colunas nunca é alterado depois de publicado: cada
+    alteração cria cópias das colunas afetadas (replace) e troca o conjunto
+    inteiro, de modo que um leitor que obteve a referência vê sempre as
+    máscaras e as linhas de um mesmo estado.
+    """
+    __slots__ = ("ids", "price_cents", "stock", "section", "rows")
+
+    def __init__(self, ids, price_cents, stock, section, rows):
+        self.ids = ids
+        self.price_cents = price_cents
+        self.stock = stock
+        self.section = section
+        self.rows = rows
+        for column in (ids, price_cents, stock, section):
+            column.flags.writeable = False
+
+    def replace(self, index: int, row, **values) -> "_Columns":
+        """
+        Cria um novo conjunto de colunas com uma linha substituída.
+
+        Args:
+            index (int): Posição da linha.
+            row (ProductRow): Nova linha.
+            **values: Novos valores da linha nas colunas NumPy.
+        Returns:
+            _Columns: Colunas com a alteração.
+        """
+        columns = {
+            name: getattr(self, name)
+            for name in ("ids", "price_cents", "stock", "section")
+        }
+        for name, value in values.items():
+            column = columns[name].copy()
+            column[index] = value
+            columns[name] = column
+
+        rows = list(self.rows)
+        rows[index] = row
+        return _Columns(rows=rows, **columns)
+
+    def position(self, product_id: int):
+        index = int(np.searchsorted(self.ids, product_id))
+        if index < len(self.ids) and self.ids[index] == product_id:
+            return index
+        return None
+
+
+class ProductSnapshot(Subscriber):
+    """
+    Cópia colunar (NumPy), em memória do worker, do catálogo de produtos.
+
+    Responde às combinações de filtros da listagem (seção, preço máximo e
+    disponibilidade) e à paginação com máscaras vetorizadas, sem consultar
+    o banco. A cópia é carregada quando a conexão de escuta do worker é
+    aberta e atualizada a cada notificação: o produto alterado é relido do
+    banco, e o estoque é aplicado diretamente a partir do payload.
+
+    Enquanto não está sincronizada (desabilitada, inicialização, conexão de
+    escuta perdida, PgBouncer ou bancos sem LISTEN/NOTIFY), list_products
+    retorna None e a listagem consulta o banco.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.columns = None
+        self.sections = {}
+
+    @property
+    def synced(self) -> bool:
+        return self.columns is not None
+
+    def _section_code(self, section: str) -> int:
+        # A listagem compara as seções sem diferenciar maiúsculas
+        return self.sections.setdefault(section.upper(), len(self.sections))
+
+    def _read(self, db: Session, product_ids: list = None) -> list:
+        query = select(
+            ProductModel.id,
+            ProductModel.description,
+            ProductModel.price_cents,
+            ProductModel.barcode,
+            ProductModel.section,
+            ProductModel.stock,
+            ProductModel.expiry_date
+        ).where(PRODUCT_ACTIVE).order_by(ProductModel.id)
+
+        if product_ids is not None:
+            query = query.where(match_any(ProductModel.id, product_ids, db))
+
+        rows = db.execute(query).all()
+        images = get_image_urls([row.id for row in rows], db)
+
+        return [
+            (
+                row.price_cents,
+                ProductRow(
+                    row.id,
+                    row.description,
+                    from_cents(row.price_cents),
+                    row.barcode,
+                    row.section,
+                    row.stock,
+                    row.expiry_date,
+                    images.get(row.id, [])
+                )
+            )
+            for row in rows
+        ]
+
+    def _build(self, products: list) -> _Columns:
+        return _Columns(
+            ids=np.fromiter(
+                (row.id for _, row in products), np.int64, len(products)
+            ),
+            price_cents=np.fromiter(
+                (cents for cents, _ in products), np.int64, len(products)
+            ),
+            stock=np.fromiter(
+                (row.stock for _, row in products), np.int64, len(products)
+            ),
+            section=np.fromiter(
+                (self._section_code(row.section) for _, row in products),
+                np.int32, len(products)
+            ),
+            rows=[row for _, row in products]
+        )
+
+    def reload(self):
+        """
+        Recarrega a cópia com todo o catálogo.
+        """
+        db = SessionLocal()
+        try:
+            products = self._read(db)
+        finally:
+            db.close()
+
+        with self.lock:
+            self.columns = self._build(products)
+
+    def refresh(self, product_id: int):
+        """
+        Atualiza, insere ou remove um produto da cópia.
+
+        Args:
+            product_id (int): ID do produto alterado.
+        """
+        db = SessionLocal()
+        try:
+            products = self._read(db, [product_id])
+        finally:
+            db.close()
+
+        with self.lock:
+            columns = self.columns
+            if columns is None:
+                return
+
+            index = columns.position(product_id)
+
+            if index is not None and products:
+                cents, row = products[0]
+                self.columns = columns.replace(
+                    index,
+                    row,
+                    price_cents=cents,
+                    stock=row.stock,
+                    section=self._section_code(row.section)
+                )
+                return
+
+            # Inclusão ou exclusão: as colunas são recriadas e trocadas
+            current = [
+                (int(columns.price_cents[position]), columns.rows[position])
+                for position in range(len(columns.rows))
+                if position != index
+            ]
+            if products:
+                current.append(products[0])
+                current.sort(key=lambda item: item[1].id)
+            self.columns = self._build(current)
+
+    def set_stock(self, product_id: int, stock: int):
+        """
+        Aplica o novo estoque de um produto.
+
+        Args:
+            product_id (int): ID do produto.
+            stock (int): Estoque atual.
+        """
+        with self.lock:
+            columns = self.columns
+            if columns is None:
+                return
+
+            index = columns.position(product_id)
+            if index is not None:
+                self.columns = columns.replace(
+                    index, replace(columns.rows[index], stock=stock),
+                    stock=stock
+                )
+
+    def list_products(
+            self,
+            category: str = None,
+            price: float = None,
+            available: bool = None,
+            page: int = 1,
+            limit: int = 10
+    ):
+        """
+        Lista os produtos da cópia com os mesmos filtros e ordem (ID) de
+        crud.list_products.
+
+        Args:
+            category (str): Seção do produto (opcional).
+            price (float): Preço máximo do produto (opcional).
+            available (bool): Disponibilidade em estoque (opcional).
+            page (int): Número da página.
+            limit (int): Limite de produtos por página.
+        Returns:
+            Optional[list[ProductRow]]: Produtos da página, ou None se a
+            cópia não estiver sincronizada.
+        """
+        columns = self.columns
+        if columns is None or page < 1 or limit < 0:
+            return None
+
+        mask = None
+
+        if category:
+            code = self.sections.get(category.upper())
+            if code is None:
+                return []
+            mask = columns.section == code
+
+        if price:
+            condition = columns.price_cents <= to_cents(price)
+            mask = condition if mask is None else mask & condition
+
+        if available is not None:
+            condition = columns.stock > 0 if available \
+                else columns.stock == 0
+            mask = condition if mask is None else mask & condition
+
+        start = (page - 1) * limit
+        if mask is None:
+            positions = range(start, min(start + limit, len(columns.rows)))
+        else:
+            positions = np.flatnonzero(mask)[start:start + limit]
+
+        rows = columns.rows
+        return [rows[position] for position in positions]
+
+    def on_connect(self):
+        if settings.PRODUCTS_SNAPSHOT_ENABLED:
+            self.reload()
+
+    def on_notify(self, channel: str, payload: str):
+        if channel == STOCK_CHANNEL:
+            product_id, stock = payload.split(":")
+            self.set_stock(int(product_id), int(stock))
+        else:
+            self.refresh(int(payload))
+
+    def on_disconnect(self):
+        with self.lock:
+            self.columns = None
+
+
+product_snapshot = ProductSnapshot()
+listener.subscribe(PRODUCTS_CHANNEL, product_snapshot)
+listener.subscribe(STOCK_CHANNEL, product_snapshot)
@@ -0,0 +1,66 @@
+# Imports do sistema
+import argparse
+import json
+from pathlib import Path
+
+METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return "    n/a"
+    return f"{(after - before) / before * 100:+7.1f}%"
+
+
+def compare(before: dict, after: dict):
+    """
+    Exibe a variação das métricas entre dois resultados de benchmark.
+
+    Args:
+        before (dict): Resultado de referência (ex.: commit anterior).
+        after (dict): Resultado a ser comparado.
+    """
+    print(f"referência: {before['meta']['commit']}  "
+          f"comparado: {after['meta']['commit']}")
+
+    header = f"{'operação':<14}" + "".join(
+        f"{metric:>26}" for metric in METRICS
+    )
+    print(header)
+    print("-" * len(header))
+
+    names = list(after["operations"]) + ["total"]
+    for name in names:
+        old = before["operations"].get(name) if name != "total" \
+            else before["total"]
+        new = after["operations"].get(name) if name != "total" \
+            else after["total"]
+        if not old or not new:
+            continue
+
+        row = f"{name:<14}"
+        for metric in METRICS:
+            row += f"{old[metric]:>9.1f} ->{new[metric]:>7.1f} " \
+                   f"{_delta(old[metric], new[metric])}"
+        print(row)
+
+
+def main():
+    """
+    Ponto de entrada da linha de comando do comparador de resultados.
+    """
+    parser = argparse.ArgumentParser(
+        description="Compara dois resultados de benchmark"
+    )
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    args = parser.parse_args()
+
+    compare(
+        json.loads(args.before.read_text()),
+        json.loads(args.after.read_text())
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+# Imports do sistema
+import argparse
+import http.client
+import json
+import random
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+# Imports locais
+from tests.benchmark.seed import MANIFEST_PATH, RESULTS_DIR
+
+# Peso de cada operação no mix de requisições
+DEFAULT_MIX = {
+    "login": 5,
+    "get_products": 40,
+    "get_orders": 30,
+    "create_order": 15,
+    "update_order": 10,
+}
+
+
+class HttpClient:
+    """
+    Cliente HTTP mínimo com conexão persistente (keep-alive).
+    """
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.https = parts.scheme == "https"
+        self.timeout = timeout
+        self.token = None
+        self.connection = None
+
+    def _connect(self):
+        connection_class = http.client.HTTPSConnection if self.https \
+            else http.client.HTTPConnection
+        self.connection = connection_class(
+            self.host, self.port, timeout=self.timeout
+        )
+
+    def request(self, method: str, path: str, body=None, form: bool = False):
+        """
+        Executa uma requisição e retorna o status e o corpo decodificado.
+
+        Args:
+            method (str): Método HTTP.
+            path (str): Caminho com query string.
+            body (Any): Corpo da requisição (JSON ou formulário).
+            form (bool): Se True, envia o corpo como formulário.
+        Returns:
+            tuple[int, Any]: Status HTTP e corpo da resposta.
+        """
+        headers = {"Accept": "application/json"}
+        payload = None
+
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        if body is not None:
+            if form:
+                payload = urlencode(body)
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
+            else:
+                payload = json.dumps(body)
+                headers["Content-Type"] = "application/json"
+
+        for attempt in range(2):
+            if self.connection is None:
+                self._connect()
+            try:
+                self.connection.request(method, path, payload, headers)
+                response = self.connection.getresponse()
+                raw = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # Reabre a conexão caso o servidor a tenha encerrado
+                self.connection.close()
+                self.connection = None
+                if attempt:
+                    raise
+
+        try:
+            data = json.loads(raw) if raw else None
+        except ValueError:
+            data = None
+
+        return response.status, data
+
+
+class Scenario:
+    """
+    Roteiro de requisições executado por um usuário virtual.
+    """
+    def __init__(self, client: HttpClient, manifest: dict, user: int,
+                 rng: random.Random):
+        self.client = client
+        self.manifest = manifest
+        self.email = f"bench{user}@example.com"
+        self.rng = rng
+        self.client_id = None
+        self.order_ids = []
+
+    def setup(self):
+        """
+        Autentica o usuário virtual e descobre seus pedidos.
+        """
+        self.login()
+
+        status, data = self.client.request("GET", "/clients/get_detail_client")
+        if status == 200:
+            self.client_id = data["data"]["id"]
+
+            status, data = self.client.request(
+                "GET", f"/orders/get_orders?client_id={self.client_id}"
+            )
+            if status == 200:
+                self.order_ids = [order["id"] for order in data["data"]]
+
+    def _items(self):
+        return [
+            {
+                "product_id": self.rng.randint(1, self.manifest["products"]),
+                "quantity": self.rng.randint(1, 3),
+            }
+            for _ in range(self.rng.randint(1, 4))
+        ]
+
+    def login(self):
+        status, data = self.client.request(
+            "POST", "/auth/login",
+            {"username": self.email, "password": self.manifest["password"]},
+            form=True
+        )
+        if status == 200:
+            self.client.token = data["access_token"]
+        return status
+
+    def get_products(self):
+        params = {
+            "page": self.rng.randint(1, 10),
+            "limit": self.rng.choice([10, 50, 100]),
+        }
+        choice = self.rng.random()
+        if choice < 0.4:
+            params["category"] = self.rng.choice(self.manifest["sections"])
+        if self.rng.random() < 0.3:
+            params["price"] = self.rng.choice([50, 100, 250])
+        if self.rng.random() < 0.3:
+            params["available"] = "true"
+
+        status, _ = self.client.request(
+            "GET", f"/products/get_products?{urlencode(params)}"
+        )
+        return status
+
+    def scan_barcode(self):
+        # Mesmo formato de código de barras gerado pelo seed
+        product_id = self.rng.randint(1, self.manifest["products"])
+        status, _ = self.client.request(
+            "GET", f"/products/by_barcode/789{product_id:010d}"
+        )
+        return status
+
+    def get_orders(self):
+        start = date.fromisoformat(self.manifest["start_date"])
+        params = {}
+        choice = self.rng.randint(0, 3)
+
+        if choice == 0 and self.client_id:
+            params["client_id"] = self.client_id
+        elif choice == 1:
+            params["status"] = "PENDENTE"
+        elif choice == 2:
+            params["category"] = self.rng.choice(self.manifest["sections"])
+        else:
+            first = start + timedelta(days=self.rng.randint(0, 330))
+            params["start_date"] = first.isoformat()
+            params["end_date"] = (first + timedelta(days=30)).isoformat()
+
+        status, _ = self.client.request(
+            "GET", f"/orders/get_orders?{urlencode(params)}"
+        )
+        return status
+
+    def create_order(self):
+        status, _ = self.client.request(
+            "POST", "/orders/create_order", {"items": self._items()}
+        )
+        return status
+
+    def update_order(self):
+        if not self.order_ids:
+            return self.get_orders()
+
+        order_id = self.rng.choice(self.order_ids)
+        status, _ = self.client.request(
+            "PUT", f"/orders/update_order/{order_id}",
+            {"items": self._items()}
+        )
+        return status
+
+
+def percentile(values: list, pct: float) -> float:
+    """
+    Calcula o percentil pelo método nearest-rank.
+
+    Args:
+        values (list[float]): Valores ordenados.
+        pct (float): Percentil desejado (0-100).
+    Returns:
+        float: Valor do percentil ou 0.0 se a lista estiver vazia.
+    """
+    if not values:
+        return 0.0
+    rank = int(round(pct / 100 * len(values)))
+    index = max(0, min(len(values) - 1, rank - 1))
+    return values[index]
+
+
+def summarize(latencies: list, errors: int, elapsed: float) -> dict:
+    """
+    Resume as latências (em milissegundos) de uma operação.
+
+    Args:
+        latencies (list[float]): Latências observadas em segundos.
+        errors (int): Quantidade de respostas com erro.
+        elapsed (float): Duração da medição em segundos.
+    Returns:
+        dict: Estatísticas da operação.
+    """
+    values = sorted(latency * 1000 for latency in latencies)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "throughput_rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3) if values else 0.0,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(
+        base_url: str,
+        concurrency: int,
+        duration: float,
+        warmup: float,
+        mix: dict,
+        seed_value: int = 42,
+        timeout: float = 30.0
+) -> dict:
+    """
+    Executa o teste de carga contra a API em execução.
+
+    Args:
+        base_url (str): URL base da API (ex.: http://localhost:8080).
+        concurrency (int): Quantidade de usuários virtuais simultâneos.
+        duration (float): Duração da medição em segundos.
+        warmup (float): Duração do aquecimento (não medido) em segundos.
+        mix (dict): Peso de cada operação no mix de requisições.
+        seed_value (int): Semente do gerador de números aleatórios.
+        timeout (float): Timeout de cada requisição em segundos.
+    Returns:
+        dict: Resultado do benchmark.
+    """
+    manifest = json.loads(MANIFEST_PATH.read_text())
+    operations = list(mix)
+    weights = [mix[name] for name in operations]
+
+    lock = threading.Lock()
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    state = {"measuring": False}
+    stop = threading.Event()
+
+    def worker(index: int):
+        rng = random.Random(seed_value + index)
+        user = index % manifest["users"] + 1
+        scenario = Scenario(
+            HttpClient(base_url, timeout), manifest, user, rng
+        )
+        scenario.setup()
+
+        while not stop.is_set():
+            name = rng.choices(operations, weights)[0]
+            started = time.perf_counter()
+            try:
+                status = getattr(scenario, name)()
+            except OSError:
+                status = 599
+            elapsed = time.perf_counter() - started
+
+            if state["measuring"]:
+                with lock:
+                    latencies[name].append(elapsed)
+                    if status >= 500 or status in (401, 403):
+                        errors[name] += 1
+
+    threads = [
+        threading.Thread(target=worker, args=(index,), daemon=True)
+        for index in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(warmup)
+    state["measuring"] = True
+    started = time.perf_counter()
+    time.sleep(duration)
+    state["measuring"] = False
+    elapsed = time.perf_counter() - started
+    stop.set()
+
+    for thread in threads:
+        thread.join(timeout=timeout)
+
+    all_latencies = [value for name in latencies for value in latencies[name]]
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "base_url": base_url,
+            "concurrency": concurrency,
+            "duration_s": duration,
+            "warmup_s": warmup,
+            "mix": mix,
+            "dataset": {
+                key: manifest[key]
+                for key in ("products", "clients", "orders", "order_items")
+            },
+        },
+        "operations": {
+            name: summarize(latencies[name], errors[name], elapsed)
+            for name in operations
+        },
+        "total": summarize(all_latencies, sum(errors.values()), elapsed),
+    }
+
+
+def print_report(result: dict):
+    """
+    Exibe o resultado do benchmark em formato de tabela.
+
+    Args:
+        result (dict): Resultado retornado por run().
+    """
+    header = f"{'operação':<14}{'req':>8}{'err':>6}{'rps':>10}" \
+             f"{'p50':>10}{'p95':>10}{'p99':>10}"
+    print(header)
+    print("-" * len(header))
+    rows = list(result["operations"].items()) + [("total", result["total"])]
+    for name, stats in rows:
+        print(
+            f"{name:<14}{stats['count']:>8}{stats['errors']:>6}"
+            f"{stats['throughput_rps']:>10.1f}{stats['p50_ms']:>10.1f}"
+            f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        )
+
+
+def main():
+    """
+    Ponto de entrada da linha de comando do gerador de carga.
+    """
+    parser = argparse.ArgumentParser(
+        description="Executa o teste de carga contra a API"
+    )
+    parser.add_argument("--url", default="http://localhost:8080")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--warmup", type=float, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--mix", type=json.loads, default=DEFAULT_MIX,
+        help='Pesos das operações em JSON, ex.: \'{"get_products": 1}\''
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    result = run(
+        base_url=args.url,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+        mix=args.mix,
+        seed_value=args.seed
+    )
+
+    print_report(result)
+
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now():%Y%m%d-%H%M%S}_{result['meta']['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"Resultado salvo em {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# Imports do sistema
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+# Imports locais
+from tests.benchmark.load import DEFAULT_MIX, run
+from tests.benchmark.seed import RESULTS_DIR
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+
+def wait_ready(base_url: str, timeout: float):
+    """
+    Aguarda todos os workers responderem prontos em /health/ready.
+
+    Args:
+        base_url (str): URL base da API.
+        timeout (float): Tempo máximo de espera em segundos.
+    Raises:
+        TimeoutError: Se a API não ficar pronta no tempo informado.
+    """
+    deadline = time.monotonic() + timeout
+    consecutive = 0
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/health/ready") as resp:
+                consecutive = consecutive + 1 if resp.status == 200 else 0
+        except (urllib.error.URLError, ConnectionError):
+            consecutive = 0
+
+        # Várias respostas seguidas indicam que os workers estão aquecidos
+        if consecutive >= 20:
+            return
+        time.sleep(0.1)
+
+    raise TimeoutError("A API não ficou pronta a tempo")
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    """
+    Inicia a API no modo de produção (gunicorn) com N workers.
+
+    Args:
+        workers (int): Quantidade de workers.
+        port (int): Porta HTTP.
+    Returns:
+        subprocess.Popen: Processo principal do gunicorn.
+    """
+    env = dict(
+        os.environ, WEB_CONCURRENCY=str(workers), PORT=str(port),
+        ACCESS_LOG=""
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn_conf.py",
+         "main:app"],
+        cwd=ROOT_DIR,
+        env=env
+    )
+
+
+def stop_server(process: subprocess.Popen, timeout: float = 60):
+    """
+    Encerra o gunicorn com SIGTERM (drenagem graciosa).
+    """
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def main():
+    """
+    Mede a vazão da API com quantidades crescentes de workers.
+
+    Para cada quantidade, o gunicorn é iniciado, o teste de carga é
+    executado com concorrência proporcional aos workers e o servidor é
+    encerrado. São exibidos o ganho em relação a um worker e a eficiência
+    (ganho dividido pela quantidade de workers; 100% = escala linear).
+    """
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(
+        description="Mede a escalabilidade da API por quantidade de workers"
+    )
+    parser.add_argument(
+        "--workers", type=lambda value: [int(n) for n in value.split(",")],
+        default=sorted({1, max(cores // 2, 1), cores})
+    )
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--concurrency-per-worker", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--warmup", type=float, default=5)
+    parser.add_argument(
+        "--mix", type=json.loads, default=DEFAULT_MIX,
+        help='Pesos das operações em JSON, ex.: \'{"get_products": 1}\''
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    results = []
+
+    for workers in args.workers:
+        process = start_server(workers, args.port)
+        try:
+            wait_ready(base_url, timeout=120)
+            result = run(
+                base_url=base_url,
+                concurrency=args.concurrency_per_worker * workers,
+                duration=args.duration,
+                warmup=args.warmup,
+                mix=args.mix
+            )
+        finally:
+            stop_server(process)
+
+        results.append({"workers": workers, **result})
+
+    baseline = results[0]["total"]["throughput_rps"] / results[0]["workers"]
+
+    header = f"{'workers':>8}{'rps':>10}{'p95':>10}{'ganho':>8}" \
+             f"{'eficiência':>12}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        rps = result["total"]["throughput_rps"]
+        speedup = rps / baseline if baseline else 0.0
+        print(
+            f"{result['workers']:>8}{rps:>10.1f}"
+            f"{result['total']['p95_ms']:>10.1f}{speedup:>8.2f}"
+            f"{speedup / result['workers']:>12.0%}"
+        )
+
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now():%Y%m%d-%H%M%S}_scaling_"
+        f"{results[0]['meta']['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"cores": cores, "runs": results}, indent=2))
+    print(f"Resultado salvo em {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# Imports do sistema
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Imports de terceiros
+from sqlalchemy import text
+
+# Imports locais
+from core.database import get_engine
+from src.auth.jwt_auth import get_password
+from src.auth.models import UserModel
+from src.clients.models import ClientModel
+from src.orders.models import OrderItemModel, OrderModel
+from src.orders.partitions import ensure_order_partitions
+from src.orders.schemas import StatusOrder
+from src.products.models import ProductImageModel, ProductModel
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+MANIFEST_PATH = RESULTS_DIR / "manifest.json"
+
+BENCH_PASSWORD = "bench123"
+SECTIONS = [
+    "CAMISETAS", "CALCAS", "VESTIDOS", "SAIAS", "BERMUDAS",
+    "JAQUETAS", "ACESSORIOS", "CALCADOS", "INTIMA", "INFANTIL",
+]
+
+# Escalas pré-definidas (produtos, clientes, itens de pedido)
+SCALES = {
+    "small": (1_000, 10_000, 100_000),
+    "medium": (10_000, 100_000, 1_000_000),
+    "large": (100_000, 1_000_000, 10_000_000),
+}
+
+
+def _batches(rows, batch_size: int):
+    """
+    Agrupa um iterador de linhas em lotes de tamanho fixo.
+
+    Args:
+        rows (Iterable[dict]): Linhas a serem agrupadas.
+        batch_size (int): Quantidade de linhas por lote.
+    Returns:
+        Iterator[list[dict]]: Lotes de linhas.
+    """
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(conn, model, rows, batch_size: int) -> int:
+    """
+    Insere as linhas em lotes utilizando executemany.
+
+    Args:
+        conn (Connection): Conexão com o banco de dados.
+        model (Base): Modelo cuja tabela receberá as linhas.
+        rows (Iterable[dict]): Linhas a serem inseridas.
+        batch_size (int): Quantidade de linhas por lote.
+    Returns:
+        int: Quantidade de linhas inseridas.
+    """
+    total = 0
+    started = time.perf_counter()
+    for batch in _batches(rows, batch_size):
+        conn.execute(model.__table__.insert(), batch)
+        total += len(batch)
+
+    elapsed = time.perf_counter() - started
+    print(f"{model.__tablename__}: {total} linhas em {elapsed:.1f}s")
+    return total
+
+
+def seed(
+        products: int,
+        clients: int,
+        order_items: int,
+        users: int = 50,
+        items_per_order: int = 4,
+        images_per_product: int = 1,
+        batch_size: int = 10_000,
+        seed_value: int = 42
+) -> dict:
+    """
+    Popula o banco de dados local com dados sintéticos e determinísticos.
+
+    As tabelas são truncadas e os IDs são gerados explicitamente, de modo que
+    duas execuções com os mesmos parâmetros produzem o mesmo conjunto de dados.
+
+    Args:
+        products (int): Quantidade de produtos.
+        clients (int): Quantidade de clientes.
+        order_items (int): Quantidade de itens de pedido.
+        users (int): Quantidade de usuários de benchmark (com cliente
+        associado) utilizados pelo gerador de carga.
+        items_per_order (int): Média de itens por pedido.
+        images_per_product (int): Quantidade de imagens por produto.
+        batch_size (int): Quantidade de linhas por lote de inserção.
+        seed_value (int): Semente do gerador de números aleatórios.
+    Returns:
+        dict: Manifesto com os parâmetros e faixas de IDs gerados.
+    """
+    rng = random.Random(seed_value)
+    clients = max(clients, users)
+    orders = max(order_items // items_per_order, 1)
+    hashed_password = get_password(BENCH_PASSWORD)
+    first_day = datetime(2024, 1, 1)
+
+    def user_rows():
+        for i in range(1, users + 1):
+            yield {
+                "id": i,
+                "email": f"bench{i}@example.com",
+                "hashed_password": hashed_password,
+            }
+
+    def client_rows():
+        for i in range(1, clients + 1):
+            email = f"bench{i}@example.com" if i <= users \
+                else f"client{i}@example.com"
+            yield {
+                "id": i,
+                "name": f"Cliente{i}",
+                "last_name": "Benchmark",
+                "email": email,
+                "cpf": f"{i:011d}",
+                "phone": f"119{i % 10 ** 8:08d}",
+            }
+
+    def product_rows():
+        for i in range(1, products + 1):
+            yield {
+                "id": i,
+                "description": f"Produto {i}",
+                "price_cents": rng.randint(990, 49990),
+                "barcode": f"789{i:010d}",
+                "section": SECTIONS[i % len(SECTIONS)],
+                "stock": rng.randint(10 ** 6, 10 ** 7),
+                "expiry_date": date(2030, 1, 1) if i % 7 == 0 else None,
+            }
+
+    def image_rows():
+        image_id = 0
+        for product_id in range(1, products + 1):
+            for index in range(1, images_per_product + 1):
+                image_id += 1
+                yield {
+                    "id": image_id,
+                    "product_id": product_id,
+                    "image_url": f"static/images/{product_id}_{index}.jpg",
+                }
+
+    # Data de criação de cada pedido, repetida nos seus itens
+    created_at = [
+        first_day + timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+        for _ in range(orders)
+    ]
+
+    def order_rows():
+        statuses = [StatusOrder.PENDENTE.value] * 8 + [
+            StatusOrder.ENTREGUE.value, StatusOrder.CANCELADO.value
+        ]
+        for i in range(1, orders + 1):
+            # Os primeiros pedidos pertencem aos usuários de benchmark,
+            # garantindo que cada um tenha pedidos para atualizar
+            client_id = (i - 1) % users + 1 if i <= users * 10 \
+                else rng.randint(1, clients)
+            yield {
+                "id": i,
+                "client_id": client_id,
+                "status": rng.choice(statuses),
+                "created_at": created_at[i - 1],
+            }
+
+    def order_item_rows():
+        for i in range(1, order_items + 1):
+            order_id = (i - 1) % orders + 1
+            yield {
+                "id": i,
+                "order_id": order_id,
+                "created_at": created_at[order_id - 1],
+                "product_id": rng.randint(1, products),
+                "quantity": rng.randint(1, 5),
+                "unit_price_cents": rng.randint(990, 49990),
+            }
+
+    models = [
+        UserModel, ClientModel, ProductModel, ProductImageModel,
+        OrderModel, OrderItemModel
+    ]
+
+    with get_engine().begin() as conn:
+        tables = ", ".join(model.__tablename__ for model in models)
+        conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
+        # Partições mensais do ano dos pedidos gerados
+        ensure_order_partitions(conn, first_day.date(), 13)
+
+        _insert(conn, UserModel, user_rows(), batch_size)
+        _insert(conn, ClientModel, client_rows(), batch_size)
+        _insert(conn, ProductModel, product_rows(), batch_size)
+        _insert(conn, ProductImageModel, image_rows(), batch_size)
+        _insert(conn, OrderModel, order_rows(), batch_size)
+        _insert(conn, OrderItemModel, order_item_rows(), batch_size)
+
+        # Ajusta as sequências, pois os IDs foram inseridos explicitamente
+        for model in models:
+            table = model.__tablename__
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE((SELECT max(id) FROM {table}), 0) + 1, false)"
+            ))
+
+        conn.execute(text(f"ANALYZE {tables}"))
+
+    manifest = {
+        "seed": seed_value,
+        "products": products,
+        "clients": clients,
+        "orders": orders,
+        "order_items": order_items,
+        "users": users,
+        "password": BENCH_PASSWORD,
+        "sections": SECTIONS,
+        "start_date": first_day.date().isoformat(),
+        "end_date": (first_day + timedelta(days=365)).date().isoformat(),
+    }
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+
+    return manifest
+
+
+def main():
+    """
+    Ponto de entrada da linha de comando do gerador de dados.
+    """
+    parser = argparse.ArgumentParser(
+        description="Popula o Postgres local com dados de benchmark"
+    )
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--products", type=int)
+    parser.add_argument("--clients", type=int)
+    parser.add_argument("--order-items", type=int)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--items-per-order", type=int, default=4)
+    parser.add_argument("--images-per-product", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    products, clients, order_items = SCALES[args.scale]
+
+    manifest = seed(
+        products=args.products or products,
+        clients=args.clients or clients,
+        order_items=args.order_items or order_items,
+        users=args.users,
+        items_per_order=args.items_per_order,
+        images_per_product=args.images_per_product,
+        batch_size=args.batch_size,
+        seed_value=args.seed
+    )
+
+    print(f"Manifesto salvo em {MANIFEST_PATH}")
+    print(json.dumps(manifest, indent=2))
+
+
+if __name__ == "__main__":
+    main()
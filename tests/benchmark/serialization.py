@@ -0,0 +1,88 @@
+# Imports do sistema
+import argparse
+import timeit
+from datetime import date
+
+# Imports de terceiros
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+# Imports locais
+from core.exceptions import SuccessResponse
+from core.responses import success_response
+from src.products.schemas import ProductOutput
+
+
+def build_products(size: int) -> list:
+    """
+    Cria uma página de produtos como a retornada por get_products.
+
+    Args:
+        size (int): Quantidade de produtos da página.
+    Returns:
+        list[ProductOutput]: Produtos da página.
+    """
+    return [
+        ProductOutput(
+            id=index,
+            description=f"Produto {index}",
+            price=19.9 + index,
+            barcode=f"789{index:010d}",
+            section="CAMISETAS",
+            stock=index * 3,
+            expiry_date=date(2030, 1, 1) if index % 2 else None,
+            url_images=[f"static/images/{index}_1.jpg"]
+        )
+        for index in range(1, size + 1)
+    ]
+
+
+def legacy_path(products: list) -> bytes:
+    """
+    Serialização anterior: SuccessResponse, jsonable_encoder e json.dumps.
+    """
+    response = SuccessResponse(
+        data=products,
+        message="Lista de produtos retornada com sucesso"
+    )
+    return JSONResponse(jsonable_encoder(response)).body
+
+
+def fast_path(products: list) -> bytes:
+    """
+    Serialização atual: TypeAdapter pré-construído e envelope em bytes.
+    """
+    return success_response(
+        data=products,
+        message="Lista de produtos retornada com sucesso"
+    ).body
+
+
+def main():
+    """
+    Compara o custo de serialização de uma página de produtos.
+    """
+    parser = argparse.ArgumentParser(
+        description="Mede o custo de serialização das respostas"
+    )
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--number", type=int, default=2_000)
+    args = parser.parse_args()
+
+    products = build_products(args.size)
+
+    # O JSON produzido pelos dois caminhos deve ser o mesmo
+    assert legacy_path(products) == fast_path(products)
+
+    for name, function in (("legado", legacy_path), ("rápido", fast_path)):
+        elapsed = min(timeit.repeat(
+            lambda: function(products), number=args.number, repeat=5
+        ))
+        print(
+            f"{name:<8}{elapsed / args.number * 1e6:>10.1f} µs por resposta "
+            f"({args.size} produtos)"
+        )
+
+
+if __name__ == "__main__":
+    main()
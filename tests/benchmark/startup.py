@@ -0,0 +1,71 @@
+# Imports do sistema
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+# Tempo máximo, em segundos, para "python -c 'import main'"
+IMPORT_BUDGET = 0.5
+
+STEPS = {
+    "import main": "import main",
+    "create_app()": "import main; main.create_app()",
+}
+
+
+def measure(code: str, repeat: int) -> float:
+    """
+    Mede o menor tempo de execução de um código em um novo interpretador.
+
+    Args:
+        code (str): Código passado para "python -c".
+        repeat (int): Quantidade de execuções.
+    Returns:
+        float: Menor tempo, em segundos.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT_DIR, check=True
+        )
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    """
+    Verifica o orçamento de tempo de importação da aplicação.
+
+    Encerra com código 1 se "import main" exceder o orçamento, para uso em
+    pipelines de CI.
+    """
+    parser = argparse.ArgumentParser(
+        description="Mede o tempo de inicialização da aplicação"
+    )
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Referência: inicialização do interpretador sem imports
+    baseline = measure("pass", args.repeat)
+    results = {
+        name: measure(code, args.repeat) for name, code in STEPS.items()
+    }
+
+    print(f"{'interpretador':<16}{baseline * 1000:>10.1f} ms")
+    for name, elapsed in results.items():
+        print(f"{name:<16}{elapsed * 1000:>10.1f} ms")
+
+    if results["import main"] > args.budget:
+        print(
+            f"import main excedeu o orçamento de {args.budget * 1000:.0f} ms"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Imports do sistema
+import os
+
+# Configuração mínima para os testes (sem env/.env e sem PostgreSQL)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "test-refresh-secret")
+
+# Imports de terceiros
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter(monkeypatch):
+    """
+    Contadores de limite de requisições novos em cada teste.
+    """
+    from core.rate_limit import rate_limiter
+
+    monkeypatch.setattr(rate_limiter, "_limiter", None)
+    return rate_limiter
+
+
+@pytest.fixture
+def app():
+    """
+    Aplicação montada por create_app(), sem o lifespan (conexão de escuta,
+    fila de tarefas e caches não são iniciados).
+    """
+    import main
+
+    return main.create_app()
+
+
+@pytest.fixture
+def engine(app):
+    """
+    Banco SQLite em memória com as tabelas dos modelos, exceto pedidos e
+    itens (particionados, com chave primária composta: apenas PostgreSQL).
+    """
+    from core.database import Base
+
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine, tables=[
+        table for table in Base.metadata.sorted_tables
+        if table.name not in ("orders", "order_items")
+    ])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine, monkeypatch):
+    """
+    Sessão do banco de testes; SessionLocal passa a usar o mesmo banco.
+    """
+    from core.database import SessionLocal
+
+    monkeypatch.setitem(SessionLocal.kw, "bind", engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(app, engine, db):
+    """
+    Cliente HTTP da aplicação, com get_db e get_read_db no banco de testes.
+    """
+    from core.database import get_db, get_read_db
+
+    factory = sessionmaker(bind=engine, autoflush=False)
+
+    def override_db():
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_read_db] = override_db
+    return TestClient(app)
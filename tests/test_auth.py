@@ -0,0 +1,130 @@
+# Imports de terceiros
+import pytest
+
+# Imports locais
+from core.config import get_settings
+from src.auth.jwt_auth import get_password
+from src.auth.models import UserModel
+from src.auth.revocation import token_denylist
+
+EMAIL = "cliente@example.com"
+PASSWORD = "senha-segura"
+
+
+@pytest.fixture
+def user(db):
+    user = UserModel(email=EMAIL, hashed_password=get_password(PASSWORD))
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture(params=["unsynced", "synced"])
+def denylist(request, db, monkeypatch):
+    """
+    Filtro de tokens revogados fora de sincronia (consulta ao banco) e
+    sincronizado (filtro de Bloom reconstruído a partir do banco).
+    """
+    monkeypatch.setattr(token_denylist, "filter", None)
+    if request.param == "synced":
+        token_denylist.rebuild()
+    return token_denylist
+
+
+@pytest.fixture
+def forwarded(monkeypatch):
+    """
+    IP do cliente lido de X-Forwarded-For, para simular outros endereços.
+    """
+    settings = get_settings()
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "RATE_LIMIT_TRUST_FORWARDED", True)
+    monkeypatch.setattr(settings, "RATE_LIMIT_LOGIN_PER_IP", "100/minute")
+    monkeypatch.setattr(settings, "RATE_LIMIT_LOGIN_PER_ACCOUNT", "3/minute")
+
+
+def attempt(client, password: str, ip: str):
+    return client.post(
+        "/auth/login",
+        data={"username": EMAIL, "password": password},
+        headers={"X-Forwarded-For": ip}
+    )
+
+
+def login(client) -> dict:
+    response = client.post(
+        "/auth/login", data={"username": EMAIL, "password": PASSWORD}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def logout(client, tokens: dict):
+    return client.post(
+        "/auth/logout",
+        json=tokens["refresh_token"],
+        headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+
+
+def test_refresh_before_logout(client, user, denylist):
+    tokens = login(client)
+
+    response = client.post("/auth/refresh-token", json=tokens["refresh_token"])
+
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+
+
+def test_revoked_access_token_is_rejected(client, user, denylist):
+    tokens = login(client)
+    assert logout(client, tokens).status_code == 200
+
+    response = logout(client, tokens)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+def test_refresh_after_logout_is_rejected(client, user, denylist):
+    tokens = login(client)
+    assert logout(client, tokens).status_code == 200
+
+    response = client.post("/auth/refresh-token", json=tokens["refresh_token"])
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token revogado"
+
+
+def test_other_sessions_remain_valid(client, user, denylist):
+    revoked = login(client)
+    active = login(client)
+    assert logout(client, revoked).status_code == 200
+
+    response = client.post("/auth/refresh-token", json=active["refresh_token"])
+
+    assert response.status_code == 200
+
+
+def test_login_limit_per_account_and_ip(client, user, forwarded):
+    for _ in range(3):
+        assert attempt(client, "errada", "203.0.113.1").status_code == 401
+
+    blocked = attempt(client, PASSWORD, "203.0.113.1")
+    assert blocked.status_code == 429
+    assert "Retry-After" in blocked.headers
+
+    # O titular, em outro endereço, não é bloqueado pelas tentativas
+    assert attempt(client, PASSWORD, "198.51.100.7").status_code == 200
+
+
+def test_login_limit_ignores_username_case(client, user, forwarded):
+    for username in (EMAIL, EMAIL.upper(), EMAIL.title()):
+        response = client.post(
+            "/auth/login",
+            data={"username": username, "password": "errada"},
+            headers={"X-Forwarded-For": "203.0.113.1"}
+        )
+        assert response.status_code == 401
+
+    assert attempt(client, PASSWORD, "203.0.113.1").status_code == 429
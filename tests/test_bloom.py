@@ -0,0 +1,58 @@
+# Imports de terceiros
+import pytest
+
+# Imports locais
+from core.bloom import BloomFilter
+
+
+def test_empty_filter_contains_nothing():
+    bloom = BloomFilter(100, 0.01)
+
+    assert "token" not in bloom
+    assert len(bloom) == 0
+
+
+def test_no_false_negatives():
+    bloom = BloomFilter(10_000, 0.01)
+    items = [f"jti-{index}" for index in range(10_000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert len(bloom) == len(items)
+
+
+@pytest.mark.parametrize("error_rate", [0.1, 0.01, 0.001])
+def test_false_positive_rate_within_bound(error_rate):
+    capacity = 5_000
+    bloom = BloomFilter(capacity, error_rate)
+    for index in range(capacity):
+        bloom.add(f"revoked-{index}")
+
+    probes = 50_000
+    false_positives = sum(
+        f"valid-{index}" in bloom for index in range(probes)
+    )
+
+    # Margem para a variação da amostra
+    assert false_positives / probes < error_rate * 2
+
+
+def test_size_and_hashes_follow_capacity():
+    small = BloomFilter(1_000, 0.01)
+    large = BloomFilter(100_000, 0.01)
+
+    assert large.size > small.size
+    assert len(large.bits) == (large.size + 7) // 8
+    # k = m / n * ln 2 ≈ 7 para 1% de falsos positivos
+    assert small.hashes == large.hashes == 7
+
+
+@pytest.mark.parametrize("capacity", [0, 1])
+def test_minimal_capacity(capacity):
+    bloom = BloomFilter(capacity, 0.01)
+    bloom.add("jti")
+
+    assert bloom.size >= 8
+    assert bloom.hashes >= 1
+    assert "jti" in bloom
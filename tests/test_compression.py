@@ -0,0 +1,118 @@
+# Imports do sistema
+import gzip
+
+# Imports de terceiros
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+# Imports locais
+from core.compression import CompressionMiddleware, accepted_encodings
+
+BODY = b'{"items": [' + b'{"id": 1, "description": "Produto"},' * 200 + b']}'
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/full")
+    def full():
+        return Response(
+            BODY,
+            media_type="application/json",
+            headers={"ETag": '"v1"', "Accept-Ranges": "bytes"}
+        )
+
+    @app.get("/weak")
+    def weak():
+        return Response(
+            BODY, media_type="application/json", headers={"ETag": 'W/"v1"'}
+        )
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            iter([BODY, BODY]),
+            media_type="application/json",
+            headers={"ETag": '"v2"'}
+        )
+
+    @app.get("/partial")
+    def partial():
+        return Response(
+            BODY[:1000],
+            status_code=206,
+            media_type="application/json",
+            headers={
+                "ETag": '"v1"',
+                "Content-Range": f"bytes 0-999/{len(BODY)}"
+            }
+        )
+
+    return TestClient(app)
+
+
+def get(client, path: str):
+    # O corpo é lido sem descompressão, como enviado pelo servidor
+    with client.stream(
+        "GET", path, headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_compressed_response_gets_weak_etag(client):
+    response, body = get(client, "/full")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert "accept-ranges" not in response.headers
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert gzip.decompress(body) == BODY
+
+
+def test_weak_etag_is_kept(client):
+    response, _ = get(client, "/weak")
+
+    assert response.headers["etag"] == 'W/"v1"'
+
+
+def test_streamed_response_gets_weak_etag(client):
+    response, body = get(client, "/stream")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"v2"'
+    assert gzip.decompress(body) == BODY * 2
+
+
+def test_partial_content_is_not_compressed(client):
+    response, body = get(client, "/partial")
+
+    assert response.status_code == 206
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+    assert body == BODY[:1000]
+
+
+def test_identity_keeps_strong_etag(client):
+    response = client.get("/full", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+    assert response.content == BODY
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", ["gzip"]),
+    ("gzip;q=0", []),
+    ("identity", []),
+    ("deflate, gzip;q=0.5", ["gzip"]),
+    ("*;q=0.1", ["gzip"]),
+    ("gzip;q=abc", []),
+])
+def test_accepted_encodings(header, expected, monkeypatch):
+    monkeypatch.setattr("core.compression.brotli", None)
+
+    assert accepted_encodings(header) == expected
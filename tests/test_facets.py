@@ -0,0 +1,79 @@
+# Imports de terceiros
+import pytest
+
+# Imports locais
+from core.config import get_settings
+from src.products.crud import count_product_facets, count_products
+from src.products.models import ProductModel
+from src.products.schemas import PriceBucket, SectionCount
+
+# (seção, preço em centavos, estoque)
+PRODUCTS = [
+    ("Camisetas", 999, 1),
+    ("camisetas", 1000, 0),
+    ("Calcas", 4999, 2),
+    ("Calcas", 5000, 0),
+    ("Bones", 50000, 3),
+    ("Bones", 99999, 1),
+]
+
+
+@pytest.fixture
+def products(db, monkeypatch):
+    monkeypatch.setattr(
+        get_settings(), "PRODUCTS_PRICE_BUCKETS", "10,50,100,500"
+    )
+    db.add_all(
+        ProductModel(
+            description=f"Produto {index}",
+            price_cents=price_cents,
+            barcode=str(index),
+            section=section,
+            stock=stock
+        )
+        for index, (section, price_cents, stock) in enumerate(PRODUCTS)
+    )
+    db.commit()
+
+
+def test_price_buckets_include_lower_edge(db, products):
+    total, facets = count_product_facets(db)
+
+    assert total == len(PRODUCTS)
+    assert facets.prices == [
+        PriceBucket(0.0, 10.0, 1),
+        PriceBucket(10.0, 50.0, 2),
+        PriceBucket(50.0, 100.0, 1),
+        PriceBucket(100.0, 500.0, 0),
+        PriceBucket(500.0, None, 2),
+    ]
+    assert facets.sections == [
+        SectionCount("BONES", 2),
+        SectionCount("CALCAS", 2),
+        SectionCount("CAMISETAS", 2),
+    ]
+    assert (facets.in_stock, facets.out_of_stock) == (4, 2)
+
+
+def test_facets_ignore_their_own_filter(db, products):
+    total, facets = count_product_facets(
+        db, category="calcas", price=49.99, available=True
+    )
+
+    assert total == 1
+    # Seções: preço e estoque aplicados, seção ignorada
+    assert facets.sections == [
+        SectionCount("CALCAS", 1), SectionCount("CAMISETAS", 1)
+    ]
+    # Preços: seção e estoque aplicados
+    assert [bucket.count for bucket in facets.prices] == [0, 1, 0, 0, 0]
+    # Estoque: seção e preço aplicados
+    assert (facets.in_stock, facets.out_of_stock) == (1, 0)
+
+
+def test_total_matches_count(db, products):
+    filters = {"category": "bones", "price": 999.99}
+
+    total, _ = count_product_facets(db, **filters)
+
+    assert total == count_products(db, **filters)[0] == 2
@@ -0,0 +1,126 @@
+# Imports do sistema
+from dataclasses import dataclass
+from datetime import datetime
+
+# Imports de terceiros
+import pytest
+
+# Imports locais
+from core.exceptions import APIException
+from core.fields import (build_row, format_cursor, parse_cursor, parse_expand,
+                         parse_fields, parse_ids, wants)
+
+
+@dataclass(slots=True)
+class Row:
+    id: int
+    description: str
+    price: float
+
+
+@pytest.mark.parametrize("value", [None, "", ",", " , "])
+def test_parse_fields_defaults_to_all(value):
+    assert parse_fields(value, Row) is None
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("id", {"id"}),
+    ("id,description", {"id", "description"}),
+    (" price , id ,", {"id", "price"}),
+    ("id,id", {"id"}),
+])
+def test_parse_fields(value, expected):
+    assert parse_fields(value, Row) == frozenset(expected)
+
+
+@pytest.mark.parametrize("value", ["name", "id,name", "ID", "id;price"])
+def test_parse_fields_rejects_unknown_fields(value):
+    with pytest.raises(APIException) as error:
+        parse_fields(value, Row)
+
+    assert error.value.code == 400
+    assert "id, description, price" in error.value.description
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1", [1]),
+    ("3,1,2", [3, 1, 2]),
+    (" 2 , 1 ", [2, 1]),
+    ("1,,2,", [1, 2]),
+    ("2,1,2,1", [2, 1]),
+])
+def test_parse_ids_keeps_order_without_duplicates(value, expected):
+    assert parse_ids(value, 10) == expected
+
+
+@pytest.mark.parametrize("value", ["a", "1,a", "1.5", "1;2", "0x1"])
+def test_parse_ids_rejects_malformed_ids(value):
+    with pytest.raises(APIException) as error:
+        parse_ids(value, 10)
+
+    assert error.value.message == "IDs inválidos"
+
+
+@pytest.mark.parametrize("value", ["", ",", " , "])
+def test_parse_ids_requires_an_id(value):
+    with pytest.raises(APIException) as error:
+        parse_ids(value, 10)
+
+    assert error.value.message == "IDs não informados"
+
+
+def test_parse_ids_limit_counts_distinct_ids():
+    assert parse_ids("1,2,3,1,2,3", 3) == [1, 2, 3]
+
+    with pytest.raises(APIException) as error:
+        parse_ids("1,2,3,4", 3)
+
+    assert error.value.message == "Limite de IDs excedido"
+
+
+@pytest.mark.parametrize("updated_at, row_id", [
+    (datetime(2026, 10, 19, 10, 0, 0, 123456), 42),
+    (datetime(2026, 10, 19, 10, 0, 0), 1),
+    (datetime(2026, 1, 1), 0),
+])
+def test_cursor_round_trip(updated_at, row_id):
+    assert parse_cursor(format_cursor(updated_at, row_id)) \
+        == (updated_at, row_id)
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "_",
+    "42",
+    "2026-10-19T10:00:00",
+    "2026-10-19T10:00:00_",
+    "2026-10-19T10:00:00_abc",
+    "ontem_42",
+    "2026-13-40T10:00:00_42",
+])
+def test_parse_cursor_rejects_malformed_cursors(value):
+    with pytest.raises(APIException) as error:
+        parse_cursor(value)
+
+    assert error.value.code == 400
+
+
+def test_parse_expand():
+    available = ("items", "items.product")
+
+    assert parse_expand(None, available) == frozenset()
+    assert parse_expand(" items.product ,items", available) \
+        == frozenset(available)
+
+    with pytest.raises(APIException):
+        parse_expand("client", available)
+
+
+def test_wants():
+    assert wants(None, "price")
+    assert wants(frozenset({"id", "price"}), "price", "stock")
+    assert not wants(frozenset({"id"}), "price", "stock")
+
+
+def test_build_row_leaves_unselected_fields_empty():
+    assert build_row(Row, {"id": 1, "price": 9.9}) == Row(1, None, 9.9)
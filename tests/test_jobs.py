@@ -0,0 +1,92 @@
+# Imports do sistema
+from datetime import datetime, timedelta
+
+# Imports de terceiros
+import pytest
+from sqlalchemy import select
+
+# Imports locais
+from src.jobs import worker
+from src.jobs.crud import enqueue_job
+from src.jobs.models import JobModel
+from src.jobs.schemas import StatusJob
+
+EVERY = 3600
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    """
+    Handlers de teste: "ok" e "broken", periódicos, e "once", que falha e
+    não é periódico.
+    """
+    def ok(payload, db):
+        pass
+
+    def broken(payload, db):
+        raise RuntimeError("falha")
+
+    monkeypatch.setattr(
+        worker, "HANDLERS", {"ok": ok, "broken": broken, "once": broken}
+    )
+    monkeypatch.setattr(worker, "PERIODIC", {"ok": EVERY, "broken": EVERY})
+
+
+def enqueue(db, name: str, max_attempts: int):
+    enqueue_job(name, {"key": "value"}, db, max_attempts=max_attempts)
+    db.commit()
+
+
+def jobs(db) -> list:
+    db.expire_all()
+    return db.execute(
+        select(JobModel.name, JobModel.status, JobModel.run_at,
+               JobModel.payload).order_by(JobModel.id)
+    ).all()
+
+
+def assert_next_run(job):
+    assert job.status == StatusJob.QUEUED
+    assert job.payload == {"key": "value"}
+    delay = (job.run_at - datetime.now()).total_seconds()
+    assert EVERY - 60 < delay <= EVERY
+
+
+def test_periodic_job_is_rescheduled_after_success(db, handlers):
+    enqueue(db, "ok", 3)
+
+    assert worker.run_once() == 1
+
+    [job] = jobs(db)
+    assert job.name == "ok"
+    assert_next_run(job)
+
+
+def test_periodic_job_is_rescheduled_after_final_failure(db, handlers):
+    enqueue(db, "broken", 1)
+
+    assert worker.run_once() == 1
+
+    failed, following = jobs(db)
+    assert failed.status == StatusJob.FAILED
+    assert following.name == "broken"
+    assert_next_run(following)
+
+
+def test_periodic_job_retries_before_rescheduling(db, handlers):
+    enqueue(db, "broken", 2)
+
+    worker.run_once()
+
+    [job] = jobs(db)
+    assert job.status == StatusJob.QUEUED
+    assert job.run_at < datetime.now() + timedelta(seconds=EVERY - 60)
+
+
+def test_failed_one_off_job_is_not_rescheduled(db, handlers):
+    enqueue(db, "once", 1)
+
+    worker.run_once()
+
+    [job] = jobs(db)
+    assert job.status == StatusJob.FAILED
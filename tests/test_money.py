@@ -0,0 +1,69 @@
+# Imports do sistema
+from decimal import Decimal
+
+# Imports de terceiros
+import pytest
+
+# Imports locais
+from core.exceptions import APIException
+from core.money import from_cents, to_cents
+
+
+@pytest.mark.parametrize("value, cents", [
+    (0, 0),
+    (1, 100),
+    (19.9, 1990),
+    (0.29, 29),
+    (1.005, 101),
+    (4.35, 435),
+    (1_000_000.01, 100_000_001),
+    ("19.90", 1990),
+    (" 7.5 ", 750),
+    (Decimal("0.10"), 10),
+])
+def test_to_cents_avoids_float_errors(value, cents):
+    assert to_cents(value) == cents
+
+
+@pytest.mark.parametrize("value, cents", [
+    (0.005, 1),
+    (0.004, 0),
+    (0.015, 2),
+    (0.025, 3),
+    (-0.005, -1),
+    (-19.999, -2000),
+])
+def test_to_cents_rounds_half_up(value, cents):
+    assert to_cents(value) == cents
+
+
+def test_sum_of_cents_is_exact():
+    # Em float, 0.1 + 0.2 != 0.3
+    assert to_cents(0.1) + to_cents(0.2) == to_cents(0.3)
+
+
+@pytest.mark.parametrize("value", [
+    "", "abc", "1,50", "R$ 10", None, float("nan"), float("inf"),
+    float("-inf"), "NaN", "Infinity",
+])
+def test_to_cents_rejects_malformed_values(value):
+    with pytest.raises(APIException) as error:
+        to_cents(value)
+
+    assert error.value.code == 400
+
+
+@pytest.mark.parametrize("cents, value", [
+    (0, 0.0),
+    (1990, 19.9),
+    (1, 0.01),
+    (-250, -2.5),
+    (100_000_001, 1_000_000.01),
+])
+def test_from_cents(cents, value):
+    assert from_cents(cents) == value
+
+
+@pytest.mark.parametrize("cents", [0, 1, 99, 1990, 123_456_789])
+def test_round_trip(cents):
+    assert to_cents(from_cents(cents)) == cents
@@ -0,0 +1,184 @@
+# Imports do sistema
+from datetime import datetime
+
+# Imports de terceiros
+import pytest
+
+# Imports locais
+from src.products.models import ProductImageModel, ProductModel
+from src.products.snapshot import ProductSnapshot
+
+# ID: (seção, preço em centavos, estoque)
+PRODUCTS = {
+    1: ("Camisetas", 1990, 10),
+    2: ("CALCAS", 8990, 0),
+    3: ("camisetas", 4990, 3),
+    4: ("Calcas", 12990, 7),
+    5: ("Bones", 2990, 0),
+    6: ("Camisetas", 2990, 1),
+}
+
+
+@pytest.fixture
+def snapshot(db):
+    db.add_all(
+        ProductModel(
+            id=product_id,
+            description=f"Produto {product_id}",
+            price_cents=price_cents,
+            barcode=f"789{product_id}",
+            section=section,
+            stock=stock
+        )
+        for product_id, (section, price_cents, stock) in PRODUCTS.items()
+    )
+    db.add(ProductImageModel(product_id=1, image_url="1.jpg"))
+    db.commit()
+
+    snapshot = ProductSnapshot()
+    snapshot.reload()
+    return snapshot
+
+
+def ids(rows) -> list:
+    return [row.id for row in rows]
+
+
+def test_unsynced_snapshot_defers_to_database():
+    snapshot = ProductSnapshot()
+
+    assert not snapshot.synced
+    assert snapshot.list_products() is None
+
+
+def test_reload_loads_rows_in_id_order(snapshot):
+    rows = snapshot.list_products(limit=100)
+
+    assert snapshot.synced
+    assert ids(rows) == sorted(PRODUCTS)
+    assert rows[0].price == 19.9
+    assert rows[0].url_images == ["1.jpg"]
+    assert rows[1].url_images == []
+
+
+@pytest.mark.parametrize("category, expected", [
+    ("camisetas", [1, 3, 6]),
+    ("CALCAS", [2, 4]),
+    ("Bones", [5]),
+    ("Sapatos", []),
+])
+def test_category_mask_ignores_case(snapshot, category, expected):
+    assert ids(snapshot.list_products(category=category, limit=100)) \
+        == expected
+
+
+@pytest.mark.parametrize("price, expected", [
+    (29.90, [1, 5, 6]),
+    (19.89, []),
+    (1000, [1, 2, 3, 4, 5, 6]),
+])
+def test_price_mask_is_inclusive(snapshot, price, expected):
+    assert ids(snapshot.list_products(price=price, limit=100)) == expected
+
+
+@pytest.mark.parametrize("available, expected", [
+    (True, [1, 3, 4, 6]),
+    (False, [2, 5]),
+])
+def test_available_mask(snapshot, available, expected):
+    assert ids(snapshot.list_products(available=available, limit=100)) \
+        == expected
+
+
+def test_masks_are_combined(snapshot):
+    rows = snapshot.list_products(
+        category="camisetas", price=30.0, available=True, limit=100
+    )
+
+    assert ids(rows) == [1, 6]
+
+
+@pytest.mark.parametrize("filters, page, limit, expected", [
+    ({}, 1, 4, [1, 2, 3, 4]),
+    ({}, 2, 4, [5, 6]),
+    ({}, 3, 4, []),
+    ({"available": True}, 2, 2, [4, 6]),
+    ({"category": "camisetas"}, 2, 2, [6]),
+])
+def test_pagination(snapshot, filters, page, limit, expected):
+    rows = snapshot.list_products(page=page, limit=limit, **filters)
+
+    assert ids(rows) == expected
+
+
+@pytest.mark.parametrize("page, limit", [(0, 10), (1, -1)])
+def test_invalid_page_defers_to_database(snapshot, page, limit):
+    assert snapshot.list_products(page=page, limit=limit) is None
+
+
+def test_set_stock_publishes_new_columns(snapshot):
+    before = snapshot.columns
+    row = before.rows[1]
+
+    snapshot.set_stock(2, 5)
+
+    # Leitores com a referência anterior continuam vendo o estado anterior
+    assert snapshot.columns is not before
+    assert row.stock == 0
+    assert int(before.stock[1]) == 0
+    assert ids(snapshot.list_products(available=True, limit=100)) \
+        == [1, 2, 3, 4, 6]
+    assert snapshot.list_products(limit=100)[1].stock == 5
+
+
+def test_published_columns_are_read_only(snapshot):
+    with pytest.raises(ValueError):
+        snapshot.columns.stock[0] = 0
+
+    with pytest.raises(AttributeError):
+        snapshot.columns.rows[0].stock = 0
+
+
+def test_set_stock_of_unknown_product_is_ignored(snapshot):
+    before = snapshot.columns
+
+    snapshot.set_stock(99, 5)
+
+    assert snapshot.columns is before
+
+
+def test_refresh_updates_product(snapshot, db):
+    before = snapshot.columns
+    product = db.get(ProductModel, 3)
+    product.section = "Bones"
+    product.price_cents = 990
+    db.commit()
+
+    snapshot.refresh(3)
+
+    assert ids(before.rows) == sorted(PRODUCTS)
+    assert before.rows[2].section == "camisetas"
+    assert ids(snapshot.list_products(category="bones", limit=100)) == [3, 5]
+    assert ids(snapshot.list_products(price=9.90, limit=100)) == [3]
+
+
+def test_refresh_inserts_and_removes_products(snapshot, db):
+    db.add(ProductModel(
+        id=7, description="Produto 7", price_cents=500, barcode="7897",
+        section="Meias", stock=2
+    ))
+    db.get(ProductModel, 2).deleted_at = datetime.now()
+    db.commit()
+
+    snapshot.refresh(7)
+    snapshot.refresh(2)
+
+    assert ids(snapshot.list_products(limit=100)) == [1, 3, 4, 5, 6, 7]
+    assert ids(snapshot.list_products(category="meias", limit=100)) == [7]
+    assert ids(snapshot.list_products(category="calcas", limit=100)) == [4]
+
+
+def test_disconnect_unsyncs_snapshot(snapshot):
+    snapshot.on_disconnect()
+
+    assert snapshot.list_products() is None
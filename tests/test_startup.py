@@ -0,0 +1,63 @@
+# Imports do sistema
+import re
+import subprocess
+import sys
+
+# Imports locais
+from tests.benchmark.startup import IMPORT_BUDGET, ROOT_DIR
+
+# Linhas de "python -X importtime": self [us] | cumulative [us] | módulo
+IMPORT_TIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$")
+
+# Dependências carregadas apenas por create_app() e no primeiro uso
+DEFERRED_MODULES = ("fastapi", "sqlalchemy", "pydantic", "numpy")
+
+
+def import_times(code: str) -> dict:
+    """
+    Executa um código em um novo interpretador com "-X importtime".
+
+    Args:
+        code (str): Código passado para "python -c".
+    Returns:
+        dict: Tempo acumulado, em segundos, de cada módulo importado no
+        primeiro nível.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR, check=True, capture_output=True, text=True
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match:
+            cumulative, indent, module = match.groups()
+            times.setdefault(module, 0.0)
+            if not indent:
+                times[module] += int(cumulative) / 1_000_000
+    return times
+
+
+def test_import_main_within_budget():
+    times = import_times("import main")
+
+    assert "main" in times
+    assert times["main"] < IMPORT_BUDGET
+
+
+def test_import_main_defers_dependencies():
+    times = import_times("import main")
+
+    loaded = [
+        module for module in times
+        if module.split(".")[0] in DEFERRED_MODULES
+    ]
+    assert loaded == []
+
+
+def test_create_app_loads_dependencies():
+    times = import_times("import main; main.create_app()")
+
+    assert "fastapi" in times
+    assert "sqlalchemy" in times